@@ -0,0 +1,84 @@
+# Pre-aggregated video metrics for the dashboard
+# This code is used by dashboard.py
+
+import pandas as pd # required for the group-by aggregations
+
+"""
+Aggregates
+
+Builds an aggregate cube of the video data: one row per (category, keyword, year, month) with the number of
+videos and the sum and non-missing count of every metric. The cube is built once per dataset version and the
+dashboard pages query it with rollup() instead of grouping the raw video rows on every rerun.
+Sums and counts can be added up along any dimension, so means computed from the cube are exact.
+The keyword cube has one row per keyword and video in its cells, so a video found by several keywords of a
+category is counted several times when it is rolled up to the category. build_video_cube() builds the
+(category, year, month) cube from the normalized tables (video_tables.py) with every video once per category,
+for the totals and averages per category.
+"""
+
+CUBE_DIMENSIONS = ['category', 'keyword', 'year', 'month']  # Dimensions of the cube (month is 1-12)
+VIDEO_CUBE_DIMENSIONS = ['category', 'year', 'month']  # Dimensions of the cube of distinct videos
+CUBE_METRICS = ['view_count', 'like_count', 'comment_count', 'duration_seconds', 'engagement_rate']  # Aggregated columns
+
+def build_cube(df, dimensions=CUBE_DIMENSIONS):
+    """
+    Aggregates the video rows into the (category, keyword, year, month) cube (or a cube of fewer dimensions).
+    For every metric the cube holds its sum and, in '<metric>_count', the number of rows where it is not missing.
+    'video_count' is the number of rows in the cell.
+    """
+    metrics = [column for column in CUBE_METRICS if column in df.columns]
+    if 'year' in df.columns and 'month' in df.columns:
+        # Derived columns added at load time (video_schema.add_derived_columns)
+        year, month = df['year'], df['month'].dt.month.rename('month')
+    else:
+        year = df['published_date'].dt.year.rename('year')
+        month = df['published_date'].dt.month.rename('month')
+    keys = [df[dimension] for dimension in dimensions if dimension not in ('year', 'month')] + [year, month]
+    grouped = df[metrics].groupby(keys, observed=True)
+    cube = grouped.sum()
+    counts = grouped.count().add_suffix('_count')
+    cube = pd.concat([cube, counts], axis=1)
+    cube['video_count'] = grouped.size()
+    return cube.reset_index()
+
+def build_video_cube(tables):
+    """
+    Aggregates the distinct videos of every category (video_tables.VideoTables) into the (category, year, month) cube.
+    """
+    videos = tables.videos.set_index('video_key')
+    metrics = [column for column in CUBE_METRICS if column in videos.columns]
+    rows = tables.group_videos('category').join(videos[['published_date'] + metrics], on='video_key')
+    return build_cube(rows, VIDEO_CUBE_DIMENSIONS)
+
+def rollup(cube, by, aggregations):
+    """
+    Rolls the cube up to the dimensions in `by`, like df.groupby(by).agg(aggregations) on the raw rows.
+    aggregations maps a column to 'sum', 'mean', 'count', 'first' or a list of them.
+    'count' of a column that is not a cube metric (e.g. 'video_id') is the number of videos.
+    'first' is meant for dimensions that depend on the group, like the category of a keyword.
+    As with pandas, the result has (column, function) columns if any of the aggregations is a list.
+    """
+    grouped = cube.groupby(by, observed=True)
+    value_columns = [column for column in cube.columns if column not in CUBE_DIMENSIONS]
+    totals = grouped[value_columns].sum()
+
+    result = {}
+    multi_level = any(isinstance(funcs, list) for funcs in aggregations.values())
+    for column, funcs in aggregations.items():
+        for func in (funcs if isinstance(funcs, list) else [funcs]):
+            if func == 'sum':
+                values = totals[column]
+            elif func == 'count':
+                values = totals[f'{column}_count'] if column in CUBE_METRICS else totals['video_count']
+            elif func == 'mean':
+                values = totals[column] / totals[f'{column}_count']
+            elif func == 'first':
+                values = grouped[column].first()
+            else:
+                raise ValueError(f"Unsupported aggregation '{func}' for column '{column}'")
+            result[(column, func) if multi_level else column] = values
+
+    result = pd.DataFrame(result)
+    if multi_level:
+        result.columns = pd.MultiIndex.from_tuples(result.columns)
+    return result
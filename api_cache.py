@@ -0,0 +1,203 @@
+# On-disk cache of the YouTube Data API responses
+# This code is used by youtube_data_fetcher.py
+
+import os # required for the file and directory operations
+import json # required for storing the cached responses
+import time # required for the expiry of the cached responses
+import hashlib # required for the content-addressed file names
+import logging # required for logging messages
+import threading # required for sharing the cache between the worker threads
+from urllib.parse import urlsplit, parse_qsl, urlencode # required for normalizing the request URLs
+import httplib2 # required for building the responses served from the cache
+from googleapiclient.http import build_http # required for the default network transport of googleapiclient
+
+"""
+API Response Cache
+
+A persistent cache of the HTTP responses of the YouTube Data API, plugged into googleapiclient with
+build(..., http=CachingHttp(cache)). Every response is stored as one JSON file whose name is the SHA-256 of the
+request (method, URL without the API key and with sorted parameters, body), so identical API calls made by
+another run, or after a partial failure, are answered from disk without spending quota.
+- Responses expire after the TTL of their endpoint (CACHE_TTL), search results live longer than statistics.
+- Statistics-only requests (the refresh mode of the fetcher) are never cached: a refresh has to measure the
+  current counts. CachingHttp.response_time tells when a response was fetched from the API, so counts served
+  from the cache are dated with the time they were measured and not with the time they were read.
+- The cache is bounded to MAX_CACHE_BYTES: when it is full the least recently used responses are deleted.
+- In replay-only mode the network is never used: stale responses are still served and a miss raises
+  CacheMissError, which makes the cache a local stand-in for the API when working offline.
+"""
+
+CACHE_DIR = '.api_cache'  # Directory of the cached responses
+CACHE_TTL = {             # Seconds a response stays valid, per API endpoint (endpoints not listed are not cached)
+    'search': 7 * 24 * 3600,  # Search results change slowly
+    'videos': 24 * 3600       # Statistics change every day
+}
+UNCACHED_REQUESTS = [('videos', 'statistics')]  # (endpoint, part) of the requests that always go to the network
+MAX_CACHE_BYTES = 512 * 1024 * 1024  # Size bound of the cache directory (least recently used responses are evicted)
+
+class CacheMissError(Exception):
+    """
+    Raised in replay-only mode when a request is not in the cache.
+    """
+
+def endpoint(uri):
+    """
+    Returns the API endpoint of a request URL, e.g. 'search' for .../youtube/v3/search?q=...
+    """
+    return urlsplit(uri).path.rstrip('/').rsplit('/', 1)[-1]
+
+def cacheable(uri, ttl=CACHE_TTL):
+    """
+    Whether the response of a request is cached: its endpoint has a TTL and it is not one of UNCACHED_REQUESTS.
+    """
+    part = dict(parse_qsl(urlsplit(uri).query)).get('part')
+    return endpoint(uri) in ttl and (endpoint(uri), part) not in UNCACHED_REQUESTS
+
+def request_key(method, uri, body=None):
+    """
+    Content address of a request: the API key is dropped and the parameters are sorted,
+    so the same call made with another key or argument order maps to the same file.
+    """
+    parts = urlsplit(uri)
+    params = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True) if name != 'key')
+    normalized = f"{method.upper()} {parts.scheme}://{parts.netloc}{parts.path}?{urlencode(params)}"
+    digest = hashlib.sha256(normalized.encode('utf-8'))
+    if body:
+        digest.update(body if isinstance(body, bytes) else str(body).encode('utf-8'))
+    return digest.hexdigest()
+
+class ResponseCache:
+    """
+    The cache directory, shared by all threads (each thread talks to it through its own CachingHttp).
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, ttl=CACHE_TTL, max_bytes=MAX_CACHE_BYTES, replay_only=False):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.replay_only = replay_only
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        os.makedirs(cache_dir, exist_ok=True)
+        self.total_bytes = sum(os.path.getsize(path) for path in self.files())
+
+    def files(self):
+        """
+        Paths of all cached responses.
+        """
+        for directory, _, names in os.walk(self.cache_dir):
+            for name in names:
+                if name.endswith('.json'):
+                    yield os.path.join(directory, name)
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, method, uri, body=None):
+        """
+        Returns the cached (status, headers, content, stored_at) of a request, or None if it is missing or expired.
+        Expired responses are still returned in replay-only mode.
+        """
+        if not cacheable(uri, self.ttl):
+            return None
+        ttl = self.ttl.get(endpoint(uri))
+        path = self.path(request_key(method, uri, body))
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if not self.replay_only and (ttl is None or time.time() - entry['stored_at'] > ttl):
+                return None
+            os.utime(path)  # the modification time is the last use, for the LRU eviction
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+        return entry['status'], entry['headers'], entry['content'], entry['stored_at']
+
+    def put(self, method, uri, body, status, headers, content):
+        """
+        Stores a response (written to a temporary file and renamed into place) and evicts
+        the least recently used responses if the cache has grown beyond max_bytes.
+        """
+        if not cacheable(uri, self.ttl):
+            return
+        path = self.path(request_key(method, uri, body))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'stored_at': time.time(), 'status': status, 'headers': headers, 'content': content}, f)
+        with self.lock:
+            if os.path.exists(path):
+                self.total_bytes -= os.path.getsize(path)
+            os.replace(tmp_path, path)
+            self.total_bytes += os.path.getsize(path)
+            if self.total_bytes > self.max_bytes:
+                self.evict()
+
+    def evict(self):
+        """
+        Deletes the least recently used responses until the cache is at 90% of max_bytes (called with the lock held).
+        """
+        entries = sorted((os.path.getmtime(path), os.path.getsize(path), path) for path in self.files())
+        for _, size, path in entries:
+            if self.total_bytes <= 0.9 * self.max_bytes:
+                break
+            os.remove(path)
+            self.total_bytes -= size
+            self.stats['evictions'] += 1
+
+    def record(self, hit):
+        with self.lock:
+            self.stats['hits' if hit else 'misses'] += 1
+
+class CachingHttp:
+    """
+    httplib2.Http compatible transport that answers requests from a ResponseCache and
+    only sends the misses over the network (every request goes to the network if cache is None).
+    Like httplib2.Http it is not thread-safe: use one per thread.
+    from_cache tells whether the last response came from the cache (and therefore cost no quota),
+    response_time when it was fetched from the API (seconds since the epoch).
+    """
+
+    def __init__(self, cache, http=None, rate_limiter=None):
+        """
+        cache is the shared ResponseCache or None, http the transport for the misses (googleapiclient's default)
+        and rate_limiter an optional object whose acquire() is called before every network request.
+        """
+        self.cache = cache
+        self.http = http if http is not None else build_http()
+        self.rate_limiter = rate_limiter
+        self.from_cache = False
+        self.response_time = None
+
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs):
+        """
+        Same interface as httplib2.Http.request: returns (response, content).
+        """
+        cached = self.cache.get(method, uri, body) if self.cache is not None else None
+        if self.cache is not None:
+            self.cache.record(cached is not None)
+        if cached is not None:
+            status, response_headers, content, self.response_time = cached
+            self.from_cache = True
+            return httplib2.Response(dict(response_headers, status=str(status))), content.encode('utf-8')
+
+        if self.cache is not None and self.cache.replay_only:
+            raise CacheMissError(f"Request not in the API cache (replay-only mode): {endpoint(uri)}")
+
+        self.from_cache = False
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        response, content = self.http.request(uri, method=method, body=body, headers=headers, **kwargs)
+        self.response_time = time.time()
+        if self.cache is not None and response.status == 200:
+            try:
+                self.cache.put(method, uri, body, response.status,
+                               {'content-type': response.get('content-type', 'application/json')},
+                               content.decode('utf-8'))
+            except Exception as e:
+                # A response that cannot be cached is still returned
+                logging.warning(f"Could not cache API response: {str(e)}")
+        return response, content
+
+    def __getattr__(self, name):
+        # Everything else (timeout, credentials, ...) is delegated to the wrapped transport
+        return getattr(self.http, name)
@@ -0,0 +1,94 @@
+# Benchmark of the YouTube data fetcher against the offline mock API
+# This code is used to compare the serial and concurrent fetch modes of youtube_data_fetcher.py
+
+import os # required for the file and directory operations
+import time # required for measuring the run time
+import shutil # required for cleaning up the temporary directories
+import argparse # required for the command line options
+import tempfile # required for running every mode in an empty directory
+import logging # required for silencing the fetcher's logging during the runs
+import pandas as pd # required for the keyword list and the results table
+import youtube_data_fetcher # required for the fetcher being measured
+from mock_youtube import MockYouTubeApi # required for the offline API
+
+"""
+Fetcher Benchmark
+
+Runs YouTubeDataFetcher.process_keywords() once per worker count against mock_youtube.MockYouTubeApi,
+each time in a fresh temporary directory (so nothing is resumed from an earlier run), and reports
+keywords/sec, API calls, quota used and bytes written. The response cache is disabled so every API call
+goes to the mock API and pays its latency.
+
+Usage:
+    python benchmark_fetcher.py --workers 1 4 8 --latency 0.05 --error-rate 0.01
+"""
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))  # keywords.csv is read from here
+
+def directory_bytes(path):
+    """
+    Total size of the files below path.
+    """
+    return sum(os.path.getsize(os.path.join(directory, name)) for directory, _, names in os.walk(path) for name in names)
+
+def run_mode(workers, keywords_df, args):
+    """
+    Fetches all keywords with the given number of workers in a temporary directory and returns the measurements.
+    """
+    api = MockYouTubeApi(latency=args.latency, error_rate=args.error_rate, quota_error_rate=args.quota_error_rate,
+                         search_pages=args.search_pages, seed=args.seed)
+    work_dir = tempfile.mkdtemp(prefix='fetch_benchmark_')
+    previous_dir = os.getcwd()
+    fetcher = None
+    try:
+        os.chdir(work_dir)
+        keywords_df.to_csv('keywords.csv', index=False)
+        fetcher = youtube_data_fetcher.YouTubeDataFetcher(max_workers=workers, use_cache=False, transport=lambda: api)
+        start = time.perf_counter()
+        fetcher.process_keywords()
+        seconds = time.perf_counter() - start
+        processed = len(fetcher.catalog.processed_keywords())
+        return {
+            'workers': workers,
+            'keywords': processed,
+            'seconds': round(seconds, 2),
+            'keywords_per_sec': round(processed / seconds, 2) if seconds else None,
+            'api_calls': api.stats['requests'],
+            'api_errors': api.stats['errors'] + api.stats['quota_errors'],
+            'quota_used': fetcher.quota_used,
+            'bytes_written': directory_bytes(work_dir) - os.path.getsize('keywords.csv')
+        }
+    finally:
+        if fetcher is not None:
+            fetcher.catalog.close()
+        os.chdir(previous_dir)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the serial and concurrent fetch modes against a mock API")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8], help="worker counts to compare")
+    parser.add_argument('--keywords', type=int, default=None, help="only fetch the first N keywords of keywords.csv")
+    parser.add_argument('--latency', type=float, default=0.05, help="seconds every mock API request takes")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="share of requests failing with a 500 error")
+    parser.add_argument('--quota-error-rate', type=float, default=0.0, help="share of requests failing with quotaExceeded")
+    parser.add_argument('--search-pages', type=int, default=5, help="result pages the mock search returns")
+    parser.add_argument('--requests-per-second', type=float, default=20, help="rate limit of the fetcher")
+    parser.add_argument('--backoff-base', type=float, default=youtube_data_fetcher.BACKOFF_BASE_SECONDS,
+                        help="base delay in seconds of the retry backoff")
+    parser.add_argument('--quota', type=int, default=youtube_data_fetcher.DAILY_QUOTA_LIMIT, help="daily quota budget")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the synthetic data")
+    args = parser.parse_args()
+
+    keywords_df = pd.read_csv(os.path.join(PROJECT_DIR, 'keywords.csv'))
+    if args.keywords:
+        keywords_df = keywords_df.head(args.keywords)
+    youtube_data_fetcher.REQUESTS_PER_SECOND = args.requests_per_second
+    youtube_data_fetcher.DAILY_QUOTA_LIMIT = args.quota
+    youtube_data_fetcher.BACKOFF_BASE_SECONDS = args.backoff_base
+    logging.getLogger().setLevel(logging.WARNING)
+
+    results = pd.DataFrame([run_mode(workers, keywords_df, args) for workers in args.workers])
+    print(results.to_string(index=False))
+
+if __name__ == "__main__":
+    main()
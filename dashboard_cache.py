@@ -0,0 +1,91 @@
+# Cached computations for the dashboard
+# This code is used by dashboard.py and dashboard_compute.py
+
+import functools # required for keeping the name and signature of the cached functions
+import threading # required for updating the counters from several Streamlit sessions
+import time # required for measuring the compute time
+import pandas as pd # required for the statistics table
+import streamlit as st # required for st.cache_data and the debug sidebar
+
+"""
+Dashboard Cache
+
+The cached_computation decorator memoizes a pure dashboard computation with st.cache_data and counts its
+calls, cache misses and compute time, cached_resource does the same with st.cache_resource for shared objects.
+Cached functions take the data as arguments with a leading underscore (which Streamlit does not hash)
+plus the dataset version and the widget values, so the cache key is cheap to compute and changes exactly
+when the data or a widget changes.
+"""
+
+CACHE_STATS = {}  # Function name -> counters, shared by all sessions of the Streamlit process
+RESOURCE_VERSIONS = 2  # Shared objects kept per cached_resource function (the current and the previous dataset version)
+STATS_LOCK = threading.Lock()
+
+def with_statistics(func, cache_decorator, **options):
+    """
+    Caches func with the given Streamlit cache decorator (and its options) and records its cache statistics
+    in CACHE_STATS. A call that reaches the function body is a miss, every other call is a hit.
+    """
+    stats = CACHE_STATS.setdefault(func.__name__, {'calls': 0, 'misses': 0, 'compute_seconds': 0.0})
+
+    @functools.wraps(func)
+    def compute(*args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        with STATS_LOCK:
+            stats['misses'] += 1
+            stats['compute_seconds'] += time.perf_counter() - start
+        return result
+
+    cached = cache_decorator(show_spinner=False, **options)(compute)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with STATS_LOCK:
+            stats['calls'] += 1
+        return cached(*args, **kwargs)
+
+    wrapper.clear = cached.clear
+    return wrapper
+
+def cached_computation(func):
+    """
+    Decorator that caches a computation with st.cache_data (every caller gets its own copy of the result).
+    """
+    return with_statistics(func, st.cache_data)
+
+def cached_resource(func):
+    """
+    Decorator that caches an object with st.cache_resource (all sessions share the same object).
+    Meant for read-only objects like the shared dataset and search indexes that would be expensive to copy
+    on every call. Only the objects of the last RESOURCE_VERSIONS dataset versions are kept.
+    """
+    return with_statistics(func, st.cache_resource, max_entries=RESOURCE_VERSIONS)
+
+def cache_statistics():
+    """
+    Returns the cache statistics of all cached computations as a DataFrame.
+    """
+    with STATS_LOCK:
+        rows = [
+            {
+                'function': name,
+                'calls': stats['calls'],
+                'hits': stats['calls'] - stats['misses'],
+                'misses': stats['misses'],
+                'compute_ms': round(stats['compute_seconds'] * 1000, 1)
+            }
+            for name, stats in CACHE_STATS.items()
+            if stats['calls']
+        ]
+    return pd.DataFrame(rows, columns=['function', 'calls', 'hits', 'misses', 'compute_ms'])
+
+def show_debug_sidebar(version, shared_bytes=None):
+    """
+    Shows the dataset version, the size of the shared dataset and the cache statistics in a collapsed sidebar section.
+    """
+    with st.sidebar.expander("🐞 Debug: cache statistics"):
+        st.caption(f"Dataset version: {version}")
+        if shared_bytes is not None:
+            st.caption(f"Shared dataset: {shared_bytes / 1e6:.1f} MB (one copy for all sessions)")
+        st.dataframe(cache_statistics(), use_container_width=True)
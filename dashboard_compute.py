@@ -0,0 +1,269 @@
+# Computations behind the dashboard pages
+# This code is used by dashboard.py
+
+from aggregates import rollup # required for querying the aggregate cube
+from dashboard_cache import cached_computation # required for caching the results per dataset version
+from snapshot_store import keyword_velocity # required for the measured growth of the keywords
+
+"""
+Dashboard Computations
+
+Pure functions that compute the tables shown on the dashboard pages. Every function takes the data
+(_cube, _df, _tables or _index, not hashed), the dataset version and the widget values it depends on, and is cached
+with cached_computation, so a widget click only recomputes what depends on that widget.
+"""
+
+# Overview Page
+
+@cached_computation
+def category_metrics(_cube, version):
+    """
+    Total views, likes and comments per category (from the cube of distinct videos, every video counted once).
+    """
+    return rollup(_cube, ['category'], {
+        'view_count': 'sum',
+        'like_count': 'sum',
+        'comment_count': 'sum'
+    }).reset_index()
+
+@cached_computation
+def keywords_by_category(_cube, version):
+    """
+    Sorted list of keywords for every category.
+    """
+    return {
+        category: sorted(_cube.loc[_cube['category'] == category, 'keyword'].unique().tolist())
+        for category in sorted(_cube['category'].unique().tolist())
+    }
+
+# Trend Analysis Page
+
+@cached_computation
+def yearly_category_timeline(_cube, version):
+    """
+    Number of videos, total views and average engagement per year and category (from the cube of distinct videos).
+    """
+    return rollup(_cube, ['year', 'category'], {
+        'video_id': 'count',
+        'view_count': 'sum',
+        'engagement_rate': 'mean'
+    }).reset_index()
+
+@cached_computation
+def metric_trends(_cube, version, metric):
+    """
+    Yearly and monthly average of the selected metric per category (from the cube of distinct videos).
+    Months are labelled 'YYYY-MM'.
+    """
+    yearly_trends = rollup(_cube, ['year', 'category'], {
+        metric: 'mean'
+    }).reset_index()
+
+    monthly_trends = rollup(_cube, ['year', 'month', 'category'], {
+        metric: 'mean'
+    }).reset_index()
+    monthly_trends['month'] = (monthly_trends['year'].astype(str) + '-' +
+                               monthly_trends['month'].astype(str).str.zfill(2))
+    return yearly_trends, monthly_trends
+
+# Category Analysis Page
+
+@cached_computation
+def category_summary(_cube, version, category):
+    """
+    Number of videos, average views and average engagement of one category (from the cube of distinct videos).
+    """
+    return rollup(_cube[_cube['category'] == category], ['category'], {
+        'video_id': 'count',
+        'view_count': 'mean',
+        'engagement_rate': 'mean'
+    }).iloc[0]
+
+@cached_computation
+def top_category_keywords(_cube, version, category):
+    """
+    Top 10 keywords of one category by total views, with their average engagement.
+    """
+    return rollup(_cube[_cube['category'] == category], ['keyword'], {
+        'view_count': 'sum',
+        'engagement_rate': 'mean'
+    }).sort_values('view_count', ascending=False).head(10)
+
+@cached_computation
+def category_engagement_rates(_tables, version, category):
+    """
+    Engagement rates of the distinct videos of one category (input of the engagement histogram),
+    so a video found by several keywords of the category is counted once.
+    """
+    pairs = _tables.group_videos('category')
+    video_keys = pairs.loc[pairs['category'] == category, 'video_key']
+    return _tables.videos.set_index('video_key')['engagement_rate'].reindex(video_keys).reset_index(drop=True)
+
+# Keyword Analysis Page
+
+@cached_computation
+def top_keywords_by_views(_cube, version):
+    """
+    Top 10 keywords by total views.
+    """
+    return rollup(_cube, ['keyword'], {
+        'view_count': 'sum',
+        'category': 'first'
+    }).nlargest(10, 'view_count').reset_index()
+
+@cached_computation
+def top_keywords_by_engagement(_cube, version):
+    """
+    Top 10 keywords by average engagement rate, with their total views.
+    """
+    return rollup(_cube, ['keyword'], {
+        'engagement_rate': 'mean',
+        'category': 'first',
+        'view_count': 'sum'
+    }).nlargest(10, 'engagement_rate').reset_index()
+
+@cached_computation
+def top_keywords_by_growth(_cube, version):
+    """
+    Top 10 keywords by average year-over-year growth of the views of the videos published in each year.
+    """
+    yearly_growth = rollup(_cube, ['keyword', 'year'], {
+        'view_count': 'sum',
+        'category': 'first'
+    }).reset_index()
+
+    # Calculate year-over-year growth
+    growth_rate = yearly_growth.pivot(
+        index='keyword',
+        columns='year',
+        values='view_count'
+    ).pct_change(axis=1).mean(axis=1)
+
+    top_growth = growth_rate.nlargest(10).reset_index()
+    top_growth['growth_rate'] = top_growth[0] * 100
+    return top_growth
+
+@cached_computation
+def top_keywords_by_velocity(_df, version, snapshot_version):
+    """
+    Top 10 keywords by views gained per day, measured between the statistics snapshots of their videos.
+    Empty if no video has been refreshed yet (fewer than two snapshots).
+    """
+    velocity = keyword_velocity(_df[['keyword', 'category', 'video_id']])
+    return velocity.nlargest(10, 'views_per_day').reset_index()
+
+@cached_computation
+def search_videos(_index, version, search_keyword, search_category, min_views, min_engagement,
+                  start_date, end_date, search_titles=False):
+    """
+    Videos matching the filters of the Advanced Keyword Analysis panel, looked up in the search index.
+    """
+    return _index.search(
+        text=search_keyword,
+        category=None if search_category == "All Categories" else search_category,
+        min_views=min_views,
+        min_engagement=min_engagement,
+        start_date=start_date,
+        end_date=end_date,
+        search_titles=search_titles
+    )
+
+@cached_computation
+def video_details(_tables, version):
+    """
+    One row per video (indexed by video_id) with its metrics, the category of the first keyword that found it
+    and the number of keywords that found it, from the normalized tables.
+    """
+    links = _tables.links.join(_tables.keywords.set_index('keyword_key')['category'], on='keyword_key')
+    videos = _tables.videos.set_index('video_key')
+    videos = videos[['video_id', 'published_date', 'view_count', 'like_count', 'engagement_rate']].copy()
+    videos['category'] = links.drop_duplicates(subset=['video_key']).set_index('video_key')['category']
+    videos['keywords'] = links['video_key'].value_counts()
+    videos['video_id'] = videos['video_id'].astype(str)
+    return videos.set_index('video_id')[['category', 'published_date', 'view_count', 'like_count', 'engagement_rate', 'keywords']]
+
+@cached_computation
+def title_search_results(_index, _tables, version, query, k=20):
+    """
+    The k best matching videos for a title search, ranked by BM25 score, with their metrics.
+    """
+    hits = _index.search(query, k)
+    return hits.join(video_details(_tables, version), on='video_id')
+
+@cached_computation
+def semantic_neighbours(_index, _tables, version, query, k=20):
+    """
+    The k videos whose titles are semantically closest to the query, with their metrics.
+    """
+    hits = _index.similar_videos(query, k)
+    return hits.join(video_details(_tables, version), on='video_id')
+
+@cached_computation
+def semantic_gaps(_index, _tables, version, threshold):
+    """
+    Coverage of every keyword by semantically close videos (see SemanticIndex.keyword_gaps), least covered first.
+    """
+    keywords = _tables.keywords[['keyword', 'category']].astype(str)
+    gaps = _index.keyword_gaps(keywords['keyword'], threshold=threshold)
+    return gaps.merge(keywords, on='keyword', how='left')
+
+# Opportunity Analysis Page
+
+@cached_computation
+def opportunity_metrics(_cube, version):
+    """
+    Demand and supply metrics per keyword with the normalized opportunity and demand scores (0-10).
+    """
+    metrics = rollup(_cube, ['category', 'keyword'], {
+        'view_count': ['sum', 'count', 'mean'],
+        'engagement_rate': 'mean',
+        'like_count': 'sum',
+        'comment_count': 'sum'
+    }).reset_index()
+
+    # Flatten column names
+    metrics.columns = ['category', 'keyword', 'total_views', 'video_count', 'avg_views', 'avg_engagement', 'total_likes', 'total_comments']
+
+    # Calculate normalized metrics
+    metrics['normalized_views'] = (metrics['total_views'] - metrics['total_views'].min()) / (metrics['total_views'].max() - metrics['total_views'].min())
+    metrics['normalized_engagement'] = (metrics['avg_engagement'] - metrics['avg_engagement'].min()) / (metrics['avg_engagement'].max() - metrics['avg_engagement'].min())
+
+    # Calculate opportunity and demand scores
+    metrics['opportunity_score'] = (
+        (0.5 * metrics['normalized_views']) +
+        (0.5 * (metrics['avg_engagement'] / metrics['avg_engagement'].max()))
+    ) * 10
+
+    metrics['demand_score'] = (
+        (0.5 * metrics['normalized_views']) +
+        (0.5 * (metrics['avg_engagement'] / metrics['avg_engagement'].max()))
+    ) * 10
+    return metrics
+
+@cached_computation
+def category_opportunity(_metrics, _video_cube, version):
+    """
+    Mean, maximum and minimum opportunity score per category (over its keywords), with the total views and number
+    of videos per category from the cube of distinct videos (a video found by several keywords is counted once).
+    """
+    scores = _metrics.groupby('category', observed=True).agg({
+        'opportunity_score': ['mean', 'max', 'min']
+    })
+    totals = rollup(_video_cube, ['category'], {
+        'view_count': 'sum',
+        'video_id': 'count'
+    })
+    scores[('total_views', 'sum')] = totals['view_count'].reindex(scores.index)
+    scores[('video_count', 'sum')] = totals['video_id'].reindex(scores.index)
+    return scores.round(2)
+
+@cached_computation
+def top_opportunities(_metrics, version, selected_category, sort_column):
+    """
+    Top 10 keywords of the selected category (or all categories) by the selected column.
+    """
+    if selected_category != "All Categories":
+        display_metrics = _metrics[_metrics['category'] == selected_category]
+    else:
+        display_metrics = _metrics
+    return display_metrics.nlargest(10, sort_column)
@@ -0,0 +1,77 @@
+# Data and indexes of the dashboard, loaded on demand by the pages that need them
+# This code is used by dashboard.py and the modules in dashboard_pages/
+
+from shared_dataset import SharedDataset # required for the shared, read-only dataset
+from aggregates import build_cube, build_video_cube # required for the pre-aggregated rollups
+from video_tables import load_video_tables # required for the normalized tables
+from dashboard_cache import cached_resource # required for sharing the data across sessions
+
+"""
+Dashboard Data
+
+The loaders of everything the pages read. Each is cached with st.cache_resource per dataset version,
+so a loader runs once per process and only when the first page that needs its data is opened.
+DATA_LOADERS maps the names a page declares in DATA to their loaders.
+The search indexes are imported inside their loaders, so their modules (and the embedding model)
+are only imported when the Keyword Analysis page is opened.
+"""
+
+DATASET = "videos_with_relevance"
+
+@cached_resource
+def load_dataset(version):
+    # Typed Parquet copy (falls back to the CSV file), published_date is already a timestamp
+    # version only serves as cache key, a rewritten data file gets a new version
+    # Derived columns (year, month, weekday, hour, duration_bucket) are added here once.
+    # One read-only, Arrow-backed copy is shared by all sessions (see shared_dataset.py),
+    # the pages only read it and never add columns to it
+    return SharedDataset(DATASET)
+
+def load_data(version):
+    # The shared frame of the dataset, without a per-session copy
+    return load_dataset(version).frame
+
+@cached_resource
+def load_cube(version):
+    # (category, keyword, year, month) rollups, built once per dataset version
+    return build_cube(load_data(version))
+
+@cached_resource
+def load_tables(version):
+    # Normalized videos, keywords and links tables (video_tables.py), every video stored once
+    # Read-only: tables older than the dataset are built in memory, the pipeline rewrites the stored ones
+    return load_video_tables(DATASET)
+
+@cached_resource
+def load_video_cube(version):
+    # (category, year, month) rollups of the distinct videos, for totals that count every video once
+    return build_video_cube(load_tables(version))
+
+@cached_resource
+def load_search_index(version):
+    # Keyword/title n-gram index and sorted date/metric indexes for the search panel, shared by all sessions
+    from search_index import VideoSearchIndex
+    return VideoSearchIndex(load_data(version))
+
+@cached_resource
+def load_title_index(version):
+    # Persisted BM25 title index, read-only: videos the pipeline has not indexed yet are indexed in memory
+    from title_search import TitleSearchIndex
+    index = TitleSearchIndex()
+    index.extend(load_data(version))
+    return index
+
+@cached_resource
+def load_semantic_index(version):
+    # Persisted nearest-neighbour index over the title embeddings, read-only: the pipeline adds the new videos
+    from semantic_index import SemanticIndex
+    return SemanticIndex()
+
+# Data a page can declare in DATA -> its loader
+DATA_LOADERS = {
+    'df': load_data,
+    'dataset': load_dataset,
+    'cube': load_cube,
+    'video_cube': load_video_cube,
+    'tables': load_tables,
+}
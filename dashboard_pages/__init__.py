@@ -0,0 +1,24 @@
+# Pages of the dashboard, one module per page
+# This code is used by dashboard.py
+
+"""
+Dashboard Pages
+
+dashboard.py imports only the module of the selected page. Every page module declares
+- DATA: the names of the data it needs, out of dashboard_data.DATA_LOADERS
+  ('df', 'dataset', 'cube', 'video_cube', 'tables')
+- render(version, **data): draws the page with the dataset version and the loaded data
+so the libraries, the data and the indexes of the other pages are not imported or loaded for it.
+"""
+
+# Label in the navigation -> module of the page, in the order of the navigation
+PAGES = {
+    "Explanation": "explanation",
+    "Overview": "overview",
+    "Trend Analysis": "trend_analysis",
+    "Category Analysis": "category_analysis",
+    "Keyword Analysis": "keyword_analysis",
+    "Opportunity Analysis": "opportunity_analysis",
+    "Update Analysis": "update_analysis",
+    "Code References": "code_references",
+}
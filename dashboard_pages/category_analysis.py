@@ -0,0 +1,61 @@
+# Category Analysis page of the dashboard
+# This code is used by dashboard.py
+
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+from dashboard_pages.theme import COLOR_SCHEMES
+from dashboard_compute import category_summary, top_category_keywords, category_engagement_rates
+
+"""
+Category Analysis
+
+Summary, top keywords and engagement distribution of a selected category.
+"""
+
+DATA = ['tables', 'cube', 'video_cube']  # Data loaded by dashboard.py and passed to render()
+
+def render(version, tables, cube, video_cube):
+    """
+    Renders the Category Analysis page.
+    """
+    st.title("🎯 Category Analysis")
+    
+    selected_category = st.selectbox("Select Category", sorted(tables.keywords['category'].unique().tolist()))
+    cat_summary = category_summary(video_cube, version, selected_category)
+    
+    # Enhanced metrics display
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Videos", int(cat_summary['video_id']))
+    with col2:
+        st.metric("Average Views", f"{cat_summary['view_count']:,.0f}")
+    with col3:
+        st.metric("Average Engagement", f"{cat_summary['engagement_rate']:.2f}%")
+    
+    # Enhanced visualizations
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        top_keywords = top_category_keywords(cube, version, selected_category)
+        
+        fig_keywords = px.bar(top_keywords, y=top_keywords.index, x='view_count',
+                            title=f"Top 10 Keywords in {selected_category}",
+                            color='engagement_rate',
+                            color_continuous_scale=COLOR_SCHEMES['gradient_colors'],
+                            orientation='h')
+        st.plotly_chart(fig_keywords, use_container_width=True)
+    
+    with col2:
+        fig_engagement = go.Figure()
+        fig_engagement.add_trace(go.Histogram(
+            x=category_engagement_rates(tables, version, selected_category),
+            nbinsx=30,
+            marker_color=COLOR_SCHEMES['category_colors'][selected_category]
+        ))
+        fig_engagement.update_layout(
+            title=f"Engagement Distribution in {selected_category}",
+            xaxis_title="Engagement Rate",
+            yaxis_title="Count"
+        )
+        st.plotly_chart(fig_engagement, use_container_width=True)
@@ -0,0 +1,101 @@
+# Charts with a bounded number of points, shared by the pages of the dashboard
+# This code is used by dashboard_pages/keyword_analysis.py and dashboard_pages/opportunity_analysis.py
+
+import numpy as np # required for the downsampling
+import pandas as pd # required for the downsampled frames
+import plotly.express as px # required for the line charts
+import plotly.graph_objects as go # required for the box plots with precomputed statistics
+
+"""
+Charts
+
+Plotly sends every point of a figure to the browser, so a chart of all videos grows with the dataset.
+The charts here are downsampled on the server before the figure is built:
+- line charts keep at most MAX_LINE_POINTS points, chosen with Largest-Triangle-Three-Buckets (LTTB),
+  which keeps the peaks and the shape of the series
+- box plots get their quartiles and fences computed from all values, and only at most MAX_BOX_POINTS
+  evenly spaced order statistics per box (always including the minimum and the maximum) are drawn as points
+Line charts with more than WEBGL_THRESHOLD points are drawn with WebGL instead of SVG; the points of a box are
+never more than MAX_BOX_POINTS and stay SVG.
+Small series are drawn unchanged.
+"""
+
+MAX_LINE_POINTS = 2000  # Points of a line chart sent to the browser at most
+MAX_BOX_POINTS = 500  # Points drawn next to one box at most
+WEBGL_THRESHOLD = 1000  # Line charts with more points than this are drawn with WebGL
+
+def lttb(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets: positions of n_out points of a series sorted by x that keep its visual shape.
+    The first and the last point are always kept; from every bucket in between the point that forms the largest
+    triangle with the point kept from the previous bucket and the mean of the next bucket is kept.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)  # n_out - 2 buckets between the first and last point
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        next_start, next_stop = stop, edges[bucket + 2] if bucket + 2 < len(edges) else n
+        next_x, next_y = x[next_start:next_stop].mean(), y[next_start:next_stop].mean()
+        areas = np.abs((x[previous] - next_x) * (y[start:stop] - y[previous]) -
+                       (x[previous] - x[start:stop]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(areas))
+        kept[bucket + 1] = previous
+    return kept
+
+def spread_sample(values, n_out):
+    """
+    Positions of n_out values that are evenly spaced in the sorted order (including the minimum and maximum),
+    so the sample has the same distribution as all values.
+    """
+    values = np.asarray(values)
+    if n_out >= len(values):
+        return np.arange(len(values))
+    order = np.argsort(values, kind='stable')
+    return order[np.unique(np.linspace(0, len(values) - 1, n_out).round().astype(np.int64))]
+
+def downsampled_line(df, x, y, max_points=MAX_LINE_POINTS, **kwargs):
+    """
+    px.line of a series with at most max_points points (LTTB over the rows sorted by x).
+    Keyword arguments are passed on to px.line.
+    """
+    df = df.sort_values(x, kind='stable').reset_index(drop=True)
+    x_values = df[x].astype('int64') if pd.api.types.is_datetime64_any_dtype(df[x]) else df[x]
+    df = df.iloc[lttb(x_values, df[y], max_points)]
+    render_mode = 'webgl' if len(df) > WEBGL_THRESHOLD else 'svg'
+    return px.line(df, x=x, y=y, render_mode=render_mode, **kwargs)
+
+def downsampled_box(df, x, y, color_map=None, title=None, labels=None, max_points=MAX_BOX_POINTS):
+    """
+    Box plot of y per value of x with all points drawn, as px.box(points="all") draws it, for small groups.
+    Larger groups get a box with precomputed statistics and a spread sample of at most max_points points.
+    labels maps column names to axis titles, like the labels argument of plotly express.
+    """
+    labels = labels or {}
+    fig = go.Figure()
+    for group, values in df.groupby(x, observed=True, sort=True)[y]:
+        values = values.dropna().to_numpy(dtype=np.float64)
+        color = (color_map or {}).get(group)
+        if len(values) <= max_points:
+            fig.add_trace(go.Box(y=values, name=str(group), marker_color=color, boxpoints='all'))
+            continue
+        q1, median, q3 = np.percentile(values, [25, 50, 75])
+        iqr = q3 - q1
+        fig.add_trace(go.Box(
+            x=[str(group)], q1=[q1], median=[median], q3=[q3], mean=[values.mean()],
+            lowerfence=[values[values >= q1 - 1.5 * iqr].min()], upperfence=[values[values <= q3 + 1.5 * iqr].max()],
+            name=str(group), marker_color=color, boxpoints=False
+        ))
+        sample = values[spread_sample(values, max_points)]
+        fig.add_trace(go.Scatter(
+            x=[str(group)] * len(sample), y=sample, mode='markers', name=str(group),
+            marker=dict(color=color, size=3, opacity=0.5), showlegend=False
+        ))
+    fig.update_layout(title=title, xaxis_title=labels.get(x, x), yaxis_title=labels.get(y, y))
+    return fig
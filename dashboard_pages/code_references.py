@@ -0,0 +1,106 @@
+# Code References page of the dashboard
+# This code is used by dashboard.py
+
+import streamlit as st
+
+"""
+Code References
+
+The libraries, articles and resources the project is built on. Needs no data.
+"""
+
+DATA = []  # Data loaded by dashboard.py and passed to render()
+
+def render(version):
+    """
+    Renders the Code References page.
+    """
+    st.title("📚 Code References & Inspiration")
+    
+    st.markdown("""
+    This dashboard's code was inspired by and adapted from various sources. We believe in giving credit 
+    where it's due and encouraging learning from the community.
+    """)
+    
+    # Opportunity Analysis Matrix
+    with st.expander("🎯 Opportunity Analysis Matrix", expanded=True):
+        st.markdown("""
+        ### Matrix Visualization and Analysis
+        - [Plotly Quadrant Chart Tutorial](https://plotly.com/python/v3/ipython-notebooks/scoreboard-heatmaps/)
+        - [Streamlit Plotly Guide](https://docs.streamlit.io/library/api-reference/charts/st.plotly_chart)
+        - [YT MetricsAnalysis](https://keywordseverywhere.com/)
+        - [Opportunity Score](https://medium.com/uxr-microsoft/what-is-the-opportunity-score-and-how-to-calculate-it-part-ii-59bbadbdd2ad/)
+                    
+        """)
+    
+    # Data Processing & Metrics
+    with st.expander("📊 Data Processing & Metrics", expanded=True):
+        st.markdown("""
+        ### API and Data Handling
+        - [YouTube Data API Documentation](https://developers.google.com/youtube/v3/docs)
+        - [Pandas Pivot Table Guide](https://pandas.pydata.org/docs/reference/api/pandas.pivot_table.html)
+        - [Storyly: Engagement Rate Calculation](https://www.storyly.io/post/how-to-calculate-engagement-rate)
+        
+        These resources were crucial in developing our data collection and processing pipeline, 
+        especially in handling YouTube API data efficiently.
+        """)
+    
+    # Dashboard Design
+    with st.expander("🎨 Dashboard Design", expanded=True):
+        st.markdown("""
+        ### UI/UX Framework
+        - [Streamlit Documentation](https://docs.streamlit.io/)
+        - [Streamlit Components Gallery](https://streamlit.io/components)
+        - [Streamlit Layout Guide](https://docs.streamlit.io/library/api-reference/layout)
+        
+        The dashboard's user interface was built using Streamlit, with inspiration from these official 
+        resources and community examples.
+        """)
+    
+    # Visualization Techniques
+    with st.expander("📈 Visualization Techniques", expanded=True):
+        st.markdown("""
+        ### Interactive Visualizations
+        - [Plotly Express Documentation](https://plotly.com/python/plotly-express/)
+        - [Plotly Graph Objects](https://plotly.com/python/graph-objects/)
+        - [Streamlit Metrics Guide](https://docs.streamlit.io/library/api-reference/data/st.metric)
+        
+        Our interactive charts and visualizations were created using Plotly, following best practices 
+        from these documentation sources.
+        """)
+    
+    # Style & UI/UX
+    with st.expander("🎭 Style & UI/UX", expanded=True):
+        st.markdown("""
+        ### Visual Design
+        - [Streamlit Custom Themes](https://docs.streamlit.io/library/advanced-features/theming)
+        - [Streamlit CSS Guide](https://docs.streamlit.io/library/api-reference/style)
+        - [Material Design Color System](https://material.io/design/color/the-color-system.html)
+        
+        The dashboard's visual style was influenced by Material Design principles and implemented using 
+        Streamlit's theming capabilities.
+        """)
+    
+    # Additional Resources
+    with st.expander("📚 Additional Resources", expanded=True):
+        st.markdown("""
+        ### API and Data Management
+        - [Real Python: API Integration](https://realpython.com/api-integration-in-python/)
+        - [Python Code: YouTube API Tutorial](https://thepythoncode.com/article/using-youtube-api-in-python)
+        - [Peer DH: API Request Quotas](https://peerdh.com/blogs/programming-insights/managing-api-request-quotas-in-python)
+        
+        These additional resources provided valuable insights into API integration and data management 
+        best practices.
+        """)
+    
+    # Acknowledgment Note
+    st.markdown("""
+    ---
+    ### 🙏 Acknowledgments
+    
+    We extend our gratitude to all the creators and maintainers of these resources. Their work has been 
+    instrumental in building this dashboard and making complex data analysis more accessible.
+    
+    If you're interested in learning more about any specific aspect of this project, we encourage you to 
+    explore these references.
+    """)
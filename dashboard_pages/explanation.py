@@ -0,0 +1,410 @@
+# Explanation page of the dashboard
+# This code is used by dashboard.py
+
+import streamlit as st
+
+"""
+Explanation
+
+The project explanation: problem statement, setup, methodology, findings and team. Needs no data.
+"""
+
+DATA = []  # Data loaded by dashboard.py and passed to render()
+
+def render(version):
+    """
+    Renders the Explanation page.
+    """
+    st.title("🌱 Plant Breeding YouTube Content Analysis Project")
+    
+    # Project Overview
+    st.markdown("""
+    This project analyzes **8,971 videos** with **2.1 billion views** for **198 keywords** 
+    in **3 categories** of plant breeding concepts (Old, Current, Modern) on YouTube.
+    """)
+    
+    # Problem Statement
+    st.header("🎯 Problem Statement")
+    with st.expander("Why did we start this project?", expanded=True):
+        st.markdown("""
+        - We want to start a YouTube channel focusing on plant breeding concepts
+        - Existing SEO tools focus only on basic keyword metrics
+        - Need for comprehensive analysis of audience interaction across different concept categories
+        - YouTube's potential as an educational platform for plant breeding concepts
+        """)
+    
+    # Project Setup
+    st.header("⚙️ Project Setup")
+    with st.expander("How to set up and run the project"):
+        st.markdown("""
+        ### 1. Clone the repository:
+        ```bash
+        git clone git@github.com:nfornadimkhan/data_analysis_youtube.git
+        cd data_analysis_youtube
+        ```
+
+        ### 2. Install required packages
+        ```bash
+        pip install -r requirements.txt
+        ```   
+
+        ### 3. Run the Application
+        ```bash
+        streamlit run dashboard.py
+        ```
+        """)
+
+    # API Configuration
+    with st.expander("API Configuration"):
+        st.markdown("""
+        Get a YouTube Data API key from the [Google Cloud Console](https://console.cloud.google.com/)
+        
+        Set up environment variables:
+        1. Copy `.env.example` to `.env`:
+           ```bash
+           cp .env.example .env
+           ```
+        2. Edit `.env` and add your YouTube API key:
+           ```
+           YOUTUBE_API_KEY=your_actual_api_key_here
+           ```
+        """)
+
+    # Project Structure
+    st.header("📁 Project Structure")
+    st.code("""
+    project_directory/
+    ├── README.md
+    ├── requirements.txt
+    ├── analysis.ipynb
+    ├── .env.example
+    ├── .env # (git-ignored)
+    ├── .gitignore
+    ├── youtube_data_fetcher.py
+    ├── dashboard.py
+    ├── pre-commit
+    ├── youtube_data/
+    ├── fetch_state.json
+    """)
+
+    # Libraries Used
+    st.header("📚 Libraries Used")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("""
+        - **pandas:** Data manipulation and analysis
+        - **numpy:** Numerical operations
+        - **matplotlib:** Static visualizations
+        - **seaborn:** Statistical visualizations
+        - **plotly:** Interactive web visualizations
+        - **nltk:** Natural language processing
+        """)
+    with col2:
+        st.markdown("""
+        - **sentence-transformers:** BERT encodings
+        - **scikit-learn:** Machine learning tools
+        - **google-api-python-client:** YouTube API
+        - **python-dotenv:** Environment variables
+        - **isodate:** Date/time parsing
+        - **streamlit:** Web application
+        """)
+
+    # Keyword Classification
+    st.header("🔑 Keyword Classification")
+    
+    tab1, tab2, tab3 = st.tabs(["Old (Traditional)", "Current (Established)", "Modern (Cutting-Edge)"])
+    
+    with tab1:
+        st.markdown("""
+        **Focus:** Pre-20th century practices
+        - Phenotype-based selection
+        - Indigenous approaches
+        - Field observation methods
+        - Community-based breeding
+        
+        **Example Keywords:**
+        1. Traditional selective breeding
+        2. Landrace selection
+        3. Phenotypic selection
+        4. Pedigree breeding
+        5. Mass selection
+        """)
+    
+    with tab2:
+        st.markdown("""
+        **Focus:** Late 20th century methods
+        - Molecular biology integration
+        - Marker-assisted selection
+        - QTL mapping
+        - Heterosis exploitation
+        
+        **Example Keywords:**
+        1. Marker-assisted selection
+        2. QTL mapping
+        3. Hybrid vigor breeding
+        4. Backcross breeding
+        5. Recurrent selection
+        """)
+    
+    with tab3:
+        st.markdown("""
+        **Focus:** Emerging technologies
+        - CRISPR and gene editing
+        - AI/ML applications
+        - Computational breeding
+        - Precision agriculture
+        
+        **Example Keywords:**
+        1. CRISPR gene editing
+        2. Genome sequencing
+        3. Precision breeding
+        4. Synthetic biology
+        5. Gene network analysis
+        """)
+
+    # Methodology
+    st.header("🔍 Methodology")
+    
+    # Data Collection
+    with st.expander("1️⃣ Data Collection", expanded=True):
+        st.markdown("""
+        - Collected data using YouTube Data API v3
+        - 198 keywords (66 in each category)
+        - 50 videos per keyword
+        - Total of 8,971 relevant videos analyzed
+        
+        #### API Quota Management
+        - Search request: 100 units
+        - Video details: 50 units
+        - Total per keyword: 150 units
+        - Daily quota: 10,000 units
+        - Max keywords per day: 66
+        - Days needed: 3
+        """)
+    
+    # Data Cleaning
+    with st.expander("2️⃣ Data Cleaning & Preprocessing", expanded=True):
+        st.markdown("""
+        - Removed duplicate entries
+        - Standardized date formats
+        - Converted metrics to numeric format
+        - Created engagement rate metric
+        - Removed irrelevant content
+        - Added human-readable duration format
+        - Created engagement rate metric: [(likes + comments) / views] * 100
+        """)
+    
+    # Relevance Scoring
+    with st.expander("3️⃣ Content Relevance Analysis", expanded=True):
+        st.markdown("""
+        #### Relevance Scoring Components:
+        1. **Base Relevance (60%)**
+           - Direct Keyword Match (30%)
+           - Word Overlap (40%)
+           - Sequence Similarity (30%)
+        
+        2. **Semantic Similarity (40%)**
+           - Using SBERT for semantic analysis
+        
+        #### Score Categories:
+        - High: ≥ 40
+        - Medium: 20-40
+        - Low: 10-20
+        - Not Relevant: < 10
+        """)
+
+    # Key Findings
+    st.header("🎯 Key Findings")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### Top Performing Keywords")
+        st.markdown("""
+        1. Propagation Techniques
+           - Opportunity Score: 10.0/10
+           - 330M+ views
+        
+        2. Quantum Computing
+           - Opportunity Score: 5.3/10
+           - High engagement rate
+        """)
+    
+    with col2:
+        st.markdown("#### Best Publishing Times")
+        st.markdown("""
+        1. Saturday 22:00
+           - 6.86% engagement rate
+           - Low competition
+        
+        2. Sunday 18:00
+           - 6.71% engagement rate
+           - Moderate competition
+        """)
+
+    # Results and Recommendations
+    st.header("📊 Results and Recommendations")
+    
+    st.markdown("""
+    Based on our comprehensive analysis of YouTube content related to plant breeding, 
+    we have identified several key insights and recommendations:
+    """)
+    
+    # Overall Findings
+    with st.expander("Overall Findings", expanded=True):
+        st.markdown("""
+        1. **Growth Trend**
+           - Constant increase in plant breeding related videos on YouTube
+           - Rising engagement rates over the years
+           - Ideal timing for starting a plant breeding focused channel
+        
+        2. **Content Impact**
+           - Keywords like "Propagation Techniques" show exceptional performance
+           - Over 330 million total views for top-performing content
+           - High engagement rates indicating strong audience interest
+        
+        3. **Audience Preferences**
+           - Strong interest in practical, actionable content
+           - Growing demand for modern technological applications
+           - Balance between traditional methods and cutting-edge innovations
+        """)
+    
+    # High-Potential Keywords Analysis
+    with st.expander("High-Potential Keywords Analysis", expanded=True):
+        st.markdown("""
+        | **Keyword** | **Opportunity Score** | **Demand Score** | **Total Views** | **Engagement Per Video** | **Why It's Important** |
+        |-------------|----------------------|------------------|-----------------|------------------------|----------------------|
+        | Propagation Techniques | 10.0/10 | 6.7/10 | 330M+ | 136,589 | Highly searched and engages users effectively |
+        | Quantum Computing | 5.3/10 | 4.8/10 | 131M+ | 91,443 | Modern topic attracting tech-savvy professionals |
+        | Indigenous Methods | 5.2/10 | 4.3/10 | 169M+ | 73,288 | Appeals to sustainable practice enthusiasts |
+        | Historical Practices | 4.8/10 | 4.0/10 | 163M+ | 63,351 | Niche audience interested in agricultural evolution |
+        | CRISPR Gene Editing | 1.5/10 | 3.7/10 | 35M+ | 27,352 | Cutting-edge topic with global relevance |
+        """)
+    
+    # Publishing Strategy
+    with st.expander("Optimal Publishing Strategy", expanded=True):
+        st.markdown("""
+        #### Best Publishing Times
+        | **Day** | **Time** | **Engagement Rate** | **Competing Videos** | **Average Views** | **Why This Time Works** |
+        |---------|----------|---------------------|---------------------|-------------------|------------------------|
+        | Saturday | 22:00 | 6.86% | 10 | - | High engagement, lowest competition |
+        | Sunday | 18:00 | 6.71% | 24 | - | Peak weekend engagement |
+        | Saturday | 06:00 | 5.58% | 31 | 764,234 | Strong early morning performance |
+        | Sunday | 14:00 | 4.18% | - | 3,192,022 | Highest average views |
+        
+        #### Key Timing Insights
+        - Weekend publishing shows consistently higher engagement
+        - Early morning and evening slots perform best
+        - Lower competition during certain time slots provides opportunities
+        - Balance between engagement rate and view potential
+        """)
+    
+    # Engagement Analysis
+    with st.expander("Detailed Engagement Analysis", expanded=True):
+        st.markdown("""
+        #### Category-wise Performance
+
+        **Old Category:**
+        - Median Views: 909.50
+        - Mean Views: 476,292.65
+        - Median Likes: 15
+        - Mean Likes: 9,181.28
+        - Average Engagement Rate: 1.84%
+        - Notable: Highest viral potential with some videos reaching 117M views
+
+        **Modern Category:**
+        - Median Views: 487.50
+        - Mean Views: 200,511.95
+        - Median Likes: 7
+        - Average Engagement Rate: 1.73%
+        - Notable: Strong performance in niche technical topics
+
+        **Current Category:**
+        - Median Views: 791.00
+        - Mean Views: 72,754.74
+        - Median Likes: 12
+        - Mean Likes: 957.30
+        - Average Engagement Rate: 1.81%
+        - Notable: Steady performance with consistent engagement
+        """)
+    
+    # Content Strategy Recommendations
+    with st.expander("Content Strategy Recommendations", expanded=True):
+        st.markdown("""
+        #### 1. Content Focus
+        - Start with practical, hands-on content like propagation techniques
+        - Balance traditional methods with modern applications
+        - Create content series that bridge old and new concepts
+        
+        #### 2. Topic Selection Strategy
+        - **High-Impact Traditional Topics:**
+          - Propagation techniques
+          - Indigenous breeding methods
+          - Historical agronomic practices
+        
+        - **Promising Modern Topics:**
+          - Quantum computing applications
+          - CRISPR gene editing
+          - Precision agriculture
+        
+        #### 3. Engagement Optimization
+        - Focus on weekend publishing
+        - Utilize optimal time slots (Saturday 22:00, Sunday 18:00)
+        - Create content that encourages discussion and interaction
+        
+        #### 4. Growth Strategy
+        - Start with established topics to build audience
+        - Gradually introduce modern concepts
+        - Maintain consistent publishing schedule
+        - Focus on educational value and practical applications
+        """)
+    
+    # Future Opportunities
+    with st.expander("Future Opportunities", expanded=True):
+        st.markdown("""
+        #### Emerging Trends
+        1. **Technology Integration**
+           - AI/ML applications in breeding
+           - Digital phenotyping
+           - Automated breeding systems
+        
+        2. **Sustainable Practices**
+           - Climate-resilient breeding
+           - Eco-genomics
+           - Urban crop development
+        
+        3. **Educational Content**
+           - Interactive tutorials
+           - Virtual demonstrations
+           - Case studies and success stories
+        
+        #### Growth Areas
+        - **Untapped Niches:** Several modern breeding techniques show high demand but low content supply
+        - **Cross-Category Content:** Combining traditional wisdom with modern technology
+        - **Practical Applications:** Focus on real-world implementation and results
+        """)
+
+    # Team & Acknowledgements
+    st.header("👥 Team & Acknowledgements")
+    
+    st.markdown("""
+    **Project Team:**
+    - Nadim Khan
+    - Samaneh Javidian
+    
+    **Special Thanks:**
+    - Jun. Prof. Christian Krupitzer
+    - Maryam Lotfaliani
+    
+    *Part of Practical Introduction to Programming with Python (1511-501) - Winter term 2024/25*
+    
+    University of Hohenheim, Stuttgart, Germany
+    """)
+    
+    # License
+    st.markdown("---")
+    st.markdown("""
+    [![License: MIT](https://img.shields.io/badge/License-MIT-yellow.svg)](https://opensource.org/licenses/MIT)
+    
+    © 2024 Nadim Khan and Samaneh Javidian
+    """)
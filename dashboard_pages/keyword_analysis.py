@@ -0,0 +1,360 @@
+# Keyword Analysis page of the dashboard
+# This code is used by dashboard.py
+
+import streamlit as st
+import plotly.express as px
+from snapshot_store import snapshot_version
+from semantic_index import GAP_SIMILARITY
+from dashboard_pages.theme import COLOR_SCHEMES
+from dashboard_pages.charts import downsampled_line
+from dashboard_data import load_search_index, load_title_index, load_semantic_index
+from dashboard_compute import (
+    top_keywords_by_views, top_keywords_by_engagement, top_keywords_by_growth, top_keywords_by_velocity,
+    search_videos, title_search_results, semantic_neighbours, semantic_gaps
+)
+
+"""
+Keyword Analysis
+
+Top keywords, the advanced keyword search, the title search and the semantic search with the content gaps.
+"""
+
+DATA = ['df', 'cube', 'tables']  # Data loaded by dashboard.py and passed to render()
+
+def render(version, df, cube, tables):
+    """
+    Renders the Keyword Analysis page.
+    """
+    st.title("🔍 Keyword Analysis & Insights")
+    
+    # Top-level Insights
+    st.header("📊 Key Insights")
+    
+    # Create three columns for key metrics
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric(
+            "Most Viewed Category",
+            "Old",
+            "476,292 avg views",
+            help="Category with highest average views per video"
+        )
+    with col2:
+        st.metric(
+            "Highest Engagement",
+            "Traditional Methods",
+            "+1.84%",
+            help="Category with best engagement rate"
+        )
+    with col3:
+        st.metric(
+            "Best Time to Publish",
+            "Weekend Evenings",
+            "+6.86% engagement",
+            help="Optimal publishing time for maximum engagement"
+        )
+    
+    # Top Keywords Overview
+    st.subheader("🏆 Top Performing Keywords")
+    
+    tab1, tab2, tab3 = st.tabs(["By Views", "By Engagement", "By Growth Potential"])
+    
+    with tab1:
+        # Top keywords by views
+        top_by_views = top_keywords_by_views(cube, version)
+        
+        fig_views = px.bar(
+            top_by_views,
+            x='keyword',
+            y='view_count',
+            color='category',
+            color_discrete_map=COLOR_SCHEMES['category_colors'],
+            title="Top 10 Keywords by Total Views",
+            labels={'view_count': 'Total Views', 'keyword': 'Keyword'}
+        )
+        fig_views.update_layout(xaxis_tickangle=-45)
+        st.plotly_chart(fig_views, use_container_width=True)
+    
+    with tab2:
+        # Top keywords by engagement
+        top_by_engagement = top_keywords_by_engagement(cube, version)
+        
+        fig_engagement = px.scatter(
+            top_by_engagement,
+            x='view_count',
+            y='engagement_rate',
+            color='category',
+            size='view_count',
+            text='keyword',
+            color_discrete_map=COLOR_SCHEMES['category_colors'],
+            title="Top 10 Keywords by Engagement Rate",
+            labels={
+                'view_count': 'Total Views',
+                'engagement_rate': 'Engagement Rate (%)',
+                'keyword': 'Keyword'
+            }
+        )
+        fig_engagement.update_traces(textposition='top center')
+        st.plotly_chart(fig_engagement, use_container_width=True)
+    
+    with tab3:
+        # Keywords that gained the most views per day between the statistics snapshots
+        top_velocity = top_keywords_by_velocity(df, version, snapshot_version())
+        
+        if not top_velocity.empty:
+            fig_growth = px.bar(
+                top_velocity,
+                x='keyword',
+                y='views_per_day',
+                color='category',
+                color_discrete_map=COLOR_SCHEMES['category_colors'],
+                hover_data=['growth_rate', 'videos_tracked'],
+                title="Top 10 Keywords by Views Gained per Day",
+                labels={
+                    'views_per_day': 'Views Gained per Day',
+                    'growth_rate': 'Growth (%)',
+                    'videos_tracked': 'Videos Tracked',
+                    'keyword': 'Keyword'
+                }
+            )
+            fig_growth.update_layout(xaxis_tickangle=-45)
+            st.plotly_chart(fig_growth, use_container_width=True)
+            st.caption("Measured between the statistics snapshots of the videos (python youtube_data_fetcher.py --refresh).")
+        else:
+            # No refreshed statistics yet: growth estimated from the videos published in each year
+            top_growth = top_keywords_by_growth(cube, version)
+            
+            fig_growth = px.bar(
+                top_growth,
+                x='keyword',
+                y='growth_rate',
+                title="Top 10 Keywords by Growth Rate",
+                labels={
+                    'growth_rate': 'Average YoY Growth Rate (%)',
+                    'keyword': 'Keyword'
+                }
+            )
+            fig_growth.update_layout(xaxis_tickangle=-45)
+            st.plotly_chart(fig_growth, use_container_width=True)
+            st.caption("Estimated from the views of the videos published in each year. "
+                       "Run python youtube_data_fetcher.py --refresh to measure the real growth.")
+    
+    # Advanced Keyword Search and Analysis
+    st.header("🔎 Advanced Keyword Analysis")
+    
+    # Search Interface
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        search_keyword = st.text_input(
+            "Search for a keyword",
+            placeholder="Enter a keyword (e.g., 'CRISPR', 'breeding', etc.)"
+        )
+    
+    with col2:
+        search_category = st.selectbox(
+            "Filter by category",
+            ["All Categories"] + sorted(df['category'].unique().tolist())
+        )
+    
+    # Additional filters in expandable section
+    with st.expander("Advanced Filters"):
+        search_titles = st.checkbox("Also search in video titles", value=False)
+        col1, col2 = st.columns(2)
+        with col1:
+            min_views = st.number_input(
+                "Minimum Views",
+                min_value=0,
+                value=0
+            )
+            min_engagement = st.number_input(
+                "Minimum Engagement Rate (%)",
+                min_value=0.0,
+                value=0.0
+            )
+        with col2:
+            date_range = st.date_input(
+                "Date Range",
+                value=(df['published_date'].min(), df['published_date'].max())
+            )
+    
+    # Apply filters
+    if search_keyword or search_category != "All Categories":
+        filtered_df = search_videos(load_search_index(version), version, search_keyword, search_category,
+                                    min_views, min_engagement, date_range[0], date_range[-1], search_titles)
+        
+        if not filtered_df.empty:
+            # Keyword Performance Metrics
+            st.subheader("📈 Keyword Performance Metrics")
+            
+            metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
+            
+            with metric_col1:
+                st.metric(
+                    "Total Videos",
+                    len(filtered_df),
+                    help="Number of videos found"
+                )
+            
+            with metric_col2:
+                st.metric(
+                    "Total Views",
+                    f"{filtered_df['view_count'].sum():,.0f}",
+                    help="Total views across all videos"
+                )
+            
+            with metric_col3:
+                st.metric(
+                    "Avg. Engagement Rate",
+                    f"{filtered_df['engagement_rate'].mean():.2f}%",
+                    help="Average engagement rate"
+                )
+            
+            with metric_col4:
+                st.metric(
+                    "Avg. Video Duration",
+                    f"{filtered_df['duration_seconds'].mean()/60:.1f} min",
+                    help="Average video length"
+                )
+            
+            # Temporal Analysis
+            st.subheader("📅 Temporal Analysis")
+            
+            # Views over time
+            # One point per publication time, downsampled so the chart stays small for any number of videos
+            fig_timeline = downsampled_line(
+                filtered_df.groupby('published_date')['view_count'].sum().reset_index(),
+                x='published_date',
+                y='view_count',
+                title="Views Distribution Over Time",
+                labels={
+                    'published_date': 'Publication Date',
+                    'view_count': 'Total Views'
+                }
+            )
+            st.plotly_chart(fig_timeline, use_container_width=True)
+            
+            # Detailed Results
+            st.subheader("📋 Detailed Results")
+            
+            # Show detailed table with main metrics
+            results_df = filtered_df[[
+                'keyword', 'category', 'published_date', 'view_count',
+                'like_count', 'comment_count', 'engagement_rate'
+            ]].sort_values('view_count', ascending=False)
+            
+            st.dataframe(
+                results_df.style.format({
+                    'view_count': '{:,.0f}',
+                    'like_count': '{:,.0f}',
+                    'comment_count': '{:,.0f}',
+                    'engagement_rate': '{:.2f}%'
+                }),
+                use_container_width=True
+            )
+        else:
+            st.markdown("""
+            <div style='background-color: #4ECDC4; color: white; padding: 1rem; border-radius: 10px; border: 2px solid #45B7D1; text-align: center;'>
+                🔍 Enter a keyword or select a category to see detailed analysis
+            </div>
+            """, unsafe_allow_html=True)
+    else:
+        st.markdown("""
+        <div style='background-color: #4ECDC4; color: white; padding: 1rem; border-radius: 10px; border: 2px solid #45B7D1; text-align: center;'>
+            🔍 Enter a keyword or select a category to see detailed analysis
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Full-text search over the video titles
+    st.header("📰 Video Title Search")
+    
+    title_query = st.text_input(
+        "Search video titles",
+        placeholder="Enter words from a video title (e.g., 'marker assisted selection')"
+    )
+    
+    if title_query:
+        title_results = title_search_results(load_title_index(version), tables, version, title_query)
+        
+        if not title_results.empty:
+            st.dataframe(
+                title_results.style.format({
+                    'score': '{:.2f}',
+                    'view_count': '{:,.0f}',
+                    'like_count': '{:,.0f}',
+                    'engagement_rate': '{:.2f}%'
+                }),
+                use_container_width=True
+            )
+        else:
+            st.info("No video titles match this search.")
+    
+    # Semantic search and content gaps over the title embeddings
+    st.header("🧭 Semantic Search & Content Gaps")
+    
+    try:
+        semantic_index = load_semantic_index(version)
+    except ImportError:
+        semantic_index = None
+        st.info("Semantic search needs the sentence-transformers package (pip install -r requirements.txt).")
+    except OSError as e:
+        semantic_index = None
+        st.info(f"Semantic search is not available, the semantic index could not be read: {str(e)}")
+    if semantic_index is not None and not len(semantic_index):
+        semantic_index = None
+        st.info("The semantic index is not built yet, it is built by the pipeline (python pipeline.py).")
+    
+    if semantic_index is not None:
+        semantic_query = st.text_input(
+            "Find videos semantically close to a keyword or topic",
+            placeholder="Enter a keyword or topic (e.g., 'drought tolerance in wheat')"
+        )
+        
+        if semantic_query:
+            try:
+                neighbours = semantic_neighbours(semantic_index, tables, version, semantic_query)
+                st.dataframe(
+                    neighbours.style.format({
+                        'similarity': '{:.1f}',
+                        'view_count': '{:,.0f}',
+                        'like_count': '{:,.0f}',
+                        'engagement_rate': '{:.2f}%'
+                    }),
+                    use_container_width=True
+                )
+            except ImportError:
+                st.info("Only the fetched keywords can be searched without the sentence-transformers package.")
+        
+        threshold = st.slider(
+            "Similarity a video needs to cover a keyword",
+            min_value=30.0, max_value=80.0, value=GAP_SIMILARITY, step=5.0
+        )
+        gaps = semantic_gaps(semantic_index, tables, version, threshold)
+        
+        fig = px.scatter(
+            gaps,
+            x='best_similarity',
+            y='close_videos',
+            color='category',
+            hover_name='keyword',
+            title='Keyword Coverage by Semantically Close Videos',
+            labels={
+                'best_similarity': 'Similarity of the Closest Video',
+                'close_videos': 'Close Videos (of the 20 nearest)',
+                'category': 'Category'
+            },
+            color_discrete_map=COLOR_SCHEMES['category_colors']
+        )
+        fig.add_vline(x=threshold, line_dash='dash', line_color='gray')
+        st.plotly_chart(fig, use_container_width=True)
+        
+        content_gaps = gaps[gaps['gap']]
+        if not content_gaps.empty:
+            st.markdown(f"**{len(content_gaps)} keywords have no video above the similarity threshold (content gaps):**")
+            st.dataframe(
+                content_gaps[['keyword', 'category', 'best_similarity']].style.format({'best_similarity': '{:.1f}'}),
+                use_container_width=True
+            )
+        else:
+            st.success("Every keyword has at least one semantically close video.")
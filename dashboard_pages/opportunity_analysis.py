@@ -0,0 +1,228 @@
+# Opportunity Analysis page of the dashboard
+# This code is used by dashboard.py
+
+import streamlit as st
+import plotly.express as px
+from dashboard_pages.theme import COLOR_SCHEMES
+from dashboard_pages.charts import downsampled_box
+from dashboard_compute import opportunity_metrics, category_opportunity, top_opportunities
+
+"""
+Opportunity Analysis
+
+Opportunity and demand scores of the keywords and the categories, with the top content opportunities.
+"""
+
+DATA = ['cube', 'video_cube']  # Data loaded by dashboard.py and passed to render()
+
+def render(version, cube, video_cube):
+    """
+    Renders the Opportunity Analysis page.
+    """
+    st.title("🎯 Content Opportunity Analysis")
+    
+    st.markdown("""
+    This analysis combines demand and supply metrics to identify the most promising content opportunities 
+    in plant breeding education on YouTube.
+    """)
+    
+    # Calculate opportunity and demand metrics
+    metrics = opportunity_metrics(cube, version)
+    
+    # 1. Overall Opportunity Landscape
+    st.header("📊 Opportunity Landscape")
+    
+    # Create opportunity vs demand matrix
+    fig_matrix = px.scatter(
+        metrics,
+        x='opportunity_score',
+        y='demand_score',
+        size='total_views',
+        color='category',
+        hover_data={
+            'keyword': True,
+            'total_views': ':,.0f',
+            'avg_engagement': ':.2f%',
+            'video_count': True
+        },
+        color_discrete_map=COLOR_SCHEMES['category_colors'],
+        title="Content Opportunity vs Demand Matrix",
+        labels={
+            'opportunity_score': 'Opportunity Score (0-10)',
+            'demand_score': 'Demand Score (0-10)',
+            'total_views': 'Total Views'
+        }
+    )
+    
+    # Add quadrant lines
+    fig_matrix.add_hline(y=metrics['demand_score'].median(), line_dash="dash", line_color="gray", opacity=0.5)
+    fig_matrix.add_vline(x=metrics['opportunity_score'].median(), line_dash="dash", line_color="gray", opacity=0.5)
+    
+    # Add quadrant labels
+    fig_matrix.add_annotation(x=8, y=8, text="High Opportunity, High Demand", showarrow=False, font=dict(size=10))
+    fig_matrix.add_annotation(x=8, y=2, text="High Opportunity, Low Demand", showarrow=False, font=dict(size=10))
+    fig_matrix.add_annotation(x=2, y=8, text="Low Opportunity, High Demand", showarrow=False, font=dict(size=10))
+    fig_matrix.add_annotation(x=2, y=2, text="Low Opportunity, Low Demand", showarrow=False, font=dict(size=10))
+    
+    fig_matrix.update_layout(
+        height=600,
+        xaxis_title="Opportunity Score (Higher = More Potential)",
+        yaxis_title="Demand Score (Higher = More Interest)",
+        showlegend=True
+    )
+    st.plotly_chart(fig_matrix, use_container_width=True)
+    
+    # Add explanation
+    st.markdown("""
+    **Matrix Quadrants Explanation:**
+    - **Top Right:** High opportunity keywords with strong demand - prime targets for content creation
+    - **Top Left:** High demand but lower opportunity - consider ways to differentiate content
+    - **Bottom Right:** High opportunity but lower demand - potential for early mover advantage
+    - **Bottom Left:** Lower priority keywords for content creation
+    """)
+
+    # 2. Category-wise Analysis
+    st.header("📈 Category Performance")
+    
+    # Create tabs for different views
+    tab1, tab2 = st.tabs(["Opportunity Scores", "Demand Analysis"])
+    
+    with tab1:
+        # Category-wise opportunity scores
+        cat_opportunity = category_opportunity(metrics, video_cube, version)
+        
+        for category in cat_opportunity.index:
+            with st.expander(f"📊 {category} Category Analysis"):
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.metric(
+                        "Average Opportunity Score",
+                        f"{cat_opportunity.loc[category, ('opportunity_score', 'mean')]:.1f}/10",
+                        help="Average opportunity score for this category"
+                    )
+                    st.metric(
+                        "Total Views",
+                        f"{cat_opportunity.loc[category, ('total_views', 'sum')]:,.0f}",
+                        help="Total views in this category"
+                    )
+                
+                with col2:
+                    st.metric(
+                        "Score Range",
+                        f"{cat_opportunity.loc[category, ('opportunity_score', 'min')]:.1f} - {cat_opportunity.loc[category, ('opportunity_score', 'max')]:.1f}",
+                        help="Range of opportunity scores in this category"
+                    )
+                    st.metric(
+                        "Total Videos",
+                        f"{cat_opportunity.loc[category, ('video_count', 'sum')]:,.0f}",
+                        help="Number of videos in this category"
+                    )
+    
+    with tab2:
+        # Demand score distribution
+        # Every keyword is a point; large categories get precomputed boxes and a sample of the points
+        fig_demand = downsampled_box(
+            metrics,
+            x='category',
+            y='demand_score',
+            color_map=COLOR_SCHEMES['category_colors'],
+            title="Demand Score Distribution by Category",
+            labels={
+                'category': 'Category',
+                'demand_score': 'Demand Score'
+            }
+        )
+        st.plotly_chart(fig_demand, use_container_width=True)
+    
+    # 3. Top Opportunities
+    st.header("🎯 Top Content Opportunities")
+    
+    # Filter options
+    col1, col2 = st.columns(2)
+    with col1:
+        selected_category = st.selectbox(
+            "Select Category",
+            ["All Categories"] + sorted(metrics['category'].unique().tolist())
+        )
+    with col2:
+        sort_by = st.selectbox(
+            "Sort By",
+            ["Opportunity Score", "Demand Score", "Total Views", "Engagement Rate"]
+        )
+    
+    # Filter and sort data
+    sort_columns = {
+        "Opportunity Score": "opportunity_score",
+        "Demand Score": "demand_score",
+        "Total Views": "total_views",
+        "Engagement Rate": "avg_engagement"
+    }
+    
+    display_metrics = top_opportunities(metrics, version, selected_category, sort_columns[sort_by])
+    
+    # Display top opportunities
+    for idx, row in display_metrics.iterrows():
+        with st.expander(f"🎯 {row['keyword']} ({row['category']})"):
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric(
+                    "Opportunity Score",
+                    f"{row['opportunity_score']:.1f}/10",
+                    help="Combined score of demand and engagement"
+                )
+            with col2:
+                st.metric(
+                    "Demand Score",
+                    f"{row['demand_score']:.1f}/10",
+                    help="Measure of audience interest"
+                )
+            with col3:
+                st.metric(
+                    "Engagement Rate",
+                    f"{row['avg_engagement']:.2f}%",
+                    help="Average engagement rate"
+                )
+            
+            st.markdown(f"""
+            **Performance Metrics:**
+            - Total Views: {row['total_views']:,.0f}
+            - Total Videos: {row['video_count']}
+            - Average Views per Video: {row['avg_views']:,.0f}
+            - Total Likes: {row['total_likes']:,.0f}
+            - Total Comments: {row['total_comments']:,.0f}
+            """)
+    
+    # 4. Strategic Recommendations
+    st.header("💡 Strategic Recommendations")
+    
+    recommendations = {
+        "High Opportunity Keywords": {
+            "description": "Keywords with high demand but relatively low competition",
+            "metrics": metrics[metrics['opportunity_score'] > metrics['opportunity_score'].quantile(0.75)]
+        },
+        "Emerging Topics": {
+            "description": "Topics showing strong growth potential",
+            "metrics": metrics[metrics['demand_score'] > metrics['demand_score'].quantile(0.75)]
+        },
+        "Underserved Categories": {
+            "description": "Categories with high demand but limited content",
+            "metrics": metrics[metrics['video_count'] < metrics['video_count'].quantile(0.25)]
+        }
+    }
+    
+    for rec_type, data in recommendations.items():
+        with st.expander(f"📌 {rec_type}"):
+            st.write(data["description"])
+            st.dataframe(
+                data["metrics"][['keyword', 'category', 'opportunity_score', 'demand_score', 'total_views', 'avg_engagement']]
+                .sort_values('opportunity_score', ascending=False)
+                .head(5)
+                .style.format({
+                    'opportunity_score': '{:.1f}',
+                    'demand_score': '{:.1f}',
+                    'total_views': '{:,.0f}',
+                    'avg_engagement': '{:.2f}%'
+                })
+            )
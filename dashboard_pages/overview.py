@@ -0,0 +1,57 @@
+# Overview page of the dashboard
+# This code is used by dashboard.py
+
+import streamlit as st
+from dashboard_compute import category_metrics, keywords_by_category
+
+"""
+Overview
+
+Total views, likes and comments of every category (every video counted once) and the keywords of every category.
+"""
+
+DATA = ['cube', 'video_cube']  # Data loaded by dashboard.py and passed to render()
+
+def render(version, cube, video_cube):
+    """
+    Renders the Overview page.
+    """
+    st.title("🎯 Overview")
+    
+    # Category-wise metrics
+    st.subheader("📊 Category Performance")
+    cat_metrics = category_metrics(video_cube, version)
+    
+    # Display metrics in columns
+    cols = st.columns(3)
+    for idx, category in enumerate(cat_metrics['category']):
+        with cols[idx]:
+            st.markdown(f"### {category}")
+            metrics = cat_metrics[cat_metrics['category'] == category].iloc[0]
+            st.metric("👀 Views", f"{metrics['view_count']:,.0f}")
+            st.metric("👍 Likes", f"{metrics['like_count']:,.0f}")
+            st.metric("💬 Comments", f"{metrics['comment_count']:,.0f}")
+    
+    # Keywords by category
+    st.subheader("📝 Keywords by Category")
+    
+    # Sorted keywords of every category, the categories become the tabs
+    category_keywords = keywords_by_category(cube, version)
+    categories = list(category_keywords)
+    
+    # Create tabs for each category
+    if len(categories) > 0:
+        tabs = st.tabs(categories)
+        
+        for tab, category in zip(tabs, categories):
+            with tab:
+                # Get unique keywords for this category
+                keywords = category_keywords[category]
+                
+                # Create a formatted list of keywords
+                st.write(f"**Total Keywords:** {len(keywords)}")
+                
+                # Display keywords in a grid
+                cols = st.columns(3)
+                for idx, keyword in enumerate(keywords):
+                    cols[idx % 3].write(f"- {keyword}")
@@ -0,0 +1,15 @@
+# Colors shared by the pages of the dashboard
+# This code is used by the modules in dashboard_pages/
+
+import plotly.express as px # required for the Plotly color scales
+
+# Custom color schemes
+COLOR_SCHEMES = {
+    'category_colors': {
+        'Modern': '#FF6B6B',  # Coral Red
+        'Current': '#4ECDC4', # Turquoise
+        'Old': '#45B7D1'      # Sky Blue
+    },
+    'gradient_colors': px.colors.sequential.Viridis,
+    'diverging_colors': px.colors.diverging.RdYlBu,
+}
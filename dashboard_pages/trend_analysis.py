@@ -0,0 +1,110 @@
+# Trend Analysis page of the dashboard
+# This code is used by dashboard.py
+
+import streamlit as st
+import plotly.express as px
+from dashboard_pages.theme import COLOR_SCHEMES
+from dashboard_compute import yearly_category_timeline, metric_trends
+
+"""
+Trend Analysis
+
+Publication timeline of the videos per category and the yearly and monthly trends of a selected metric.
+"""
+
+DATA = ['video_cube']  # Data loaded by dashboard.py and passed to render()
+
+def render(version, video_cube):
+    """
+    Renders the Trend Analysis page.
+    """
+    st.title("📊 Trend Analysis")
+    
+    # Timeline Analysis (2008-2023)
+    st.subheader("📈 Content Evolution (2008-2023)")
+    
+    # Prepare timeline data
+    yearly_category_data = yearly_category_timeline(video_cube, version)
+    
+    # Create timeline visualizations
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Video count stack plot
+        fig_videos = px.area(yearly_category_data, 
+                           x='year', 
+                           y='video_id',
+                           color='category',
+                           color_discrete_map=COLOR_SCHEMES['category_colors'],
+                           title="Video Publication Timeline",
+                           labels={'video_id': 'Number of Videos', 
+                                 'year': 'Year',
+                                 'category': 'Category'})
+        fig_videos.update_layout(
+            xaxis_range=[2008, 2023],
+            hovermode='x unified'
+        )
+        st.plotly_chart(fig_videos, use_container_width=True)
+    
+    with col2:
+        # Views stack plot
+        fig_views = px.area(yearly_category_data, 
+                          x='year', 
+                          y='view_count',
+                          color='category',
+                          color_discrete_map=COLOR_SCHEMES['category_colors'],
+                          title="Cumulative Views Timeline",
+                          labels={'view_count': 'Total Views', 
+                                'year': 'Year',
+                                'category': 'Category'})
+        fig_views.update_layout(
+            xaxis_range=[2008, 2023],
+            hovermode='x unified'
+        )
+        st.plotly_chart(fig_views, use_container_width=True)
+    
+    # Engagement trend
+    fig_engagement = px.line(yearly_category_data,
+                           x='year',
+                           y='engagement_rate',
+                           color='category',
+                           color_discrete_map=COLOR_SCHEMES['category_colors'],
+                           title="Engagement Rate Trends",
+                           labels={'engagement_rate': 'Engagement Rate (%)',
+                                 'year': 'Year',
+                                 'category': 'Category'})
+    fig_engagement.update_layout(
+        xaxis_range=[2008, 2023],
+        hovermode='x unified'
+    )
+    st.plotly_chart(fig_engagement, use_container_width=True)
+
+
+    
+    # Metric selector with custom styling
+    metric = st.selectbox(
+        "📈 Select Metric",
+        ["view_count", "engagement_rate", "like_count", "comment_count"],
+        format_func=lambda x: x.replace('_', ' ').title()
+    )
+    
+    # Yearly and monthly trends
+    yearly_trends, monthly_trends = metric_trends(video_cube, version, metric)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig_yearly = px.line(yearly_trends, x='year', y=metric,
+                           color='category',
+                           color_discrete_map=COLOR_SCHEMES['category_colors'],
+                           title=f"Yearly {metric.replace('_', ' ').title()} Trends")
+        fig_yearly.update_layout(hovermode='x unified')
+        st.plotly_chart(fig_yearly, use_container_width=True)
+    
+    with col2:
+        fig_monthly = px.area(monthly_trends, x='month', y=metric,
+                            color='category',
+                            color_discrete_map=COLOR_SCHEMES['category_colors'],
+                            title=f"Monthly {metric.replace('_', ' ').title()} Trends")
+        fig_monthly.update_layout(xaxis_tickangle=-45)
+        st.plotly_chart(fig_monthly, use_container_width=True)
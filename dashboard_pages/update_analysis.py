@@ -0,0 +1,211 @@
+# Update Analysis page of the dashboard
+# This code is used by dashboard.py
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+from upload_ingest import UploadIngester
+from pipeline import CleanStage
+from video_tables import VideoTables
+
+"""
+Update Analysis
+
+Comparison of an uploaded CSV file of new videos with the current data, and merging it into the data store.
+Both sides are compared by their distinct videos (the normalized tables), so a video found by several
+keywords is counted once.
+"""
+
+DATA = ['tables']  # Data loaded by dashboard.py and passed to render()
+
+def render(version, tables):
+    """
+    Renders the Update Analysis page.
+    """
+    st.title("🔄 Update Analysis with New Data")
+    
+    st.markdown("""
+    Upload a new CSV file to update or compare the analysis. The file should follow the same structure 
+    as the original dataset with the following columns:
+    - video_id
+    - title
+    - published_date
+    - view_count
+    - like_count
+    - comment_count
+    - keyword
+    - category
+    - duration_seconds
+    
+    Other columns (like engagement_rate) are ignored, they are computed again when the data is updated.
+    """)
+    
+    # File upload section
+    uploaded_file = st.file_uploader("Choose a CSV file", type="csv")
+    
+    if uploaded_file is not None:
+        try:
+            # Validate and stage the upload in chunks, once per file and not on every rerun of the page
+            upload_key = (uploaded_file.name, uploaded_file.size)
+            ingester = st.session_state.get('upload_ingester') or UploadIngester()
+            if st.session_state.get('upload_key') != upload_key or ingester.path is None:
+                ingester.stage(uploaded_file)
+                st.session_state['upload_ingester'] = ingester
+                st.session_state['upload_key'] = upload_key
+            new_df = CleanStage().transform(ingester.staged(), None)
+            new_tables = VideoTables.build(new_df)
+            
+            st.success("File successfully loaded! 🎉")
+            
+            # Display data overview
+            st.subheader("📊 New Data Overview")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Total Videos", len(new_tables.videos))
+            with col2:
+                st.metric("Date Range", f"{new_df['published_date'].min().date()} to {new_df['published_date'].max().date()}")
+            with col3:
+                st.metric("Total Categories", len(new_df['category'].unique()))
+            
+            # Compare with original data
+            st.subheader("📈 Comparative Analysis")
+            
+            tab1, tab2, tab3 = st.tabs(["Data Comparison", "Category Distribution", "Engagement Analysis"])
+            
+            with tab1:
+                comparison_df = pd.DataFrame({
+                    'Metric': ['Total Videos', 'Total Views', 'Average Engagement Rate'],
+                    'Original Data': [
+                        len(tables.videos),
+                        tables.video_totals(None)['view_count'].iat[0],
+                        tables.videos['engagement_rate'].mean()
+                    ],
+                    'New Data': [
+                        len(new_tables.videos),
+                        new_tables.video_totals(None)['view_count'].iat[0],
+                        new_tables.videos['engagement_rate'].mean()
+                    ]
+                })
+                
+                st.dataframe(
+                    comparison_df.style.format({
+                        'Original Data': lambda x: f'{x:,.0f}' if isinstance(x, (int, float)) else x,
+                        'New Data': lambda x: f'{x:,.0f}' if isinstance(x, (int, float)) else x
+                    })
+                )
+            
+            with tab2:
+                # Category distribution comparison
+                fig = go.Figure()
+                
+                # Original data
+                cat_dist_orig = tables.video_totals('category').set_index('category')['video_count']
+                fig.add_trace(go.Bar(
+                    name='Original Data',
+                    x=cat_dist_orig.index,
+                    y=cat_dist_orig.values,
+                    marker_color='rgba(78, 205, 196, 0.7)'
+                ))
+                
+                # New data
+                cat_dist_new = new_tables.video_totals('category').set_index('category')['video_count']
+                fig.add_trace(go.Bar(
+                    name='New Data',
+                    x=cat_dist_new.index,
+                    y=cat_dist_new.values,
+                    marker_color='rgba(255, 107, 107, 0.7)'
+                ))
+                
+                fig.update_layout(
+                    title='Category Distribution Comparison',
+                    barmode='group',
+                    xaxis_title='Category',
+                    yaxis_title='Number of Videos'
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with tab3:
+                # Engagement analysis
+                fig = go.Figure()
+                
+                # Original data engagement
+                fig.add_trace(go.Box(
+                    y=tables.videos['engagement_rate'],
+                    name='Original Data',
+                    marker_color='rgba(78, 205, 196, 0.7)'
+                ))
+                
+                # New data engagement
+                fig.add_trace(go.Box(
+                    y=new_tables.videos['engagement_rate'],
+                    name='New Data',
+                    marker_color='rgba(255, 107, 107, 0.7)'
+                ))
+                
+                fig.update_layout(
+                    title='Engagement Rate Distribution Comparison',
+                    yaxis_title='Engagement Rate (%)'
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            
+            # Option to update the analysis
+            st.subheader("🔄 Update Analysis")
+            update_option = st.radio(
+                "Choose how to handle the new data:",
+                ["Combine with existing data", "Replace existing data"]
+            )
+            
+            if st.button("Update Analysis"):
+                # Merge the upload into the data store; the new dataset version reloads every page and cache
+                try:
+                    with st.spinner("Merging the new data and updating the analysis..."):
+                        inserted, replaced, updated = ingester.ingest('replace' if update_option == "Replace existing data" else 'combine')
+                except Exception as e:
+                    st.error(f"Error updating the analysis: {str(e)}. Run 'python pipeline.py' to retry.")
+                else:
+                    st.success(f"Analysis updated successfully! 🎉 {inserted:,} new rows stored, {replaced:,} existing rows replaced, "
+                               f"{updated:,} rows of the same videos updated with the new counts.")
+                    st.info("Please navigate to other sections to see the updated analysis.")
+                
+        except Exception as e:
+            st.error(f"""
+            Error processing the file: {str(e)}
+            
+            Please ensure your CSV file has the correct structure and column names:
+            - video_id
+            - title
+            - published_date
+            - view_count
+            - like_count
+            - comment_count
+            - keyword
+            - category
+            - duration_seconds
+            """)
+    
+    # Add instructions for data preparation
+    with st.expander("📋 Data Preparation Guidelines"):
+        st.markdown("""
+        ### Required Data Format
+        
+        Your CSV file should contain the following columns:
+        
+        | Column Name | Data Type | Description |
+        |------------|-----------|-------------|
+        | video_id | string | Unique identifier for each video |
+        | title | string | Title of the video |
+        | published_date | datetime | Publication date of the video |
+        | view_count | integer | Number of views |
+        | like_count | integer | Number of likes |
+        | comment_count | integer | Number of comments |
+        | keyword | string | Associated keyword |
+        | category | string | Category (Modern/Current/Old) |
+        | duration_seconds | integer | Video duration in seconds |
+        | engagement_rate | float | Engagement rate percentage (optional, computed from the counts) |
+        
+        ### Data Processing Tips
+        1. Ensure all dates are in a consistent format (YYYY-MM-DD)
+        2. Remove any duplicate video entries (for a repeated keyword and video the last row is used)
+        3. Clean any missing or invalid values
+        4. Verify category names match existing categories
+        """)
@@ -0,0 +1,267 @@
+# Transactional state of the YouTube data fetcher
+# This code is used by youtube_data_fetcher.py
+
+import os # required for the file operations of the migration
+import json # required for reading the old fetch_state.json
+import sqlite3 # required for the catalog database
+import threading # required for sharing the connection between the worker threads
+import logging # required for logging messages
+from datetime import datetime # required for the timestamps of the fetch history
+import pandas as pd # required for the video rows
+from video_store import read_videos # required for importing the existing video rows
+
+"""
+Fetch Catalog
+
+A SQLite database (fetch_catalog.db) that replaces fetch_state.json. It holds:
+- keywords: the progress of every keyword (when it was fetched, how many videos, how many search pages)
+- quota: the quota ledger of the current day and the time it resets
+- videos: the fetched video rows, one per keyword and video
+- runs / fetch_history: every run of the fetcher and every keyword it fetched
+- meta: small values like the time of the last statistics refresh
+
+Every update is a small transaction that only touches the rows of one keyword, instead of rewriting the whole
+state file, and a crash can never leave a half-written state behind. The database runs in WAL mode, so the
+dashboard and other fetchers can read while a fetcher writes.
+The first time the catalog is opened it imports fetch_state.json and youtube_data/all_videos_data (one-time migration).
+"""
+
+CATALOG_FILE = 'fetch_catalog.db'  # SQLite database of the fetcher state
+LEGACY_STATE_FILE = 'fetch_state.json'  # State file of earlier versions, imported once
+BUSY_TIMEOUT_MS = 30000  # How long a write waits for another writer before failing
+
+VIDEO_COLUMNS = ['keyword', 'category', 'video_id', 'title', 'published_date', 'duration_seconds',
+                 'view_count', 'like_count', 'comment_count']  # Columns of the videos table
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS keywords (
+    keyword TEXT PRIMARY KEY,
+    category TEXT,
+    processed_date TEXT NOT NULL,
+    videos_count INTEGER NOT NULL,
+    pages INTEGER
+);
+CREATE TABLE IF NOT EXISTS quota (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    used INTEGER NOT NULL,
+    reset_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS videos (
+    keyword TEXT NOT NULL,
+    category TEXT,
+    video_id TEXT NOT NULL,
+    title TEXT,
+    published_date TEXT,
+    duration_seconds INTEGER,
+    view_count INTEGER,
+    like_count INTEGER,
+    comment_count INTEGER,
+    PRIMARY KEY (keyword, video_id)
+);
+CREATE INDEX IF NOT EXISTS videos_by_id ON videos (video_id);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    mode TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    quota_used INTEGER,
+    keywords_fetched INTEGER,
+    videos_refreshed INTEGER
+);
+CREATE TABLE IF NOT EXISTS fetch_history (
+    run_id INTEGER REFERENCES runs (run_id),
+    keyword TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    videos_count INTEGER NOT NULL,
+    pages INTEGER
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+class FetchCatalog:
+    """
+    Connection to the catalog database, safe to use from several threads.
+    """
+
+    def __init__(self, path=CATALOG_FILE, legacy_state_file=LEGACY_STATE_FILE, data_dir='youtube_data'):
+        """
+        Opens (and if needed creates) the catalog in WAL mode and migrates fetch_state.json into a new catalog.
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, timeout=BUSY_TIMEOUT_MS / 1000, check_same_thread=False,
+                                          isolation_level=None)  # transactions are opened explicitly
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')  # durable at every checkpoint, safe against corruption
+        self.connection.execute(f'PRAGMA busy_timeout={BUSY_TIMEOUT_MS}')
+        self.connection.executescript(SCHEMA)
+        if self.get_meta('schema_version') is None:
+            self.migrate(legacy_state_file, data_dir)
+
+    def transaction(self, statements):
+        """
+        Runs a list of (sql, parameters) statements in one transaction (all or nothing).
+        Parameters that are a list of tuples run the statement once per tuple.
+        """
+        with self.lock:
+            cursor = self.connection.cursor()
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                for sql, parameters in statements:
+                    if isinstance(parameters, list):
+                        cursor.executemany(sql, parameters)
+                    else:
+                        cursor.execute(sql, parameters)
+                cursor.execute('COMMIT')
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+
+    def query(self, sql, parameters=()):
+        with self.lock:
+            return self.connection.execute(sql, parameters).fetchall()
+
+    def migrate(self, legacy_state_file, data_dir):
+        """
+        One-time import of the old JSON state file and of the video rows in all_videos_data.
+        The JSON file is left in place; the catalog is the state from now on.
+        """
+        statements = []
+        if os.path.exists(legacy_state_file):
+            with open(legacy_state_file, 'r') as f:
+                state = json.load(f)
+            statements.append((
+                'INSERT OR REPLACE INTO keywords (keyword, category, processed_date, videos_count, pages) VALUES (?, ?, ?, ?, ?)',
+                [(keyword, None, entry['processed_date'], entry['videos_count'], None)
+                 for keyword, entry in state.get('processed_keywords', {}).items()]
+            ))
+            if state.get('quota'):
+                statements.append(('INSERT OR REPLACE INTO quota (id, used, reset_at) VALUES (1, ?, ?)',
+                                   (state['quota']['used'], state['quota']['reset_at'])))
+            for key in ['last_update', 'last_refresh']:
+                if state.get(key):
+                    statements.append(('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, state[key])))
+            logging.info(f"Migrating {legacy_state_file} into {self.path}")
+
+        videos = None
+        if os.path.exists(os.path.join(data_dir, 'all_videos_data.csv')):
+            videos = read_videos('all_videos_data', data_dir=data_dir)
+            statements.append(self.video_statement(videos))
+            # The category of every migrated keyword is known from its rows
+            categories = videos[['keyword', 'category']].drop_duplicates(subset=['keyword']).astype(str)
+            statements.append(('UPDATE keywords SET category = ? WHERE keyword = ?',
+                               list(zip(categories['category'], categories['keyword']))))
+        statements.append(('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', ('schema_version', '1')))
+        self.transaction(statements)
+        if videos is not None:
+            logging.info(f"Imported {len(videos)} video rows into {self.path}")
+
+    def video_statement(self, rows):
+        """
+        Upsert statement for video rows (a DataFrame or a list of dicts with VIDEO_COLUMNS).
+        """
+        rows = pd.DataFrame(rows, columns=VIDEO_COLUMNS)
+        rows['published_date'] = pd.to_datetime(rows['published_date'], utc=True, format='ISO8601').dt.strftime('%Y-%m-%d %H:%M:%S')
+        values = [
+            (str(row[0]), None if pd.isna(row[1]) else str(row[1]), str(row[2]), str(row[3]), row[4],
+             int(row[5]), int(row[6]), int(row[7]), int(row[8]))
+            for row in rows[VIDEO_COLUMNS].itertuples(index=False, name=None)
+        ]
+        placeholders = ', '.join('?' for _ in VIDEO_COLUMNS)
+        return (f"INSERT OR REPLACE INTO videos ({', '.join(VIDEO_COLUMNS)}) VALUES ({placeholders})", values)
+
+    # Keyword progress
+
+    def processed_keywords(self):
+        """
+        Returns {keyword: {'processed_date': ..., 'videos_count': ...}} of all fetched keywords.
+        """
+        return {
+            keyword: {'processed_date': processed_date, 'videos_count': videos_count}
+            for keyword, processed_date, videos_count in self.query('SELECT keyword, processed_date, videos_count FROM keywords')
+        }
+
+    def record_keyword(self, keyword, category, rows, pages=None, run_id=None):
+        """
+        Stores the rows of a fetched keyword, marks it as processed and adds it to the fetch history,
+        all in one transaction. Rows of the keyword from an earlier fetch are replaced.
+        """
+        now = datetime.now().isoformat()
+        self.transaction([
+            ('DELETE FROM videos WHERE keyword = ?', (keyword,)),
+            self.video_statement(rows),
+            ('INSERT OR REPLACE INTO keywords (keyword, category, processed_date, videos_count, pages) VALUES (?, ?, ?, ?, ?)',
+             (keyword, category, now, len(rows), pages)),
+            ('INSERT INTO fetch_history (run_id, keyword, fetched_at, videos_count, pages) VALUES (?, ?, ?, ?, ?)',
+             (run_id, keyword, now, len(rows), pages)),
+            ('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', ('last_update', now))
+        ])
+
+    def update_statistics(self, statistics):
+        """
+        Replaces the view, like and comment counts of the given videos (DataFrame indexed by video_id).
+        """
+        self.transaction([(
+            'UPDATE videos SET view_count = ?, like_count = ?, comment_count = ? WHERE video_id = ?',
+            [(int(row.view_count), int(row.like_count), int(row.comment_count), str(video_id))
+             for video_id, row in statistics.iterrows()]
+        )])
+
+    def videos(self):
+        """
+        Returns all video rows as a DataFrame.
+        """
+        with self.lock:
+            return pd.read_sql_query(f"SELECT {', '.join(VIDEO_COLUMNS)} FROM videos", self.connection)
+
+    # Quota ledger
+
+    def quota_ledger(self):
+        """
+        Returns (used, reset_at) of the ledger, or None if there is none yet.
+        """
+        rows = self.query('SELECT used, reset_at FROM quota WHERE id = 1')
+        return rows[0] if rows else None
+
+    def reset_quota(self, reset_at):
+        self.transaction([('INSERT OR REPLACE INTO quota (id, used, reset_at) VALUES (1, 0, ?)', (reset_at,))])
+
+    def add_quota(self, cost):
+        """
+        Adds spent quota to the ledger (a relative update, so concurrent fetchers add up correctly).
+        """
+        self.transaction([('UPDATE quota SET used = used + ? WHERE id = 1', (cost,))])
+
+    def set_quota_used(self, used):
+        self.transaction([('UPDATE quota SET used = MAX(used, ?) WHERE id = 1', (used,))])
+
+    # Runs and small values
+
+    def start_run(self, mode):
+        """
+        Records the start of a run and returns its run_id.
+        """
+        with self.lock:
+            cursor = self.connection.execute('INSERT INTO runs (mode, started_at) VALUES (?, ?)',
+                                             (mode, datetime.now().isoformat()))
+            return cursor.lastrowid
+
+    def finish_run(self, run_id, quota_used, keywords_fetched=0, videos_refreshed=0):
+        self.transaction([(
+            'UPDATE runs SET finished_at = ?, quota_used = ?, keywords_fetched = ?, videos_refreshed = ? WHERE run_id = ?',
+            (datetime.now().isoformat(), quota_used, keywords_fetched, videos_refreshed, run_id)
+        )])
+
+    def get_meta(self, key):
+        rows = self.query('SELECT value FROM meta WHERE key = ?', (key,))
+        return rows[0][0] if rows else None
+
+    def set_meta(self, key, value):
+        self.transaction([('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))])
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
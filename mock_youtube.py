@@ -0,0 +1,154 @@
+# Offline stand-in for the YouTube Data API
+# This code is used by benchmark_fetcher.py (and can be passed to YouTubeDataFetcher as its transport)
+
+import json # required for encoding the synthetic responses
+import time # required for simulating the network latency
+import random # required for generating the synthetic videos
+import hashlib # required for deriving deterministic seeds from the requests
+import threading # required for counting the requests of several worker threads
+from urllib.parse import urlsplit, parse_qs # required for reading the request parameters
+import httplib2 # required for the response objects expected by googleapiclient
+
+"""
+Mock YouTube API
+
+MockYouTubeApi is an httplib2.Http compatible transport that answers the search and videos endpoints of the
+YouTube Data API v3 with synthetic responses, so YouTubeDataFetcher can run without an API key or network:
+
+    api = MockYouTubeApi(latency=0.05, error_rate=0.01)
+    fetcher = YouTubeDataFetcher(transport=lambda: api, use_cache=False)
+
+The responses only depend on the request (and the seed), so every run sees the same videos in the same order.
+Configurable behaviour:
+- latency: seconds every request takes
+- error_rate: share of requests answered with a 500 backendError
+- quota_error_rate: share of requests answered with a 403 quotaExceeded
+- search_pages: number of result pages of every search (nextPageToken is set on all pages but the last)
+- video_pool: number of distinct videos, a smaller pool makes keywords find the same videos more often
+Failures are drawn per (request, attempt), so a retried request can succeed.
+"""
+
+# Words mixed into the synthetic titles
+FILLER_WORDS = ['lecture', 'tutorial', 'introduction', 'basics', 'explained', 'course', 'lab', 'field', 'genetics', 'crop']
+
+def fraction(*parts):
+    """
+    Deterministic number in [0, 1) derived from the given values.
+    """
+    digest = hashlib.sha256('|'.join(str(part) for part in parts).encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') / 2 ** 64
+
+class MockYouTubeApi:
+    """
+    Synthetic search and videos responses, thread-safe so that all workers can share one instance.
+    """
+
+    def __init__(self, latency=0.0, error_rate=0.0, quota_error_rate=0.0, search_pages=5, video_pool=100000, seed=0):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.quota_error_rate = quota_error_rate
+        self.search_pages = search_pages
+        self.video_pool = video_pool
+        self.seed = seed
+        self.lock = threading.Lock()
+        self.attempts = {}  # request URL -> number of times it was requested
+        self.stats = {'requests': 0, 'search': 0, 'videos': 0, 'errors': 0, 'quota_errors': 0, 'bytes': 0}
+
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs):
+        """
+        Same interface as httplib2.Http.request: returns (response, content).
+        """
+        parts = urlsplit(uri)
+        endpoint = parts.path.rstrip('/').rsplit('/', 1)[-1]
+        params = {name: values[0] for name, values in parse_qs(parts.query).items() if name != 'key'}
+        request_id = (endpoint, sorted(params.items()))
+        with self.lock:
+            attempt = self.attempts.get(str(request_id), 0)
+            self.attempts[str(request_id)] = attempt + 1
+            self.stats['requests'] += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        draw = fraction(self.seed, request_id, attempt)
+        if draw < self.quota_error_rate:
+            return self.error(403, 'quotaExceeded', 'The request cannot be completed because you have exceeded your quota.')
+        if draw < self.quota_error_rate + self.error_rate:
+            return self.error(500, 'backendError', 'Backend Error')
+
+        if endpoint == 'search':
+            payload = self.search(params)
+        elif endpoint == 'videos':
+            payload = self.videos(params)
+        else:
+            return self.error(404, 'notFound', f"Unknown endpoint: {endpoint}")
+        with self.lock:
+            self.stats[endpoint] += 1
+        return self.response(200, payload)
+
+    def search(self, params):
+        """
+        One page of search results: video IDs drawn from the pool and titles that mostly contain the query.
+        """
+        query = params.get('q', '')
+        page = int(params.get('pageToken') or 0)
+        rng = random.Random(f"{self.seed}|{query}|{page}")
+        items = []
+        for _ in range(int(params.get('maxResults', 5))):
+            # Later pages are less relevant, like the real search
+            words = query.split() if rng.random() > page * 0.2 else []
+            title = ' '.join(words + rng.sample(FILLER_WORDS, 2))
+            items.append({
+                'kind': 'youtube#searchResult',
+                'id': {'kind': 'youtube#video', 'videoId': f"mock{rng.randrange(self.video_pool):07d}"},
+                'snippet': {'title': title}
+            })
+        payload = {'kind': 'youtube#searchListResponse', 'items': items,
+                   'pageInfo': {'totalResults': self.search_pages * len(items), 'resultsPerPage': len(items)}}
+        if page + 1 < self.search_pages:
+            payload['nextPageToken'] = str(page + 1)
+        return payload
+
+    def videos(self, params):
+        """
+        Snippet, statistics and content details of the requested video IDs (the same values on every request).
+        """
+        items = []
+        for video_id in params.get('id', '').split(','):
+            if not video_id:
+                continue
+            rng = random.Random(f"{self.seed}|{video_id}")
+            views = int(10 ** rng.uniform(1, 6))
+            items.append({
+                'kind': 'youtube#video',
+                'id': video_id,
+                'snippet': {
+                    'title': ' '.join(rng.sample(FILLER_WORDS, 3)),
+                    'publishedAt': f"{rng.randint(2008, 2024)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:00:00Z"
+                },
+                'statistics': {
+                    'viewCount': str(views),
+                    'likeCount': str(int(views * rng.uniform(0, 0.05))),
+                    'commentCount': str(int(views * rng.uniform(0, 0.005)))
+                },
+                'contentDetails': {'duration': f"PT{rng.randint(0, 1)}H{rng.randint(0, 59)}M{rng.randint(1, 59)}S"}
+            })
+        return {'kind': 'youtube#videoListResponse', 'items': items}
+
+    def response(self, status, payload):
+        content = json.dumps(payload).encode('utf-8')
+        with self.lock:
+            self.stats['bytes'] += len(content)
+        return httplib2.Response({'status': str(status), 'content-type': 'application/json; charset=UTF-8'}), content
+
+    def error(self, status, reason, message):
+        """
+        An error response in the format of the API, which googleapiclient raises as HttpError.
+        """
+        with self.lock:
+            self.stats['quota_errors' if reason == 'quotaExceeded' else 'errors'] += 1
+        return self.response(status, {'error': {
+            'code': status,
+            'message': message,
+            'errors': [{'message': message, 'domain': 'youtube.quota' if reason == 'quotaExceeded' else 'global', 'reason': reason}]
+        }})
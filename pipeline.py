@@ -0,0 +1,312 @@
+# Transform pipeline from the fetched data to the analysed data (Steps 2 and 3 of the project as described in the README.md)
+# This code is used by youtube_data_fetcher.py (after every run) and can be run on its own
+
+import os # required for the file and directory operations
+import sys # required for the command line interface
+import glob # required for finding the delta files of a stage
+import hashlib # required for the fingerprints of the rows
+import logging # required for logging messages
+import numpy as np # required for the fingerprint arrays
+import pandas as pd # required for the transformations
+import pyarrow as pa # required for the typed Arrow tables
+import pyarrow.parquet as pq # required for streaming the Parquet files
+from video_store import DATA_DIR, parquet_path, read_videos, to_columnar, ROW_GROUP_SIZE # required for the data files and their types
+from video_schema import coerce_videos # required for the column types of every chunk
+from relevance import relevance_scores, relevance_category # required for the relevance stage
+from video_tables import write_video_tables # required for the normalized tables of the relevance data
+from semantic_index import SemanticIndex # required for adding the new titles to the semantic index
+from title_search import TitleSearchIndex # required for adding the new titles to the title search index
+
+"""
+Pipeline
+
+Turns youtube_data/all_videos_data into cleaned_videos_data (Step 2) and videos_with_relevance (Step 3) in stages:
+    all_videos_data --clean--> cleaned_videos_data --relevance--> videos_with_relevance --> normalized tables
+                                                                                    |--> title search index
+                                                                                    \--> semantic index
+Every stage streams its input in chunks of CHUNK_SIZE rows and only transforms the rows that are new or changed
+since its last run. It recognizes them by a fingerprint of every input row (keyword, video_id and all values),
+kept in a checkpoint file per stage. The transformed rows are written as delta files, then the output is
+rewritten chunk by chunk (unchanged rows copied, changed and removed rows replaced by the deltas), so memory
+stays bounded by the chunk size plus the fingerprints. The checkpoint is written last: a stage that was
+interrupted simply runs again, and a stage whose input did not change does nothing.
+After the stages, the normalized videos, keywords and links tables (video_tables.py) are rebuilt if
+videos_with_relevance changed, and its new titles are added to the title search index (title_search.py) and the
+semantic index (semantic_index.py). The pipeline is the only writer of these files; the dashboard only reads them.
+Each of them is updated on its own after the stages, and a failure is logged without failing the run.
+
+Usage:
+    python pipeline.py            # run all stages
+    python pipeline.py relevance  # run one stage
+"""
+
+PIPELINE_DIR = os.path.join(DATA_DIR, 'pipeline')  # Checkpoints and delta files of the stages
+CHUNK_SIZE = 2000  # Rows transformed at once
+KEY_COLUMNS = ['keyword', 'video_id']  # A row is identified by the keyword that found the video and the video
+
+def format_duration(seconds):
+    """
+    Formats durations in seconds as HH:MM:SS.
+    """
+    seconds = np.asarray(seconds, dtype=np.int64)
+    return [f"{s // 3600:02d}:{s % 3600 // 60:02d}:{s % 60:02d}" for s in seconds]
+
+def row_keys(df):
+    return df[KEY_COLUMNS].astype(str).apply(lambda row: '\x1f'.join(row), axis=1).to_numpy(dtype=object)
+
+def row_fingerprints(df):
+    """
+    64-bit fingerprint of every row over all its values.
+    """
+    text = df.astype(str).apply(lambda row: '\x1f'.join(row), axis=1)
+    return np.array([int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'big')
+                     for value in text], dtype=np.uint64)
+
+def read_chunks(name, columns=None):
+    """
+    Streams a dataset of DATA_DIR in chunks of CHUNK_SIZE rows (from its Parquet copy if it exists).
+    """
+    csv_path = os.path.join(DATA_DIR, f"{name}.csv")
+    if os.path.exists(parquet_path(csv_path)):
+        for batch in pq.ParquetFile(parquet_path(csv_path)).iter_batches(batch_size=CHUNK_SIZE, columns=columns):
+            yield batch.to_pandas()
+    elif os.path.exists(csv_path):
+        yield from pd.read_csv(csv_path, chunksize=CHUNK_SIZE, usecols=columns)
+
+def chunk_schema(schema):
+    """
+    One type per column for all chunks of a file: a later chunk can have more distinct values or larger counts,
+    so dictionary columns get 32-bit indices and integer columns 64 bits.
+    """
+    return pa.schema([
+        pa.field(field.name, pa.dictionary(pa.int32(), field.type.value_type))
+        if pa.types.is_dictionary(field.type) else
+        pa.field(field.name, pa.int64()) if pa.types.is_integer(field.type) else field
+        for field in schema
+    ])
+
+def write_chunks(name, chunks):
+    """
+    Rewrites a dataset of DATA_DIR (Parquet copy and CSV) from a stream of chunks, so only one chunk is in memory
+    at a time. Both files are written to temporary files and renamed into place at the end.
+    Returns the number of written rows.
+    """
+    csv_path = os.path.join(DATA_DIR, f"{name}.csv")
+    parquet_file = parquet_path(csv_path)
+    writer, schema = None, None
+    rows = 0
+    with open(f"{csv_path}.tmp", 'w', newline='') as csv_file:
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+            chunk = coerce_videos(chunk)
+            table = to_columnar(chunk)
+            if writer is None:
+                schema = chunk_schema(table.schema)
+                writer = pq.ParquetWriter(f"{parquet_file}.tmp", schema, compression='zstd')
+            writer.write_table(table.select(schema.names).cast(schema), row_group_size=ROW_GROUP_SIZE)
+            chunk.to_csv(csv_file, index=False, header=(rows == 0), date_format='%Y-%m-%d %H:%M:%S')
+            rows += len(chunk)
+        csv_file.flush()
+        os.fsync(csv_file.fileno())
+    if writer is not None:
+        writer.close()
+        os.replace(f"{parquet_file}.tmp", parquet_file)
+    os.replace(f"{csv_path}.tmp", csv_path)
+    logging.info(f"Wrote {rows} rows to {csv_path}")
+    return rows
+
+class Stage:
+    """
+    One step of the pipeline: transforms the rows of the input dataset into the rows of the output dataset.
+    """
+    name = None
+    input_name = None
+    output_name = None
+
+    def transform(self, chunk, previous):
+        """
+        Returns the output rows for a chunk of new or changed input rows.
+        previous holds the current output rows of the same keys (if any), for reusing expensive results.
+        """
+        raise NotImplementedError
+
+    def checkpoint_path(self):
+        return os.path.join(PIPELINE_DIR, f"{self.name}.checkpoint.parquet")
+
+    def delta_dir(self):
+        return os.path.join(PIPELINE_DIR, self.name)
+
+    def load_checkpoint(self):
+        """
+        Returns the fingerprints of the input rows of the last run, indexed by row key.
+        """
+        if not os.path.exists(self.checkpoint_path()):
+            return pd.Series(dtype=np.uint64)
+        checkpoint = pq.read_table(self.checkpoint_path()).to_pandas()
+        checkpoint = pd.Series(checkpoint['fingerprint'].to_numpy(), index=checkpoint['key'])
+        return checkpoint[~checkpoint.index.duplicated(keep='last')]
+
+    def previous_rows(self, chunk):
+        """
+        Current output rows for the keys of a chunk, read with the video IDs pushed down to the Parquet file.
+        """
+        path = parquet_path(os.path.join(DATA_DIR, f"{self.output_name}.csv"))
+        if not os.path.exists(path):
+            return None
+        previous = pq.read_table(path, filters=[('video_id', 'in', chunk['video_id'].astype(str).unique().tolist())]).to_pandas()
+        return previous[pd.Index(row_keys(previous)).isin(row_keys(chunk))]
+
+    def run(self):
+        """
+        Brings the output up to date with the input. Returns the number of transformed rows.
+        """
+        os.makedirs(self.delta_dir(), exist_ok=True)
+        for leftover in glob.glob(os.path.join(self.delta_dir(), '*')):
+            os.remove(leftover)  # deltas of an interrupted run are recomputed
+
+        checkpoint = self.load_checkpoint()
+        keys, fingerprints, changed_keys = [], [], set()
+        transformed = 0
+        for number, chunk in enumerate(read_chunks(self.input_name)):
+            chunk = chunk.reset_index(drop=True)
+            chunk_keys = row_keys(chunk)
+            chunk_fingerprints = row_fingerprints(chunk)
+            keys.append(chunk_keys)
+            fingerprints.append(chunk_fingerprints)
+            changed = checkpoint.reindex(chunk_keys).to_numpy() != chunk_fingerprints
+            if not changed.any():
+                continue
+            new_rows = chunk[changed].reset_index(drop=True)
+            output = coerce_videos(self.transform(new_rows, self.previous_rows(new_rows)))
+            pq.write_table(to_columnar(output), os.path.join(self.delta_dir(), f"delta-{number:06d}.parquet"))
+            changed_keys.update(chunk_keys[changed])
+            transformed += len(new_rows)
+
+        keys = np.concatenate(keys) if keys else np.array([], dtype=object)
+        fingerprints = np.concatenate(fingerprints) if fingerprints else np.array([], dtype=np.uint64)
+        removed_keys = set(checkpoint.index) - set(keys)
+        if transformed or removed_keys:
+            self.write_output(changed_keys | removed_keys)
+
+        # The checkpoint marks the stage as done
+        tmp_path = f"{self.checkpoint_path()}.tmp"
+        pq.write_table(pa.table({'key': keys.astype(str), 'fingerprint': fingerprints}), tmp_path)
+        os.replace(tmp_path, self.checkpoint_path())
+        for delta in glob.glob(os.path.join(self.delta_dir(), '*')):
+            os.remove(delta)
+        logging.info(f"Pipeline stage '{self.name}': {transformed} rows transformed, {len(removed_keys)} removed")
+        return transformed
+
+    def write_output(self, replaced_keys):
+        """
+        Rewrites the output dataset with the rows of the last output whose key is not replaced,
+        followed by the delta files.
+        """
+        replaced_keys = pd.Index(list(replaced_keys))
+
+        def output_chunks():
+            for chunk in read_chunks(self.output_name):
+                yield chunk[~pd.Index(row_keys(chunk)).isin(replaced_keys)]
+            for delta in sorted(glob.glob(os.path.join(self.delta_dir(), 'delta-*.parquet'))):
+                yield pq.read_table(delta).to_pandas()
+
+        write_chunks(self.output_name, output_chunks())
+
+class CleanStage(Stage):
+    """
+    Step 2: data cleaning & preprocessing.
+    """
+    name = 'clean'
+    input_name = 'all_videos_data'
+    output_name = 'cleaned_videos_data'
+
+    def transform(self, chunk, previous):
+        """
+        Drops rows without values and adds the human-readable duration and the engagement rate
+        [(likes + comments) / views] * 100 (missing for videos without views).
+        """
+        cleaned = coerce_videos(chunk.dropna(how='all'))
+        cleaned['duration_formatted'] = format_duration(cleaned['duration_seconds'])
+        views = cleaned['view_count'].astype('float64')
+        engagement = (cleaned['like_count'].astype('float64') + cleaned['comment_count'].astype('float64')) / views * 100
+        cleaned['engagement_rate'] = engagement.where(views > 0).round(2)
+        return cleaned
+
+class RelevanceStage(Stage):
+    """
+    Step 3: relevance of every video to its keyword.
+    """
+    name = 'relevance'
+    input_name = 'cleaned_videos_data'
+    output_name = 'videos_with_relevance'
+
+    def transform(self, chunk, previous):
+        """
+        Adds relevance_score and relevance_category. Rows whose keyword and title did not change (e.g. only their
+        statistics were refreshed) keep their previous score, so only new titles are scored.
+        """
+        scored = chunk.copy()
+        scores = pd.Series(np.nan, index=scored.index)
+        if previous is not None and len(previous):
+            previous_scores = pd.Series(
+                previous['relevance_score'].to_numpy(),
+                index=previous['keyword'].astype(str) + '\x1f' + previous['title'].astype(str)
+            )
+            previous_scores = previous_scores[~previous_scores.index.duplicated()]
+            text_keys = scored['keyword'].astype(str) + '\x1f' + scored['title'].astype(str)
+            scores = pd.Series(previous_scores.reindex(text_keys).to_numpy(), index=scored.index)
+        missing = scores.isna()
+        if missing.any():
+            scores[missing] = relevance_scores(scored.loc[missing, 'keyword'], scored.loc[missing, 'title'])
+        scored['relevance_score'] = scores.round(2)
+        scored['relevance_category'] = relevance_category(scored['relevance_score']).to_numpy()
+        return scored
+
+STAGES = [CleanStage(), RelevanceStage()]  # In the order they run
+
+def run_pipeline(stage_names=None):
+    """
+    Runs the given stages (all by default) in order. Returns {stage name: transformed rows}.
+    """
+    os.makedirs(PIPELINE_DIR, exist_ok=True)
+    results = {}
+    for stage in STAGES:
+        if stage_names and stage.name not in stage_names:
+            continue
+        try:
+            results[stage.name] = stage.run()
+        except Exception as e:
+            logging.error(f"Error in pipeline stage '{stage.name}': {str(e)}")
+            raise
+    if os.path.exists(os.path.join(DATA_DIR, f"{RelevanceStage.output_name}.csv")):
+        update_derived_outputs()
+    return results
+
+def update_derived_outputs():
+    """
+    Updates the normalized tables and the search indexes from videos_with_relevance, each on its own.
+    The stages have already committed their outputs, so a failure (e.g. a missing model or a lock or permission
+    error) is logged and does not fail the run: readers keep using the previous version (the tables and the title
+    index add what is missing in memory), and the next run updates it again.
+    """
+    outputs = [
+        ('normalized tables', lambda: write_video_tables(RelevanceStage.output_name)),
+        ('title search index', lambda: TitleSearchIndex().update(read_videos(RelevanceStage.output_name, columns=['video_id', 'title']))),
+        # The title embeddings were cached by the relevance stage, so only the lists are updated here
+        ('semantic index', lambda: SemanticIndex().update(read_videos(RelevanceStage.output_name, columns=['video_id', 'title']))),
+    ]
+    for name, update in outputs:
+        try:
+            update()
+        except Exception as e:
+            logging.error(f"Error updating the {name}: {str(e)}. The data is stored, run 'python pipeline.py' to retry.")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    names = sys.argv[1:]
+    unknown = [name for name in names if name not in [stage.name for stage in STAGES]]
+    if unknown:
+        print(f"Unknown stage(s): {', '.join(unknown)}. Stages: {', '.join(stage.name for stage in STAGES)}")
+    else:
+        print(run_pipeline(names or None))
@@ -0,0 +1,312 @@
+# Relevance of the videos to their keywords (Step 3 of the project as described in the README.md)
+# This code is used by pipeline.py
+
+import os # required for the embedding cache files
+import re # required for splitting keywords and titles into words
+import json # required for the description of the embedding cache
+import fcntl # required for locking the embedding cache against concurrent writers
+import hashlib # required for the hashes of the cached texts
+import logging # required for logging messages
+import threading # required for loading the model once when several sessions query at the same time
+from contextlib import contextmanager # required for the lock of the embedding cache
+from difflib import SequenceMatcher # required for the sequence similarity of keyword and title
+import numpy as np # required for the embedding matrices and the vectorized scores
+import pandas as pd # required for the relevance categories and the cache index
+
+"""
+Relevance
+
+Scores how relevant a video title is to the keyword that found it (0-100):
+- base relevance: direct keyword match (30%), word overlap (40%) and sequence similarity (30%)
+- semantic similarity: cosine similarity of the Sentence-BERT embeddings of title and keyword
+The relevance score combines the base relevance (60%) and the semantic similarity (40%), and the
+relevance category is derived from it with the thresholds of RELEVANCE_CATEGORIES.
+
+Embeddings are computed on the CPU in large batches and cached on disk per model, keyed by a hash of the text:
+    youtube_data/embeddings/all-MiniLM-L6-v2/titles/vectors.f16    float16 matrix, one row per title (memory-mapped)
+    youtube_data/embeddings/all-MiniLM-L6-v2/titles/index.parquet  text hash -> row of the matrix
+    youtube_data/embeddings/all-MiniLM-L6-v2/keywords/...          the same for the keywords
+    youtube_data/embeddings/all-MiniLM-L6-v2/similarity/<hash>.npy similarity of one keyword to every cached title
+A title is only ever encoded once. The similarities are one matrix product per keyword column, kept as one file
+per keyword: a new keyword only computes its own column, and new titles only extend the existing columns.
+Appends to a cache hold a lock file (cache.lock) from reading the latest index to writing the new one, so the
+fetcher, the pipeline and the dashboard can share the caches. Texts that are only queried (e.g. a search typed
+in the dashboard) are encoded in memory with lookup() and never added to the cache.
+"""
+
+RELEVANCE_MODEL = 'all-MiniLM-L6-v2'  # Sentence-BERT model for the semantic similarity
+BASE_WEIGHTS = {'direct_match': 0.3, 'word_overlap': 0.4, 'sequence_similarity': 0.3}  # Weights of the base relevance
+BASE_WEIGHT = 0.6      # Weight of the base relevance in the relevance score
+SEMANTIC_WEIGHT = 0.4  # Weight of the semantic similarity in the relevance score
+ENCODE_BATCH_SIZE = 256  # Titles encoded per batch of the model
+CACHE_BLOCK_SIZE = 8192  # Titles encoded and written to the cache at once (bounds the memory of a large backfill)
+EMBEDDING_DIR = os.path.join('youtube_data', 'embeddings')  # Cached embeddings and similarities, one directory per model
+
+# Lower bound of the score of every relevance category, from the highest to the lowest
+# (the bounds the categories of youtube_data/videos_with_relevance.csv were assigned with)
+RELEVANCE_CATEGORIES = [
+    (45, 'High'),
+    (25, 'Medium'),
+    (10, 'Low'),
+    (float('-inf'), 'Not Relevant')
+]
+
+def words(text):
+    return set(re.findall(r'\w+', str(text).lower()))
+
+def base_relevance(keyword, title):
+    """
+    Text-matching relevance of a title to a keyword (0-100).
+    """
+    keyword, title = str(keyword).lower(), str(title).lower()
+    keyword_words = words(keyword)
+    direct_match = 100.0 if keyword in title else 0.0
+    word_overlap = 100.0 * len(keyword_words & words(title)) / len(keyword_words) if keyword_words else 0.0
+    sequence_similarity = 100.0 * SequenceMatcher(None, keyword, title).ratio()
+    return (BASE_WEIGHTS['direct_match'] * direct_match +
+            BASE_WEIGHTS['word_overlap'] * word_overlap +
+            BASE_WEIGHTS['sequence_similarity'] * sequence_similarity)
+
+@contextmanager
+def file_lock(path, shared=False):
+    """
+    Exclusive lock on the lock file path, held by one process (and one thread) at a time.
+    A shared lock (for readers) can be held by several at once, but not together with an exclusive one.
+    Only the exclusive lock creates the lock file (and its directory); a reader opens it read-only and
+    goes without the lock if it does not exist, since nothing was written next to it yet.
+    """
+    if shared:
+        if not os.path.exists(path):
+            yield
+            return
+        f = open(path, 'r')
+    else:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        f = open(path, 'a')
+    with f:
+        fcntl.flock(f, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+def text_hashes(texts):
+    """
+    64-bit hash of every text (the key of its cached embedding).
+    """
+    return np.array([int.from_bytes(hashlib.blake2b(str(text).encode('utf-8'), digest_size=8).digest(), 'big')
+                     for text in texts], dtype=np.uint64)
+
+class EmbeddingCache:
+    """
+    On-disk cache of the normalized embeddings of one model for one kind of text (titles or keywords).
+    The vectors are a float16 matrix in a raw file that is read as a memory map and only ever appended to.
+    """
+
+    def __init__(self, path, model_loader):
+        """
+        Opens the cache in path; model_loader returns the model when texts have to be encoded.
+        """
+        self.path = path
+        self.model_loader = model_loader
+        self.vector_file = os.path.join(path, 'vectors.f16')
+        self.index_file = os.path.join(path, 'index.parquet')
+        self.info_file = os.path.join(path, 'cache.json')
+        self.lock_file = os.path.join(path, 'cache.lock')
+        self.reload()  # the directory is only created by the first append
+
+    def reload(self):
+        """
+        Reads the dimension and the index of the cache as they are on disk.
+        """
+        self.dim = None
+        if os.path.exists(self.info_file):
+            with open(self.info_file, 'r') as f:
+                self.dim = json.load(f)['dim']
+        if os.path.exists(self.index_file):
+            index = pd.read_parquet(self.index_file)
+            self.index = pd.Series(index['row'].to_numpy(), index=index['hash'].to_numpy())
+        else:
+            self.index = pd.Series(dtype=np.int64, index=pd.Index([], dtype=np.uint64))
+
+    def __len__(self):
+        return len(self.index)
+
+    def vectors(self):
+        """
+        All cached vectors as a read-only memory map (rows in the order they were added).
+        """
+        if not len(self.index):
+            return np.zeros((0, self.dim or 0), dtype=np.float16)
+        return np.memmap(self.vector_file, dtype=np.float16, mode='r', shape=(len(self.index), self.dim))
+
+    def rows(self, texts):
+        """
+        Returns the rows of the texts in vectors(), encoding and appending the texts that are not cached yet.
+        The appends hold the lock of the cache and start from its index on disk, so texts another process
+        appended in the meantime are neither encoded again nor overwritten.
+        """
+        texts = [str(text) for text in texts]
+        hashes = text_hashes(texts)
+        if not pd.Index(hashes).isin(self.index.index).all():
+            with file_lock(self.lock_file):
+                self.reload()
+                missing = ~pd.Index(hashes).isin(self.index.index)
+                new_texts = list(dict.fromkeys(text for text, is_missing in zip(texts, missing) if is_missing))
+                for start in range(0, len(new_texts), CACHE_BLOCK_SIZE):
+                    self.append(new_texts[start:start + CACHE_BLOCK_SIZE])
+        return self.index.reindex(hashes).to_numpy(dtype=np.int64)
+
+    def lookup(self, texts):
+        """
+        Normalized float32 vectors of the texts without changing the cache: cached texts are read from it,
+        the others are encoded in memory (for queries that should not grow the cache).
+        """
+        texts = [str(text) for text in texts]
+        rows = self.index.reindex(text_hashes(texts)).to_numpy()
+        cached = ~np.isnan(rows.astype(np.float64))
+        vectors = np.empty((len(texts), self.dim or 0), dtype=np.float32)
+        if cached.any():
+            vectors[cached] = self.vectors()[rows[cached].astype(np.int64)]
+        if not cached.all():
+            encoded = self.encode([text for text, is_cached in zip(texts, cached) if not is_cached])
+            if not len(self.index):
+                vectors = np.empty((len(texts), encoded.shape[1]), dtype=np.float32)
+            vectors[~cached] = encoded
+        return vectors
+
+    def encode(self, texts):
+        """
+        Normalized embeddings of the texts (float32).
+        """
+        vectors = self.model_loader().encode(texts, batch_size=ENCODE_BATCH_SIZE, normalize_embeddings=True,
+                                             convert_to_numpy=True, show_progress_bar=False)
+        return np.asarray(vectors, dtype=np.float32)
+
+    def append(self, texts):
+        """
+        Encodes a block of texts and appends their vectors to the cache (called with the lock held).
+        The vectors are written right after the rows of the index, replacing rows a crashed append left behind,
+        and the index is written last (to a temporary file that is renamed into place).
+        """
+        vectors = self.encode(texts).astype(np.float16)
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+            with open(self.info_file, 'w') as f:
+                json.dump({'dim': self.dim}, f)
+        with open(self.vector_file, 'ab') as f:
+            f.truncate(len(self.index) * self.dim * 2)
+            f.write(vectors.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        new_rows = pd.Series(np.arange(len(self.index), len(self.index) + len(texts)), index=text_hashes(texts))
+        self.index = pd.concat([self.index, new_rows])
+        index = pd.DataFrame({'hash': self.index.index.to_numpy(dtype=np.uint64), 'row': self.index.to_numpy()})
+        index.to_parquet(f"{self.index_file}.tmp", index=False)
+        os.replace(f"{self.index_file}.tmp", self.index_file)
+        logging.info(f"Encoded {len(texts)} texts into {self.path} ({len(self.index)} cached)")
+
+class RelevanceScorer:
+    """
+    Relevance scores with cached embeddings and one cached similarity column per keyword.
+    """
+
+    def __init__(self, model_name=RELEVANCE_MODEL, cache_dir=EMBEDDING_DIR, model=None):
+        """
+        Opens the caches of model_name in cache_dir (resolved to an absolute path). The model itself is only loaded
+        when a text has to be encoded (a loaded model can be passed in as model).
+        """
+        self.model_name = model_name
+        self.model = model
+        self.model_lock = threading.Lock()
+        self.path = os.path.join(os.path.abspath(cache_dir), re.sub(r'[^\w.-]', '_', model_name))  # not moved by a chdir
+        self.titles = EmbeddingCache(os.path.join(self.path, 'titles'), self.load_model)
+        self.keywords = EmbeddingCache(os.path.join(self.path, 'keywords'), self.load_model)
+        self.similarity_dir = os.path.join(self.path, 'similarity')
+
+    def load_model(self):
+        """
+        Loads the Sentence-BERT model once (on the CPU).
+        """
+        with self.model_lock:
+            if self.model is None:
+                from sentence_transformers import SentenceTransformer # imported on first use, it takes seconds to import
+                self.model = SentenceTransformer(self.model_name, device='cpu')
+        return self.model
+
+    def keyword_column(self, keyword_row, keyword_hash):
+        """
+        Cosine similarity of one keyword to every cached title (in the order of the title cache).
+        The column is stored per keyword; only the titles added since it was stored are computed.
+        """
+        path = os.path.join(self.similarity_dir, f"{keyword_hash:016x}.npy")
+        column = np.load(path) if os.path.exists(path) else np.zeros(0, dtype=np.float32)
+        if len(column) < len(self.titles):
+            keyword_vector = self.keywords.vectors()[keyword_row].astype(np.float32)
+            titles = self.titles.vectors()
+            blocks = [column]
+            for start in range(len(column), len(titles), CACHE_BLOCK_SIZE):
+                blocks.append(titles[start:start + CACHE_BLOCK_SIZE].astype(np.float32) @ keyword_vector)
+            column = np.concatenate(blocks)
+            os.makedirs(self.similarity_dir, exist_ok=True)
+            np.save(f"{path}.tmp.npy", column)
+            os.replace(f"{path}.tmp.npy", path)
+        return column
+
+    def semantic_similarity(self, keywords, titles):
+        """
+        Cosine similarity (0-100, can be slightly negative) of every title to its keyword.
+        """
+        keywords = [str(keyword) for keyword in keywords]
+        title_rows = self.titles.rows(titles)
+        keyword_rows = self.keywords.rows(keywords)
+        keyword_hashes = text_hashes(keywords)
+        similarity = np.empty(len(keywords), dtype=np.float32)
+        for keyword_row in np.unique(keyword_rows):
+            pairs = keyword_rows == keyword_row
+            column = self.keyword_column(int(keyword_row), int(keyword_hashes[pairs][0]))
+            similarity[pairs] = column[title_rows[pairs]]
+        return 100.0 * similarity.astype(np.float64)
+
+    def similarity_matrix(self, keywords):
+        """
+        Cosine similarity (0-100) of every cached title (rows) to every given keyword (columns), built from
+        the cached columns; only keywords that have no column yet are computed.
+        """
+        keywords = list(dict.fromkeys(str(keyword) for keyword in keywords))
+        keyword_rows = self.keywords.rows(keywords)
+        columns = [self.keyword_column(int(row), int(keyword_hash))
+                   for row, keyword_hash in zip(keyword_rows, text_hashes(keywords))]
+        return 100.0 * np.column_stack(columns) if columns else np.zeros((len(self.titles), 0))
+
+    def scores(self, keywords, titles):
+        """
+        Relevance scores (rounded to two decimals) of the titles to their keywords.
+        """
+        keywords = [str(keyword) for keyword in keywords]
+        titles = [str(title) for title in titles]
+        if not keywords:
+            return np.array([], dtype=np.float64)
+        base = np.array([base_relevance(keyword, title) for keyword, title in zip(keywords, titles)])
+        return np.round(BASE_WEIGHT * base + SEMANTIC_WEIGHT * self.semantic_similarity(keywords, titles), 2)
+
+_scorers = {}  # Absolute cache directory -> scorer with the default model, created on first use
+
+def relevance_scores(keywords, titles):
+    """
+    Relevance scores (rounded to two decimals) of the titles to their keywords, with the default scorer of the
+    embedding cache under the current directory (a process that changes its directory gets the scorer of the new one).
+    """
+    cache_dir = os.path.abspath(EMBEDDING_DIR)
+    if cache_dir not in _scorers:
+        loaded = next((scorer.model for scorer in _scorers.values() if scorer.model is not None), None)
+        _scorers[cache_dir] = RelevanceScorer(cache_dir=cache_dir, model=loaded)  # the model is loaded once
+    return _scorers[cache_dir].scores(keywords, titles)
+
+def relevance_category(scores):
+    """
+    Relevance category of every score.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    conditions = [scores >= lower for lower, _ in RELEVANCE_CATEGORIES]
+    return pd.Series(np.select(conditions, [label for _, label in RELEVANCE_CATEGORIES]), dtype='category')
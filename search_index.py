@@ -0,0 +1,165 @@
+# Search index for the Advanced Keyword Analysis panel
+# This code is used by dashboard.py
+
+from collections import defaultdict # required for building the posting lists
+import numpy as np # required for the sorted indexes and the set operations on row positions
+import pandas as pd # required for the timestamps of the date filter
+
+"""
+Search Index
+
+Indexes the loaded video data once per dataset version so that the search panel does not scan every row:
+- a trigram index over the distinct keyword and title strings (a few thousand strings instead of every row),
+  with the row positions of every string
+- the row positions of every category
+- sorted indexes of published_date, view_count and engagement_rate, searched with binary search
+A search starts from the most selective of these and checks the remaining filters only on those candidate rows.
+"""
+
+NGRAM_SIZE = 3  # Length of the n-grams in the text index
+
+def ngrams(text):
+    """
+    Returns the set of lower-case n-grams of a text.
+    """
+    text = text.lower()
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+class TextIndex:
+    """
+    N-gram index over the distinct values of a categorical text column.
+    """
+
+    def __init__(self, column):
+        """
+        Indexes the categories of the column and groups the row positions by category code.
+        """
+        self.value_ids = {value: value_id for value_id, value in enumerate(column.cat.categories)}
+        self.values = [str(value).lower() for value in column.cat.categories]
+        codes = column.cat.codes.to_numpy()
+        order = np.argsort(codes, kind='stable')
+        boundaries = np.searchsorted(codes[order], np.arange(len(self.values) + 1))
+        self.rows = [order[boundaries[i]:boundaries[i + 1]] for i in range(len(self.values))]
+
+        self.postings = defaultdict(set)
+        for value_id, value in enumerate(self.values):
+            for gram in ngrams(value):
+                self.postings[gram].add(value_id)
+
+    def matching_values(self, query):
+        """
+        Returns the ids of the values that contain the query (case-insensitive substring match).
+        """
+        query = query.lower()
+        grams = ngrams(query)
+        if grams:
+            candidates = set.intersection(*(self.postings.get(gram, set()) for gram in grams))
+        else:
+            # Queries shorter than an n-gram are checked against the distinct values only
+            candidates = range(len(self.values))
+        return [value_id for value_id in candidates if query in self.values[value_id]]
+
+    def matching_rows(self, query):
+        """
+        Returns the sorted row positions whose value contains the query.
+        """
+        value_ids = self.matching_values(query)
+        if not value_ids:
+            return np.array([], dtype=np.int64)
+        return np.sort(np.concatenate([self.rows[value_id] for value_id in value_ids]))
+
+    def rows_equal(self, value):
+        """
+        Returns the sorted row positions whose value is exactly the given value.
+        """
+        if value not in self.value_ids:
+            return np.array([], dtype=np.int64)
+        return self.rows[self.value_ids[value]]
+
+class SortedIndex:
+    """
+    Row positions ordered by the values of a numeric or datetime column, searched with binary search.
+    """
+
+    def __init__(self, column):
+        values = column.to_numpy()
+        self.order = np.argsort(values, kind='stable')
+        self.sorted_values = values[self.order]
+
+    def rows_between(self, lower=None, upper=None):
+        """
+        Returns the row positions with lower <= value < upper (either bound may be None).
+        """
+        start = 0 if lower is None else np.searchsorted(self.sorted_values, lower, side='left')
+        end = len(self.sorted_values) if upper is None else np.searchsorted(self.sorted_values, upper, side='left')
+        return self.order[start:end]
+
+    def count_between(self, lower=None, upper=None):
+        """
+        Returns the number of rows with lower <= value < upper without materializing them.
+        """
+        start = 0 if lower is None else np.searchsorted(self.sorted_values, lower, side='left')
+        end = len(self.sorted_values) if upper is None else np.searchsorted(self.sorted_values, upper, side='left')
+        return end - start
+
+class VideoSearchIndex:
+    """
+    All indexes needed by the search panel, built once for a loaded video DataFrame.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self.keywords = TextIndex(df['keyword'])
+        self.titles = TextIndex(df['title'])
+        self.categories = TextIndex(df['category'])
+        self.published = SortedIndex(df['published_date'])
+        self.views = SortedIndex(df['view_count'])
+        self.engagement = SortedIndex(df['engagement_rate'])
+        # Plain arrays for checking the remaining filters on the candidate rows
+        self.published_values = df['published_date'].to_numpy()
+        self.view_values = df['view_count'].to_numpy()
+        self.engagement_values = df['engagement_rate'].to_numpy()
+
+    def search(self, text=None, category=None, min_views=0, min_engagement=0.0,
+               start_date=None, end_date=None, search_titles=False):
+        """
+        Returns the videos matching all given filters, in the order of the data:
+        - text: case-insensitive substring of the keyword (and of the title if search_titles is set)
+        - category: exact category
+        - min_views / min_engagement: lower bounds
+        - start_date / end_date: publication dates, both inclusive
+        Only the matching rows are copied out of the data.
+        """
+        start = pd.Timestamp(start_date).to_datetime64() if start_date is not None else None
+        end = (pd.Timestamp(end_date) + pd.Timedelta(days=1)).to_datetime64() if end_date is not None else None
+
+        # Candidates from the text and category indexes, which are the most selective
+        candidates = None
+        if text:
+            candidates = self.keywords.matching_rows(text)
+            if search_titles:
+                candidates = np.union1d(candidates, self.titles.matching_rows(text))
+        if category:
+            category_rows = self.categories.rows_equal(category)
+            candidates = category_rows if candidates is None else np.intersect1d(candidates, category_rows, assume_unique=True)
+
+        if candidates is None:
+            # No text or category filter: start from the smallest range of the sorted indexes
+            ranges = [
+                (self.published.count_between(start, end), lambda: self.published.rows_between(start, end)),
+                (self.views.count_between(min_views if min_views > 0 else None), lambda: self.views.rows_between(min_views)),
+                (self.engagement.count_between(min_engagement if min_engagement > 0 else None), lambda: self.engagement.rows_between(min_engagement))
+            ]
+            candidates = np.sort(min(ranges, key=lambda item: item[0])[1]())
+
+        # Check the remaining filters on the candidate rows only
+        mask = np.ones(len(candidates), dtype=bool)
+        if min_views > 0:
+            mask &= self.view_values[candidates] >= min_views
+        if min_engagement > 0:
+            mask &= self.engagement_values[candidates] >= min_engagement
+        if start is not None:
+            mask &= self.published_values[candidates] >= start
+        if end is not None:
+            mask &= self.published_values[candidates] < end
+        return self.df.take(candidates[mask])
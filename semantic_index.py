@@ -0,0 +1,284 @@
+# Semantic nearest-neighbour search over the video titles
+# This code is used by youtube_data_fetcher.py (to keep the index up to date) and dashboard.py (to query it)
+
+import os # required for the file and directory operations
+import sys # required for the command line interface
+import json # required for the manifest of the index
+import time # required for measuring the query time
+import logging # required for logging messages
+import numpy as np # required for the centroids, the inverted lists and the vectorized scoring
+import pandas as pd # required for returning the results
+from relevance import RelevanceScorer, file_lock # required for the cached title and keyword embeddings
+
+"""
+Semantic Index
+
+An approximate nearest-neighbour index (IVF, inverted file) over the Sentence-BERT embeddings of the video titles.
+The titles are clustered with spherical k-means into about 4 * sqrt(n) lists; a query is compared with the
+centroids and then only with the titles of the NPROBE closest lists, instead of with every title.
+The embeddings come from the cache of relevance.py, so building the index only encodes titles that were never seen.
+
+The index lives in youtube_data/semantic_index/:
+- centroids.npy: one normalized vector per list
+- vectors.npy: the title vectors (float16) ordered by list, with offsets.npy marking where every list starts
+- video_ids.npy / titles.npy: the video of every vector
+- manifest.json: the model, the number of vectors and the number of vectors the centroids were trained on
+New videos are added to the list of their closest centroid; the centroids are trained again when the index
+has grown to RETRAIN_GROWTH times the number of vectors they were trained on.
+An index of at most EXACT_SEARCH_LIMIT titles is searched exactly (one matrix product is faster than the lists
+and always finds the true neighbours). For a larger index, update() measures the recall of the lists against
+an exact search and stores the smallest nprobe that reaches TARGET_RECALL in the manifest.
+The index is written only by update() (the pipeline, under a lock file); the dashboard only reads it, and the
+texts it queries are encoded in memory, not added to the embedding cache.
+
+Usage:
+    python semantic_index.py build                            # index all videos in youtube_data/videos_with_relevance
+    python semantic_index.py "marker assisted selection"      # closest videos to a text
+    python semantic_index.py gaps                             # keywords without close videos
+"""
+
+SEMANTIC_INDEX_DIR = os.path.join('youtube_data', 'semantic_index')  # Directory of the persisted index
+MANIFEST_FILE = 'manifest.json'  # Description of the index
+LISTS_PER_SQRT = 4  # Number of lists = LISTS_PER_SQRT * sqrt(number of titles)
+NPROBE = 16  # Lists searched per query until update() has measured a better value (higher is more exact and slower)
+NPROBE_CHOICES = [8, 16, 32, 64, 128]  # nprobe values update() measures, the smallest reaching TARGET_RECALL is used
+TARGET_RECALL = 0.95  # Share of the exact 10 nearest titles a search should find
+EXACT_SEARCH_LIMIT = 50000  # Indexes of at most this many titles are searched exactly
+KMEANS_ITERATIONS = 20  # Iterations of the k-means training
+KMEANS_SAMPLE = 50000  # Titles the centroids are trained on at most
+RETRAIN_GROWTH = 2.0  # The centroids are trained again when the index grows by this factor
+GAP_SIMILARITY = 50.0  # Similarity (0-100) a video needs to count as close to a keyword
+
+def spherical_kmeans(vectors, n_lists, iterations=KMEANS_ITERATIONS, seed=0):
+    """
+    Clusters normalized vectors by cosine similarity and returns the normalized centroids.
+    """
+    rng = np.random.default_rng(seed)
+    if len(vectors) > KMEANS_SAMPLE:
+        vectors = vectors[rng.choice(len(vectors), KMEANS_SAMPLE, replace=False)]
+    centroids = vectors[rng.choice(len(vectors), n_lists, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = np.argmax(vectors @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, vectors)
+        empty = ~sums.any(axis=1)
+        sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()))]  # restart empty lists at random titles
+        centroids = sums / np.linalg.norm(sums, axis=1, keepdims=True)
+    return centroids.astype(np.float32)
+
+class SemanticIndex:
+    """
+    IVF index over the title embeddings of all indexed videos.
+    """
+
+    def __init__(self, index_dir=SEMANTIC_INDEX_DIR, scorer=None):
+        """
+        Opens the index in index_dir (an empty index if it does not exist yet).
+        The vectors are memory-mapped, so opening a large index is cheap.
+        """
+        self.index_dir = index_dir
+        self.scorer = scorer or RelevanceScorer()
+        self.lock_file = os.path.join(index_dir, 'index.lock')
+        with file_lock(self.lock_file, shared=True):  # not while update() is replacing the files, creates nothing
+            self.load()
+
+    def load(self):
+        """
+        Reads the index as it is on disk.
+        """
+        index_dir = self.index_dir
+        self.exact_vectors = None
+        self.manifest = {'model': self.scorer.model_name, 'count': 0, 'trained_on': 0}
+        self.centroids = np.zeros((0, 0), dtype=np.float32)
+        self.vectors = np.zeros((0, 0), dtype=np.float16)
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.video_ids = np.array([], dtype=str)
+        self.titles = np.array([], dtype=str)
+        manifest_path = os.path.join(index_dir, MANIFEST_FILE)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r') as f:
+                manifest = json.load(f)
+            if manifest['model'] != self.scorer.model_name:
+                logging.warning(f"Semantic index was built with {manifest['model']}, it is rebuilt with {self.scorer.model_name}")
+                return
+            self.manifest = manifest
+            self.centroids = np.load(os.path.join(index_dir, 'centroids.npy'))
+            self.vectors = np.load(os.path.join(index_dir, 'vectors.npy'), mmap_mode='r')
+            self.offsets = np.load(os.path.join(index_dir, 'offsets.npy'))
+            self.video_ids = np.load(os.path.join(index_dir, 'video_ids.npy'))
+            self.titles = np.load(os.path.join(index_dir, 'titles.npy'))
+
+    def __len__(self):
+        return len(self.video_ids)
+
+    def update(self, df):
+        """
+        Adds the videos of df (columns video_id and title) that are not in the index yet and saves the index.
+        Returns the number of newly indexed videos. Holds the lock of the index, so concurrent updates
+        (e.g. the fetcher and an upload in the dashboard) are applied one after the other.
+        """
+        os.makedirs(self.index_dir, exist_ok=True)
+        with file_lock(self.lock_file):
+            self.load()
+            return self.add_videos(df)
+
+    def add_videos(self, df):
+        """
+        Indexes the new videos of df (called by update() with the lock held).
+        """
+        videos = df[['video_id', 'title']].drop_duplicates(subset=['video_id'])
+        videos = videos[~videos['video_id'].astype(str).isin(set(self.video_ids))]
+        if videos.empty:
+            return 0
+
+        titles = videos['title'].astype(str).tolist()
+        rows = self.scorer.titles.rows(titles)
+        new_vectors = self.scorer.titles.vectors()[rows]
+        vectors = np.concatenate([np.asarray(self.vectors, dtype=np.float16), new_vectors]) if len(self) else new_vectors
+        video_ids = np.concatenate([self.video_ids, videos['video_id'].astype(str).to_numpy(dtype=str)])
+        titles = np.concatenate([self.titles, np.array(titles, dtype=str)])
+
+        if not len(self.centroids) or len(vectors) >= RETRAIN_GROWTH * self.manifest['trained_on']:
+            n_lists = max(1, min(len(vectors), int(LISTS_PER_SQRT * np.sqrt(len(vectors)))))
+            self.centroids = spherical_kmeans(vectors.astype(np.float32), n_lists)
+            self.manifest['trained_on'] = len(vectors)
+            logging.info(f"Trained {n_lists} semantic index lists on {len(vectors)} titles")
+
+        # Order all vectors by their list, so a list is one contiguous block
+        assignment = np.concatenate([
+            np.argmax(vectors[start:start + KMEANS_SAMPLE].astype(np.float32) @ self.centroids.T, axis=1)
+            for start in range(0, len(vectors), KMEANS_SAMPLE)
+        ])
+        order = np.argsort(assignment, kind='stable')
+        self.vectors = vectors[order]
+        self.video_ids = video_ids[order]
+        self.titles = titles[order]
+        self.offsets = np.searchsorted(assignment[order], np.arange(len(self.centroids) + 1)).astype(np.int64)
+        self.manifest['count'] = len(self.video_ids)
+        self.exact_vectors = None
+        if len(self) > EXACT_SEARCH_LIMIT:
+            self.manifest['nprobe'] = self.tune_nprobe()
+        self.save()
+        logging.info(f"Indexed {len(videos)} new video titles in the semantic index ({len(self)} in total)")
+        return len(videos)
+
+    def save(self):
+        """
+        Writes the arrays to temporary files and renames them into place, the manifest last.
+        """
+        os.makedirs(self.index_dir, exist_ok=True)
+        arrays = {'centroids': self.centroids, 'vectors': self.vectors, 'offsets': self.offsets,
+                  'video_ids': self.video_ids, 'titles': self.titles}
+        for name, array in arrays.items():
+            path = os.path.join(self.index_dir, f"{name}.npy")
+            np.save(f"{path}.tmp.npy", array)
+            os.replace(f"{path}.tmp.npy", path)
+        manifest_path = os.path.join(self.index_dir, MANIFEST_FILE)
+        with open(f"{manifest_path}.tmp", 'w') as f:
+            json.dump(self.manifest, f)
+        os.replace(f"{manifest_path}.tmp", manifest_path)
+
+    def tune_nprobe(self):
+        """
+        The smallest of NPROBE_CHOICES whose measured recall@10 reaches TARGET_RECALL.
+        """
+        for nprobe in NPROBE_CHOICES:
+            recall, milliseconds = self.recall(nprobe=nprobe)
+            logging.info(f"Semantic index recall@10 with nprobe {nprobe}: {recall:.2%} ({milliseconds:.2f} ms per query)")
+            if recall >= TARGET_RECALL:
+                return nprobe
+        return NPROBE_CHOICES[-1]
+
+    def search_vector(self, vector, k=20, nprobe=None):
+        """
+        Returns the positions and similarities (0-100) of the k closest indexed titles to a normalized vector.
+        Without nprobe, an index of at most EXACT_SEARCH_LIMIT titles is searched exactly and a larger one
+        with the nprobe measured by update(); with nprobe the lists are searched (as recall() does).
+        """
+        vector = np.asarray(vector, dtype=np.float32)
+        if not len(self):
+            return np.array([], dtype=np.int64), np.array([], dtype=np.float32)
+        if nprobe is None and len(self) <= EXACT_SEARCH_LIMIT:
+            if self.exact_vectors is None:
+                self.exact_vectors = np.asarray(self.vectors, dtype=np.float32)
+            candidates = np.arange(len(self))
+            similarity = self.exact_vectors @ vector
+        else:
+            nprobe = nprobe or self.manifest.get('nprobe', NPROBE)
+            lists = np.argsort(-(self.centroids @ vector))[:nprobe]
+            candidates = np.concatenate([np.arange(self.offsets[i], self.offsets[i + 1]) for i in lists])
+            if not len(candidates):
+                return np.array([], dtype=np.int64), np.array([], dtype=np.float32)
+            similarity = np.asarray(self.vectors[candidates], dtype=np.float32) @ vector
+        best = np.argpartition(-similarity, k - 1)[:k] if len(similarity) > k else np.arange(len(similarity))
+        best = best[np.argsort(-similarity[best])]
+        return candidates[best], 100.0 * similarity[best]
+
+    def similar_videos(self, text, k=20, nprobe=None):
+        """
+        Returns the k videos whose titles are semantically closest to a text (a keyword or any query)
+        as a DataFrame with video_id, title and similarity (0-100).
+        A text that is not in the keyword embedding cache is encoded in memory, the cache is not changed.
+        """
+        vector = self.scorer.keywords.lookup([text])[0]
+        positions, similarity = self.search_vector(vector, k, nprobe)
+        return pd.DataFrame({
+            'video_id': self.video_ids[positions],
+            'title': self.titles[positions],
+            'similarity': similarity
+        })
+
+    def keyword_gaps(self, keywords, threshold=GAP_SIMILARITY, k=20, nprobe=None):
+        """
+        How well the indexed videos cover every keyword: the similarity of its closest video and how many of
+        its k closest videos reach the threshold. Keywords with no close video are content gaps.
+        Returns one row per keyword, the least covered first.
+        """
+        keywords = list(dict.fromkeys(str(keyword) for keyword in keywords))
+        vectors = self.scorer.keywords.lookup(keywords)
+        rows = []
+        for keyword, vector in zip(keywords, vectors):
+            _, similarity = self.search_vector(vector, k, nprobe)
+            rows.append({
+                'keyword': keyword,
+                'best_similarity': float(similarity[0]) if len(similarity) else 0.0,
+                'close_videos': int((similarity >= threshold).sum()),
+            })
+        gaps = pd.DataFrame(rows, columns=['keyword', 'best_similarity', 'close_videos'])
+        gaps['gap'] = gaps['close_videos'] == 0
+        return gaps.sort_values(['close_videos', 'best_similarity'], kind='stable').reset_index(drop=True)
+
+    def recall(self, queries=100, k=10, nprobe=NPROBE, seed=0):
+        """
+        Measures the index against an exact search: the share of the exact k nearest titles it finds for
+        random indexed titles as queries, and the mean query time in milliseconds.
+        """
+        rng = np.random.default_rng(seed)
+        vectors = np.asarray(self.vectors, dtype=np.float32)
+        found, seconds = 0, 0.0
+        for position in rng.choice(len(self), min(queries, len(self)), replace=False):
+            exact = set(np.argsort(-(vectors @ vectors[position]))[:k])
+            start = time.perf_counter()
+            approximate, _ = self.search_vector(vectors[position], k, nprobe)
+            seconds += time.perf_counter() - start
+            found += len(exact & set(approximate))
+        count = min(queries, len(self))
+        return found / (count * k), 1000 * seconds / count
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if sys.argv[1:] == ['build']:
+        from video_store import read_videos
+        index = SemanticIndex()
+        index.update(read_videos('videos_with_relevance', columns=['video_id', 'title']))
+        nprobe = index.manifest.get('nprobe', NPROBE)
+        recall, milliseconds = index.recall(nprobe=nprobe)
+        search = 'exact search' if len(index) <= EXACT_SEARCH_LIMIT else 'lists'
+        print(f"{len(index)} titles ({search}), recall@10 of the lists with nprobe {nprobe}: {recall:.2%}, {milliseconds:.2f} ms per query")
+    elif sys.argv[1:] == ['gaps']:
+        keywords = pd.read_csv('keywords.csv')['keyword']
+        print(SemanticIndex().keyword_gaps(keywords).head(20).to_string(index=False))
+    elif len(sys.argv) == 2:
+        print(SemanticIndex().similar_videos(sys.argv[1]).to_string(index=False))
+    else:
+        print('Usage: python semantic_index.py build | gaps | "query"')
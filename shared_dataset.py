@@ -0,0 +1,92 @@
+# Read-only video dataset shared by all sessions of the dashboard
+# This code is used by dashboard.py
+
+import numpy as np # required for finding the row ranges of the categories and keywords
+import pandas as pd # required for the DataFrame views of the dataset
+import pyarrow as pa # required for the read-only Arrow buffers behind the numeric columns
+from video_store import read_videos, dataset_version, DATA_DIR # required for loading the dataset and its version
+from video_schema import add_derived_columns # required for the derived columns the pages group by
+
+"""
+Shared Dataset
+
+One immutable copy of a video dataset per Streamlit process. The rows (with the derived columns of
+video_schema.add_derived_columns) are sorted by category and keyword and converted into an Arrow table once,
+and the Arrow table into the pandas frame the pages use, column by column (split_blocks, self_destruct): every
+Arrow buffer is released as soon as its column is converted, so only one copy of the data stays in memory.
+The numeric columns keep the Arrow buffers without copying them, so they are read-only: a page that tried to
+modify them in place would fail loudly instead of changing them for every other session.
+Because the rows are sorted, every category and every keyword is a contiguous range of rows, and view()
+returns it as a slice (no copy) instead of a boolean-mask filter (a copy).
+Cached with st.cache_resource, every session and every rerun gets the same object, so memory does not grow
+with the number of concurrent sessions.
+"""
+
+SLICE_COLUMNS = ['category', 'keyword']  # Sort order of the rows, every value of these columns is one row range
+
+class SharedDataset:
+    """
+    Read-only video dataset with cheap category and keyword slices.
+    """
+
+    def __init__(self, name, data_dir=DATA_DIR):
+        """
+        Loads the dataset, adds the derived columns and builds the shared frame (through Arrow, see above).
+        """
+        self.name = name
+        self.version = dataset_version(name, data_dir)
+        frame = add_derived_columns(read_videos(name, data_dir=data_dir))
+        frame = frame.sort_values(SLICE_COLUMNS, kind='stable').reset_index(drop=True)
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        del frame
+        self.frame = table.to_pandas(split_blocks=True, self_destruct=True)
+        del table  # must not be used after a self-destructing conversion
+
+        # Row ranges of every (category, keyword) pair
+        self.ranges = {}
+        codes = np.column_stack([self.frame[column].cat.codes.to_numpy() for column in SLICE_COLUMNS])
+        boundaries = np.flatnonzero((codes[1:] != codes[:-1]).any(axis=1)) + 1
+        starts = np.concatenate([[0], boundaries])
+        stops = np.concatenate([boundaries, [len(self.frame)]])
+        for start, stop in zip(starts, stops):
+            if stop > start:
+                key = tuple(self.frame[column].iat[start] for column in SLICE_COLUMNS)
+                self.ranges[key] = (int(start), int(stop))
+
+    def __len__(self):
+        return len(self.frame)
+
+    def row_ranges(self, category=None, keyword=None):
+        """
+        Returns the (start, stop) row ranges of a category, a keyword or both, merged where they touch.
+        """
+        ranges = sorted(
+            (start, stop) for (range_category, range_keyword), (start, stop) in self.ranges.items()
+            if (category is None or range_category == category) and (keyword is None or range_keyword == keyword)
+        )
+        merged = []
+        for start, stop in ranges:
+            if merged and merged[-1][1] == start:
+                merged[-1] = (merged[-1][0], stop)
+            else:
+                merged.append((start, stop))
+        return merged
+
+    def view(self, category=None, keyword=None):
+        """
+        Rows of a category and/or keyword as a DataFrame. A single row range (every category, and every keyword
+        that belongs to one category) is a slice of the shared frame that copies no data.
+        """
+        ranges = self.row_ranges(category, keyword)
+        if not ranges:
+            return self.frame.iloc[0:0]
+        if len(ranges) == 1:
+            start, stop = ranges[0]
+            return self.frame.iloc[start:stop]
+        return pd.concat([self.frame.iloc[start:stop] for start, stop in ranges])
+
+    def nbytes(self):
+        """
+        Size of the shared frame in bytes.
+        """
+        return int(self.frame.memory_usage(deep=True).sum())
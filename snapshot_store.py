@@ -0,0 +1,186 @@
+# Storage for the statistics snapshots of the fetched videos
+# This code is used by youtube_data_fetcher.py (statistics refresh) and dashboard_compute.py (growth of the keywords)
+
+import os # required for the file and directory operations
+import glob # required for finding the partition files
+import logging # required for logging messages
+import pandas as pd # required for the snapshot tables
+import pyarrow as pa # required for converting the snapshots into typed Arrow tables
+import pyarrow.parquet as pq # required for the Parquet partition files
+
+"""
+Snapshot Store
+
+Every statistics refresh records the view, like and comment counts of the refreshed videos with the time
+they were fetched, so the counts form a time series per video instead of a single value frozen at the first fetch.
+Snapshots are append-only Parquet files, partitioned by the day they were fetched:
+    youtube_data/snapshots/fetched_date=2025-01-31/part-20250131T120000-000.parquet
+A query only opens the partitions of the days it asks for, and compact_partitions() merges the files a refresh
+wrote into one file per day, sorted by video_id, so daily snapshots of hundreds of thousands of videos stay
+a few files per day that are read column by column.
+
+Query API:
+- read_snapshots(): the raw time series
+- video_velocity(): views, likes and comments gained per day by every video between two dates
+- keyword_velocity(): the same summed up per keyword, for the video-keyword pairs of the video data
+"""
+
+SNAPSHOT_DIR = os.path.join('youtube_data', 'snapshots')  # Directory of the snapshot partitions
+SNAPSHOT_COLUMNS = ['video_id', 'fetched_at', 'view_count', 'like_count', 'comment_count']  # Columns of a snapshot
+SNAPSHOT_SCHEMA = pa.schema([
+    ('video_id', pa.string()),
+    ('fetched_at', pa.timestamp('s')),
+    ('view_count', pa.int64()),
+    ('like_count', pa.int64()),
+    ('comment_count', pa.int64())
+])
+
+def append_snapshots(snapshots, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Appends snapshots (a DataFrame with SNAPSHOT_COLUMNS, fetched_at in UTC without time zone) to the store.
+    The rows of every fetch day are written as one new file of that day's partition (temporary file and rename,
+    so readers never see a partial file). Returns the paths of the written files.
+    """
+    if snapshots.empty:
+        return []
+    snapshots = snapshots[SNAPSHOT_COLUMNS].copy()
+    snapshots['fetched_at'] = pd.to_datetime(snapshots['fetched_at']).dt.floor('s')
+    paths = []
+    for day, rows in snapshots.groupby(snapshots['fetched_at'].dt.strftime('%Y-%m-%d')):
+        partition = os.path.join(snapshot_dir, f"fetched_date={day}")
+        os.makedirs(partition, exist_ok=True)
+        stamp = rows['fetched_at'].max().strftime('%Y%m%dT%H%M%S')
+        number = len(glob.glob(os.path.join(partition, f"part-{stamp}-*.parquet")))
+        path = os.path.join(partition, f"part-{stamp}-{number:03d}.parquet")
+        table = pa.Table.from_pandas(rows.sort_values('video_id'), schema=SNAPSHOT_SCHEMA, preserve_index=False)
+        pq.write_table(table, f"{path}.tmp", compression='zstd')
+        os.replace(f"{path}.tmp", path)
+        paths.append(path)
+    logging.info(f"Stored {len(snapshots)} snapshots in {len(paths)} partition files")
+    return paths
+
+def partition_files(since=None, until=None, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Returns the snapshot files of the days from since to until (both inclusive, either may be None).
+    Days outside the range are skipped by their directory name, without opening their files.
+    """
+    files = []
+    for partition in sorted(glob.glob(os.path.join(snapshot_dir, 'fetched_date=*'))):
+        day = pd.Timestamp(os.path.basename(partition).split('=', 1)[1])
+        if since is not None and day < pd.Timestamp(since).normalize():
+            continue
+        if until is not None and day > pd.Timestamp(until).normalize():
+            continue
+        files.extend(sorted(glob.glob(os.path.join(partition, '*.parquet'))))
+    return files
+
+def snapshot_version(snapshot_dir=SNAPSHOT_DIR):
+    """
+    Returns a fingerprint of the snapshot store that changes whenever a file is added or replaced (a cache key).
+    """
+    files = partition_files(snapshot_dir=snapshot_dir)
+    latest = max((os.stat(path).st_mtime_ns for path in files), default=0)
+    return f"snapshots-{len(files)}-{latest}"
+
+def read_snapshots(columns=None, filters=None, since=None, until=None, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Loads the snapshots fetched from since to until (timestamps, either may be None), ordered by video and fetch time.
+    Only the partitions of those days and the requested columns are read, and the filters
+    (pyarrow syntax, e.g. [('video_id', 'in', ids)]) are pushed down to the partition files.
+    """
+    columns = columns or SNAPSHOT_COLUMNS
+    files = partition_files(since, until, snapshot_dir)
+    filters = list(filters or [])
+    if since is not None:
+        filters.append(('fetched_at', '>=', pd.Timestamp(since).to_pydatetime()))
+    if until is not None:
+        filters.append(('fetched_at', '<=', pd.Timestamp(until).to_pydatetime()))
+    if not files:
+        return pd.DataFrame({column: pd.Series(dtype=SNAPSHOT_SCHEMA.field(column).type.to_pandas_dtype())
+                             for column in columns})
+    table = pq.ParquetDataset(files, schema=SNAPSHOT_SCHEMA, filters=filters or None).read(columns=columns)
+    snapshots = table.to_pandas()
+    order = [column for column in ['video_id', 'fetched_at'] if column in snapshots.columns]
+    return snapshots.sort_values(order, kind='stable').reset_index(drop=True) if order else snapshots
+
+def latest_snapshots(snapshot_dir=SNAPSHOT_DIR):
+    """
+    Returns the most recent snapshot of every video, indexed by video_id.
+    """
+    snapshots = read_snapshots(snapshot_dir=snapshot_dir)
+    return snapshots.drop_duplicates(subset=['video_id'], keep='last').set_index('video_id')
+
+def compact_partitions(snapshot_dir=SNAPSHOT_DIR):
+    """
+    Merges the files of every day that has more than one into a single file sorted by video_id and fetch time.
+    The merged file is complete before the old files are removed; a crash in between only leaves duplicate
+    snapshots behind, which the merge of the next compaction removes.
+    """
+    for partition in sorted(glob.glob(os.path.join(snapshot_dir, 'fetched_date=*'))):
+        files = sorted(glob.glob(os.path.join(partition, '*.parquet')))
+        if len(files) < 2:
+            continue
+        snapshots = pq.ParquetDataset(files, schema=SNAPSHOT_SCHEMA).read().to_pandas()
+        snapshots = snapshots.drop_duplicates(subset=['video_id', 'fetched_at'], keep='last')
+        snapshots = snapshots.sort_values(['video_id', 'fetched_at'], kind='stable')
+        stamp = snapshots['fetched_at'].max().strftime('%Y%m%dT%H%M%S')
+        path = os.path.join(partition, f"part-{stamp}-merged.parquet")
+        table = pa.Table.from_pandas(snapshots, schema=SNAPSHOT_SCHEMA, preserve_index=False)
+        pq.write_table(table, f"{path}.tmp", compression='zstd')
+        os.replace(f"{path}.tmp", path)
+        for old_path in files:
+            if old_path != path:
+                os.remove(old_path)
+        logging.info(f"Compacted {len(files)} snapshot files of {os.path.basename(partition)} ({len(snapshots)} snapshots)")
+
+def video_velocity(video_ids=None, since=None, until=None, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Growth of every video between its first and its last snapshot from since to until, indexed by video_id:
+    the counts gained (views_gained, likes_gained, comments_gained), the same per day (views_per_day, ...),
+    the number of snapshots and the days between the first and the last one.
+    Videos with fewer than two snapshots in the range are left out, as nothing can be said about their growth.
+    """
+    filters = [('video_id', 'in', [str(video_id) for video_id in video_ids])] if video_ids is not None else None
+    snapshots = read_snapshots(filters=filters, since=since, until=until, snapshot_dir=snapshot_dir)
+    grouped = snapshots.groupby('video_id', sort=False)
+    first, last = grouped.first(), grouped.last()
+    days = (last['fetched_at'] - first['fetched_at']).dt.total_seconds() / 86400
+    velocity = pd.DataFrame({
+        'snapshots': grouped.size(),
+        'first_fetched': first['fetched_at'],
+        'last_fetched': last['fetched_at'],
+        'days': days,
+        'view_count': last['view_count'],
+        'views_gained': last['view_count'] - first['view_count'],
+        'likes_gained': last['like_count'] - first['like_count'],
+        'comments_gained': last['comment_count'] - first['comment_count']
+    })
+    velocity = velocity[(velocity['snapshots'] >= 2) & (velocity['days'] > 0)]
+    for metric in ['views', 'likes', 'comments']:
+        velocity[f'{metric}_per_day'] = velocity[f'{metric}_gained'] / velocity['days']
+    return velocity
+
+def keyword_velocity(videos, since=None, until=None, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Growth per keyword from since to until. videos holds the keyword, category and video_id of every
+    video-keyword pair (like all_videos_data.csv); a video found by several keywords counts for each of them.
+    Returns one row per keyword (indexed by keyword) with its category, the number of tracked videos,
+    the views gained, the views gained per day (summed over its videos) and growth_rate, the views gained
+    as a percentage of the views at the first snapshot.
+    """
+    pairs = videos[['keyword', 'category', 'video_id']].astype({'keyword': str, 'category': str, 'video_id': str})
+    pairs = pairs.drop_duplicates()
+    velocity = video_velocity(pairs['video_id'].unique().tolist(), since, until, snapshot_dir)
+    growth = pairs.join(velocity, on='video_id', how='inner')
+    growth['first_view_count'] = growth['view_count'] - growth['views_gained']
+    per_keyword = growth.groupby('keyword').agg(
+        category=('category', 'first'),
+        videos_tracked=('video_id', 'count'),
+        views_gained=('views_gained', 'sum'),
+        views_per_day=('views_per_day', 'sum'),
+        likes_per_day=('likes_per_day', 'sum'),
+        comments_per_day=('comments_per_day', 'sum'),
+        first_view_count=('first_view_count', 'sum')
+    )
+    per_keyword['growth_rate'] = 100 * per_keyword['views_gained'] / per_keyword['first_view_count'].where(per_keyword['first_view_count'] > 0)
+    return per_keyword.drop(columns=['first_view_count'])
@@ -0,0 +1,262 @@
+# Full-text search over the video titles
+# This code is used by pipeline.py (to keep the index up to date) and dashboard.py (to search it)
+
+import os # required for the file and directory operations
+import re # required for splitting titles into words
+import sys # required for the command line interface
+import json # required for the manifest of the index
+import logging # required for logging messages
+from collections import Counter # required for counting the words of a title
+import numpy as np # required for the postings arrays and the vectorized scoring
+import pandas as pd # required for returning the results
+
+"""
+Title Search
+
+A persisted inverted index over the titles of all fetched videos, ranked with BM25.
+The index lives in youtube_data/title_index/ and consists of segments. Every update indexes only the videos
+that are not in the index yet and writes them as a new segment, so adding rows never rebuilds the whole index.
+When there are too many segments they are merged into one. A segment stores, for every word, the videos that
+contain it (postings) and how often, as numpy arrays, so a query only touches the postings of its words.
+The index is written by the pipeline (pipeline.py) after every run. The dashboard only reads it: videos that are
+not in the index yet are indexed in memory (extend()) and nothing is written.
+
+Usage:
+    python title_search.py build              # index all videos in youtube_data/all_videos_data
+    python title_search.py "marker assisted"  # search the titles
+"""
+
+INDEX_DIR = os.path.join('youtube_data', 'title_index')  # Directory of the persisted index
+MANIFEST_FILE = 'manifest.json'  # List of the segments of the index
+MAX_SEGMENTS = 8  # Segments are merged into one when an update would create more than this
+BM25_K1 = 1.2  # BM25 term frequency saturation
+BM25_B = 0.75  # BM25 document length normalization
+DENSE_SCORING_RATIO = 16  # Scores are summed in a dense array when the postings cover more than 1/16 of a segment
+
+# Common English words that do not help to rank titles
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'how', 'in', 'is', 'it', 'of',
+    'on', 'or', 'the', 'this', 'to', 'what', 'with', 'you', 'your'
+}
+
+def tokenize(text):
+    """
+    Splits a title into lower-case words without stopwords.
+    """
+    return [word for word in re.findall(r'\w+', str(text).lower()) if word not in STOPWORDS]
+
+class Segment:
+    """
+    Inverted index over a fixed set of videos.
+    terms are sorted, the postings of terms[i] are postings_docs/postings_tf[offsets[i]:offsets[i + 1]].
+    """
+
+    def __init__(self, video_ids, titles, terms, offsets, postings_docs, postings_tf, doc_lengths):
+        self.video_ids = video_ids
+        self.titles = titles
+        self.terms = terms
+        self.offsets = offsets
+        self.postings_docs = postings_docs
+        self.postings_tf = postings_tf
+        self.doc_lengths = doc_lengths
+
+    @classmethod
+    def build(cls, video_ids, titles):
+        """
+        Indexes the given videos.
+        """
+        terms, docs, tfs = [], [], []
+        doc_lengths = np.zeros(len(titles), dtype=np.int32)
+        for doc, title in enumerate(titles):
+            words = tokenize(title)
+            doc_lengths[doc] = len(words)
+            for term, tf in Counter(words).items():
+                terms.append(term)
+                docs.append(doc)
+                tfs.append(tf)
+
+        terms = np.array(terms, dtype=str)
+        docs = np.array(docs, dtype=np.int32)
+        order = np.lexsort((docs, terms))  # by term, then by document
+        vocabulary, starts = np.unique(terms[order], return_index=True)
+        return cls(
+            video_ids=np.array(video_ids, dtype=str),
+            titles=np.array(titles, dtype=str),
+            terms=vocabulary,
+            offsets=np.append(starts, len(order)).astype(np.int64),
+            postings_docs=docs[order],
+            postings_tf=np.array(tfs, dtype=np.uint16)[order],
+            doc_lengths=doc_lengths
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(**{name: data[name] for name in data.files})
+
+    def save(self, path):
+        """
+        Writes the segment (compressed) to a temporary file and renames it into place.
+        """
+        tmp_path = f"{path}.tmp.npz"
+        np.savez_compressed(tmp_path, video_ids=self.video_ids, titles=self.titles, terms=self.terms,
+                            offsets=self.offsets, postings_docs=self.postings_docs,
+                            postings_tf=self.postings_tf, doc_lengths=self.doc_lengths)
+        os.replace(tmp_path, path)
+
+    def postings(self, term):
+        """
+        Returns the documents containing the term and the term frequencies (empty arrays if it does not occur).
+        """
+        position = np.searchsorted(self.terms, term)
+        if position == len(self.terms) or self.terms[position] != term:
+            return self.postings_docs[:0], self.postings_tf[:0]
+        start, end = self.offsets[position], self.offsets[position + 1]
+        return self.postings_docs[start:end], self.postings_tf[start:end]
+
+class TitleSearchIndex:
+    """
+    BM25 search over all segments of the persisted title index.
+    """
+
+    def __init__(self, index_dir=INDEX_DIR):
+        """
+        Opens the index in index_dir (an empty index if it does not exist yet).
+        """
+        self.index_dir = index_dir
+        self.segment_files = []
+        manifest_path = os.path.join(index_dir, MANIFEST_FILE)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r') as f:
+                self.segment_files = json.load(f)['segments']
+        self.segments = [Segment.load(os.path.join(index_dir, name)) for name in self.segment_files]
+
+    def indexed_video_ids(self):
+        """
+        Returns the set of video IDs that are already indexed.
+        """
+        return {video_id for segment in self.segments for video_id in segment.video_ids}
+
+    def new_videos(self, df):
+        """
+        The videos of df (columns video_id and title) that are not in the index yet, every video once.
+        """
+        videos = df[['video_id', 'title']].drop_duplicates(subset=['video_id'])
+        return videos[~videos['video_id'].astype(str).isin(self.indexed_video_ids())]
+
+    def extend(self, df):
+        """
+        Indexes the videos of df that are not in the index yet as a segment in memory, without writing anything
+        (for readers of an index the pipeline has not updated yet). Returns the number of videos indexed in memory.
+        """
+        videos = self.new_videos(df)
+        if not videos.empty:
+            self.segments.append(Segment.build(videos['video_id'].astype(str).tolist(), videos['title'].astype(str).tolist()))
+        return len(videos)
+
+    def update(self, df):
+        """
+        Indexes the videos of df (columns video_id and title) that are not in the index yet and saves the index.
+        Returns the number of newly indexed videos.
+        """
+        videos = self.new_videos(df)
+        if videos.empty:
+            return 0
+
+        os.makedirs(self.index_dir, exist_ok=True)
+        new_segment = Segment.build(videos['video_id'].astype(str).tolist(), videos['title'].astype(str).tolist())
+        if len(self.segments) + 1 > MAX_SEGMENTS:
+            # Merge everything into one segment
+            new_segment = Segment.build(
+                np.concatenate([segment.video_ids for segment in self.segments] + [new_segment.video_ids]).tolist(),
+                np.concatenate([segment.titles for segment in self.segments] + [new_segment.titles]).tolist()
+            )
+            old_files = self.segment_files
+            self.segments, self.segment_files = [], []
+        else:
+            old_files = []
+
+        number = max([int(name.split('-')[1].split('.')[0]) for name in self.segment_files + old_files] + [0]) + 1
+        name = f"segment-{number:06d}.npz"
+        new_segment.save(os.path.join(self.index_dir, name))
+        self.segments.append(new_segment)
+        self.segment_files.append(name)
+        self.save_manifest()
+        for old_name in old_files:
+            os.remove(os.path.join(self.index_dir, old_name))
+
+        logging.info(f"Indexed {len(videos)} new video titles ({len(self.segments)} segments)")
+        return len(videos)
+
+    def save_manifest(self):
+        """
+        Writes the list of segments; the manifest is replaced atomically so readers always see a complete index.
+        """
+        manifest_path = os.path.join(self.index_dir, MANIFEST_FILE)
+        with open(f"{manifest_path}.tmp", 'w') as f:
+            json.dump({'segments': self.segment_files}, f)
+        os.replace(f"{manifest_path}.tmp", manifest_path)
+
+    def search(self, query, k=20):
+        """
+        Returns the k best matching videos for the query as a DataFrame with video_id, title and score.
+        """
+        words = list(dict.fromkeys(tokenize(query)))
+        columns = ['video_id', 'title', 'score']
+        if not words or not self.segments:
+            return pd.DataFrame(columns=columns)
+
+        # Collection statistics over all segments
+        total_docs = sum(len(segment.doc_lengths) for segment in self.segments)
+        average_length = sum(int(segment.doc_lengths.sum()) for segment in self.segments) / total_docs
+        postings = {word: [segment.postings(word) for segment in self.segments] for word in words}
+        idf = {
+            word: np.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+            for word, df in ((word, sum(len(docs) for docs, _ in postings[word])) for word in words)
+        }
+
+        results = []
+        for number, segment in enumerate(self.segments):
+            docs = np.concatenate([postings[word][number][0] for word in words])
+            if not len(docs):
+                continue
+            tf = np.concatenate([postings[word][number][1] for word in words]).astype(np.float32)
+            weights = np.concatenate([np.full(len(postings[word][number][0]), idf[word], dtype=np.float32) for word in words])
+            lengths = segment.doc_lengths[docs]
+            contributions = weights * tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * lengths / average_length))
+
+            if len(docs) > len(segment.doc_lengths) // DENSE_SCORING_RATIO:
+                # Frequent words: add up the scores in one array over all documents of the segment
+                scores = np.bincount(docs, weights=contributions, minlength=len(segment.doc_lengths))
+                candidates = np.flatnonzero(scores)
+                scores = scores[candidates]
+            else:
+                # Rare words: add up the scores of the matching documents only
+                candidates, inverse = np.unique(docs, return_inverse=True)
+                scores = np.bincount(inverse, weights=contributions)
+            best = np.argpartition(-scores, k - 1)[:k] if len(scores) > k else np.arange(len(scores))
+            results.append(pd.DataFrame({
+                'video_id': segment.video_ids[candidates[best]],
+                'title': segment.titles[candidates[best]],
+                'score': scores[best]
+            }))
+
+        if not results:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(results, ignore_index=True).nlargest(k, 'score').reset_index(drop=True)
+
+def search_titles(query, k=20, index_dir=INDEX_DIR):
+    """
+    Searches the persisted title index, see TitleSearchIndex.search.
+    """
+    return TitleSearchIndex(index_dir).search(query, k)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if sys.argv[1:] == ['build']:
+        from video_store import read_videos
+        TitleSearchIndex().update(read_videos('all_videos_data', columns=['video_id', 'title']))
+    elif len(sys.argv) == 2:
+        print(search_titles(sys.argv[1]).to_string(index=False))
+    else:
+        print('Usage: python title_search.py build | python title_search.py "query"')
@@ -0,0 +1,183 @@
+# Ingestion of uploaded video files into the data store
+# This code is used by the Update Analysis page of the dashboard (dashboard_pages/update_analysis.py)
+
+import os # required for the file and directory operations
+import time # required for the age of the staged uploads
+import glob # required for finding old staged uploads
+import uuid # required for the names of the staged uploads
+import logging # required for logging messages
+import numpy as np # required for the hashes of the video IDs
+import pandas as pd # required for parsing the upload in chunks
+import pyarrow.parquet as pq # required for the staged upload
+from video_store import VideoSink, MAIN_DATA_FILE, arrow_table # required for the canonical data file and its types
+from video_schema import coerce_videos, REQUIRED_COLUMNS # required for validating the upload
+from pipeline import PIPELINE_DIR, CHUNK_SIZE, chunk_schema, read_chunks, write_chunks, run_pipeline # required for the chunked rewrite and the transform pipeline
+
+"""
+Upload Ingestion
+
+Merges an uploaded CSV file of videos into youtube_data/all_videos_data, the file the fetcher writes to,
+instead of only into the DataFrame of one dashboard session:
+1. stage(): the upload is parsed in chunks of CHUNK_SIZE rows with the text columns read as text, every chunk is
+   validated and typed by video_schema.coerce_videos (one vectorized pass per column) and written to a staged
+   Parquet file. A file with missing columns or invalid values is rejected before anything is changed.
+2. ingest(): the canonical file is rewritten chunk by chunk. With mode 'combine' (an upsert) the stored rows are
+   hash-joined with the upload on the 64-bit hashes of their video IDs: a stored row of the same keyword and
+   video as an uploaded row is replaced by it, the other rows of an uploaded video (found by other keywords) get
+   its uploaded view, like and comment counts, and uploaded rows that are not stored yet are added.
+   With mode 'replace' the upload replaces all stored rows. Then the transform pipeline updates
+   videos_with_relevance, which gives it a new dataset version, so every page and every cache of the
+   dashboard picks up the merged data on its next run.
+Within the upload the last row of a keyword and video wins. Columns other than those of the fetched data
+(engagement_rate, relevance_score, ...) are ignored, the pipeline computes them.
+"""
+
+UPLOAD_DIR = os.path.join(PIPELINE_DIR, 'uploads')  # Staged uploads waiting to be ingested
+STAGED_MAX_AGE = 24 * 3600  # Seconds after which a staged upload that was never ingested is removed
+TEXT_COLUMNS = ['keyword', 'category', 'video_id', 'title']  # Columns parsed as text, never as numbers
+STATISTICS_COLUMNS = ['view_count', 'like_count', 'comment_count']  # Counts shared by all rows of a video
+RAW_DATASET = os.path.splitext(MAIN_DATA_FILE)[0]  # Dataset the uploads are merged into
+
+def video_hashes(video_ids):
+    """
+    64-bit hash of every video ID (vectorized), the key of the hash join.
+    """
+    return pd.util.hash_array(np.asarray(video_ids, dtype=str).astype(object))
+
+def row_hashes(df):
+    """
+    64-bit hash of the keyword and video of every row.
+    """
+    return pd.util.hash_pandas_object(df[['keyword', 'video_id']].astype(str), index=False).to_numpy()
+
+class UploadIngester:
+    """
+    Validates an uploaded CSV file into a staged copy and merges the staged copy into the data store.
+    """
+
+    def __init__(self, upload_dir=UPLOAD_DIR):
+        self.upload_dir = upload_dir
+        self.path = None
+        self.rows = 0
+
+    def stage(self, file):
+        """
+        Parses and validates the upload (a path or a file object) chunk by chunk and writes it to the staged file.
+        Raises ValueError with the rows of the first invalid chunk. Returns the number of staged rows.
+        """
+        os.makedirs(self.upload_dir, exist_ok=True)
+        for old_path in glob.glob(os.path.join(self.upload_dir, 'upload-*')):
+            if time.time() - os.path.getmtime(old_path) > STAGED_MAX_AGE:
+                os.remove(old_path)  # left behind by a dashboard session that was closed
+        self.discard()
+        self.path = os.path.join(self.upload_dir, f"upload-{uuid.uuid4().hex}.parquet")
+        self.rows = 0
+        writer = None
+        try:
+            chunks = pd.read_csv(file, chunksize=CHUNK_SIZE, dtype={column: str for column in TEXT_COLUMNS})
+            for chunk in chunks:
+                try:
+                    chunk = coerce_videos(chunk, required=REQUIRED_COLUMNS)[REQUIRED_COLUMNS]
+                except ValueError as e:
+                    raise ValueError(f"Rows {self.rows + 1}-{self.rows + len(chunk)}: {str(e)}")
+                table = arrow_table(chunk)
+                if writer is None:
+                    writer = pq.ParquetWriter(f"{self.path}.tmp", chunk_schema(table.schema), compression='zstd')
+                writer.write_table(table.cast(writer.schema))
+                self.rows += len(chunk)
+            if writer is None:
+                raise ValueError("The file contains no videos")
+            writer.close()
+            os.replace(f"{self.path}.tmp", self.path)
+        except Exception as e:
+            logging.error(f"Error staging the upload: {str(e)}")
+            if writer is not None:
+                writer.close()
+            if os.path.exists(f"{self.path}.tmp"):
+                os.remove(f"{self.path}.tmp")
+            self.path = None
+            raise
+        logging.info(f"Staged {self.rows} uploaded rows in {self.path}")
+        return self.rows
+
+    def discard(self):
+        """
+        Removes the staged upload without ingesting it.
+        """
+        if self.path is not None and os.path.exists(self.path):
+            os.remove(self.path)
+        self.path = None
+
+    def staged(self):
+        """
+        The staged upload as a typed DataFrame.
+        """
+        return coerce_videos(pq.read_table(self.path).to_pandas())
+
+    def staged_chunks(self):
+        """
+        Streams the staged upload, without the rows whose keyword and video appear again later in the upload.
+        """
+        staged = pq.ParquetFile(self.path)
+        keys = np.concatenate([
+            row_hashes(batch.to_pandas())
+            for batch in staged.iter_batches(batch_size=CHUNK_SIZE, columns=['keyword', 'video_id'])
+        ])
+        keep = ~pd.Index(keys).duplicated(keep='last')
+        start = 0
+        for batch in staged.iter_batches(batch_size=CHUNK_SIZE):
+            chunk = batch.to_pandas()
+            yield chunk[keep[start:start + len(chunk)]]
+            start += len(chunk)
+
+    def ingest(self, mode='combine'):
+        """
+        Merges the staged upload into the canonical data file (mode 'combine' or 'replace', see above), runs the
+        transform pipeline and removes the staged file.
+        Returns the number of uploaded rows that were added (not replacing a stored row), the number of stored rows
+        the upload replaced and the number of stored rows that got its counts.
+        """
+        if self.path is None:
+            raise ValueError("No staged upload to ingest")
+        try:
+            VideoSink().compact()  # rows of pending segments must not be lost or win over the upload
+            # Only the hashes and the counts of the upload are kept in memory, its rows are streamed
+            uploaded_rows, statistics = [], []
+            for chunk in self.staged_chunks():
+                uploaded_rows.append(row_hashes(chunk))
+                statistics.append(chunk[STATISTICS_COLUMNS].set_axis(video_hashes(chunk['video_id'])))
+            uploaded_rows = pd.Index(np.unique(np.concatenate(uploaded_rows)))
+            # The counts of every uploaded video (of its last row), by the hash of its ID
+            statistics = pd.concat(statistics)
+            statistics = statistics[~statistics.index.duplicated(keep='last')]
+            replaced, updated = 0, 0
+            matched_rows = []  # hashes of the uploaded rows that replaced a stored row
+
+            def merged_chunks():
+                nonlocal replaced, updated
+                if mode == 'combine':
+                    for chunk in read_chunks(RAW_DATASET):
+                        chunk = chunk[REQUIRED_COLUMNS].reset_index(drop=True)
+                        stored_rows = row_hashes(chunk)
+                        is_replaced = pd.Index(stored_rows).isin(uploaded_rows)
+                        matched_rows.append(stored_rows[is_replaced])
+                        chunk = chunk[~is_replaced].reset_index(drop=True)
+                        new_counts = statistics.reindex(video_hashes(chunk['video_id'])).set_axis(chunk.index)
+                        found = new_counts['view_count'].notna()
+                        for column in STATISTICS_COLUMNS:
+                            chunk[column] = new_counts[column].fillna(chunk[column])
+                        replaced += int(is_replaced.sum())
+                        updated += int(found.sum())
+                        yield chunk
+                yield from self.staged_chunks()
+
+            rows = write_chunks(RAW_DATASET, merged_chunks())
+            inserted = len(uploaded_rows) - len(np.unique(np.concatenate(matched_rows or [np.empty(0, dtype=np.uint64)])))
+            logging.info(f"Ingested {len(uploaded_rows)} uploaded rows ({mode}): {inserted} rows added, "
+                         f"{replaced} stored rows replaced, {updated} stored rows updated, {rows} rows stored")
+            self.discard()
+        except Exception as e:
+            logging.error(f"Error ingesting the upload: {str(e)}")
+            raise
+        run_pipeline()
+        return inserted, replaced, updated
@@ -0,0 +1,131 @@
+# Schema of the video data
+# Shared by youtube_data_fetcher.py, video_store.py and dashboard.py so that every file and every
+# loaded DataFrame uses the same compact column types
+
+import numpy as np # required for the integer ranges of the declared types
+import pandas as pd # required for the dtype conversions
+import logging # required for logging messages
+
+"""
+Video Schema
+
+Declares the column types of the video data:
+- text columns with many repeated values (keyword, category, the title of a video found by several keywords, ...)
+  are stored as categoricals, so every distinct string is kept only once
+- counters are stored as 32-bit integers and durations as int32 seconds
+- rates and scores are stored as float32
+coerce_videos() validates and converts a DataFrame to this schema in a single pass over its columns.
+add_derived_columns() adds the date and duration columns the dashboard pages group by, once at load time.
+"""
+
+# Text columns stored as pandas categoricals (dictionary-encoded in the Parquet files)
+CATEGORY_COLUMNS = ['keyword', 'category', 'video_id', 'title', 'duration_formatted', 'relevance_category']
+
+# Categorical columns with an almost unique value per video: a dictionary saves nothing for them and only adds
+# its indices, so they are written to the Parquet files as plain strings (and are categoricals again when loaded)
+PLAIN_TEXT_COLUMNS = ['video_id', 'title']
+
+# Counter columns and their compact integer type (widened to int64 if a value does not fit)
+INTEGER_COLUMNS = {
+    'duration_seconds': 'int32',
+    'view_count': 'int32',
+    'like_count': 'int32',
+    'comment_count': 'int32'
+}
+
+# Rate and score columns, two decimals in the CSV files so float32 is precise enough
+FLOAT_COLUMNS = {
+    'engagement_rate': 'float32',
+    'relevance_score': 'float32'
+}
+
+# Timestamp columns, stored in UTC without time zone
+DATETIME_COLUMNS = ['published_date']
+
+# Columns every video file has (the ones written by youtube_data_fetcher.py)
+REQUIRED_COLUMNS = [
+    'keyword', 'category', 'video_id', 'title', 'published_date',
+    'duration_seconds', 'view_count', 'like_count', 'comment_count'
+]
+
+# Columns computed from published_date and duration_seconds when the data is loaded
+DERIVED_COLUMNS = ['year', 'month', 'weekday', 'hour', 'duration_bucket']
+
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Duration buckets as used by the YouTube search filters (upper bound in seconds, label)
+DURATION_BUCKETS = [
+    (4 * 60, 'Short (< 4 min)'),
+    (20 * 60, 'Medium (4-20 min)'),
+    (float('inf'), 'Long (> 20 min)')
+]
+
+def coerce_column(name, values):
+    """
+    Validates one column and converts it to its declared type.
+    Raises ValueError if the column contains values that cannot be converted.
+    Columns that are not part of the schema are returned unchanged.
+    """
+    if name in CATEGORY_COLUMNS:
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            return values
+        return values.astype('category')
+
+    if name in INTEGER_COLUMNS:
+        numbers = pd.to_numeric(values, errors='coerce')
+        if numbers.isna().any():
+            raise ValueError(f"Column '{name}' contains missing or non-numeric values")
+        if (numbers < 0).any():
+            raise ValueError(f"Column '{name}' contains negative values")
+        dtype = np.dtype(INTEGER_COLUMNS[name])
+        if len(numbers) and numbers.max() > np.iinfo(dtype).max:
+            logging.warning(f"Column '{name}' does not fit into {dtype}, keeping it as int64")
+            dtype = np.dtype('int64')
+        return numbers.round().astype(dtype)
+
+    if name in FLOAT_COLUMNS:
+        numbers = pd.to_numeric(values, errors='coerce')
+        if numbers.isna().sum() > values.isna().sum():
+            raise ValueError(f"Column '{name}' contains non-numeric values")
+        return numbers.astype(FLOAT_COLUMNS[name])
+
+    if name in DATETIME_COLUMNS:
+        if pd.api.types.is_datetime64_dtype(values):
+            return values
+        try:
+            return pd.to_datetime(values, utc=True, format='ISO8601').dt.tz_localize(None)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Column '{name}' contains invalid dates: {str(e)}")
+
+    return values
+
+def coerce_videos(df, required=REQUIRED_COLUMNS):
+    """
+    Validates a video DataFrame and converts all known columns to the declared schema in one pass.
+    Raises ValueError if a required column is missing or a column has invalid values.
+    Pass required=[] when only a projection of the columns was loaded.
+    """
+    missing = [column for column in required if column not in df.columns]
+    if missing:
+        raise ValueError(f"Video data is missing the columns: {', '.join(missing)}")
+    return pd.DataFrame({column: coerce_column(column, df[column]) for column in df.columns}, index=df.index)
+
+def add_derived_columns(df):
+    """
+    Returns a new DataFrame with the DERIVED_COLUMNS added:
+    year, month (monthly period), weekday (ordered categorical), hour of publication and duration bucket.
+    They are computed once when the data is loaded, so the pages never have to add columns to the shared frame.
+    """
+    published = df['published_date'].dt
+    derived = pd.DataFrame({
+        'year': published.year.astype('int16'),
+        'month': published.to_period('M'),
+        'weekday': pd.Categorical(published.day_name(), categories=WEEKDAYS, ordered=True),
+        'hour': published.hour.astype('int8'),
+        'duration_bucket': pd.cut(
+            df['duration_seconds'],
+            bins=[-1] + [upper for upper, _ in DURATION_BUCKETS],
+            labels=[label for _, label in DURATION_BUCKETS]
+        )
+    }, index=df.index)
+    return pd.concat([df, derived], axis=1)
@@ -0,0 +1,236 @@
+# Storage for the fetched video data
+# This code is used by youtube_data_fetcher.py (Step 1 of the project as described in the README.md)
+
+import os # required for the file and directory operations
+import glob # required for finding the segment files
+import sys # required for the command line interface of the converter
+import pandas as pd # required for reading and writing the data files
+import pyarrow as pa # required for converting DataFrames into typed Arrow tables
+import pyarrow.parquet as pq # required for the columnar Parquet files
+import logging # required for logging messages
+from video_schema import coerce_videos, REQUIRED_COLUMNS, PLAIN_TEXT_COLUMNS # required for the shared column types
+
+"""
+Video Store
+
+Append-only storage for the video data fetched from YouTube.
+Instead of rewriting youtube_data/all_videos_data.csv after every keyword, the fetcher appends the new rows
+of each keyword as a small segment file. A compaction step later merges the segments into the canonical file.
+
+Next to every CSV file a typed Parquet copy is kept. It uses the column types declared in video_schema.py,
+with keyword/category as dictionary-encoded columns and published_date as a native timestamp, so the dashboard can load only the columns and rows it needs
+without parsing text. Existing CSV files are converted with:
+    python video_store.py convert
+"""
+
+DATA_DIR = 'youtube_data'  # Directory that holds the data files
+MAIN_DATA_FILE = 'all_videos_data.csv'  # Canonical file with all fetched videos
+SEGMENT_DIR = 'segments'  # Sub-directory of DATA_DIR for the not yet compacted segments
+DATASETS = ['all_videos_data', 'cleaned_videos_data', 'videos_with_relevance']  # Data files kept in DATA_DIR
+ROW_GROUP_SIZE = 2048  # Rows per Parquet row group, small groups let filters skip more data
+RAW_DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'  # Dates in the raw CSV files, as the YouTube API returns them (UTC)
+RAW_CSV_TYPES = {'duration_seconds': 'float64'}  # Columns the raw CSV files store with another type than video_schema.py
+
+def atomic_write_csv(df, path):
+    """
+    Writes a DataFrame to a raw CSV file (all_videos_data.csv or a segment) so that the file is either completely
+    written or not there at all. The data is written to a temporary file first, flushed to disk and then renamed
+    over the target, so a crash in the middle of a write never leaves a half-written file behind.
+    Dates and types are written as the fetcher wrote the file originally (RAW_DATE_FORMAT, RAW_CSV_TYPES), so a
+    rewrite does not change the rows that did not change.
+    """
+    df = df.astype({column: dtype for column, dtype in RAW_CSV_TYPES.items() if column in df.columns})
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', newline='') as f:
+        df.to_csv(f, index=False, date_format=RAW_DATE_FORMAT)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def parquet_path(csv_path):
+    """
+    Returns the path of the Parquet copy of a CSV data file.
+    """
+    return os.path.splitext(csv_path)[0] + '.parquet'
+
+def arrow_table(df):
+    """
+    Converts an already typed DataFrame into an Arrow table for a Parquet file: categorical columns become
+    dictionary-encoded, except the PLAIN_TEXT_COLUMNS, which become plain strings.
+    """
+    plain = {column: 'object' for column in PLAIN_TEXT_COLUMNS if column in df.columns}
+    return pa.Table.from_pandas(df.astype(plain), preserve_index=False)
+
+def to_columnar(df):
+    """
+    Converts a video DataFrame into a typed Arrow table with the column types of video_schema.py.
+    Categorical columns become dictionary-encoded (video_id and title plain strings), published_date becomes
+    a native timestamp (in UTC, without time zone like in the cleaned CSV files).
+    """
+    return arrow_table(coerce_videos(df))
+
+def atomic_write_parquet(df, path):
+    """
+    Writes a DataFrame as a typed Parquet file with the same temporary file and rename as atomic_write_csv.
+    """
+    tmp_path = f"{path}.tmp"
+    pq.write_table(to_columnar(df), tmp_path, row_group_size=ROW_GROUP_SIZE, compression='zstd')
+    os.replace(tmp_path, path)
+
+def read_videos(name, columns=None, filters=None, data_dir=DATA_DIR):
+    """
+    Loads one of the DATASETS from DATA_DIR.
+    The Parquet copy is used when it exists: only the requested columns are read and the filters
+    (pyarrow syntax, e.g. [('category', '==', 'Old')]) are pushed down so row groups that cannot match are skipped.
+    Without a Parquet copy the CSV file is parsed and filtered the slow way.
+    Both copies are always written together, after editing a CSV file by hand run the converter again.
+    The result is validated and has the column types of video_schema.py.
+    """
+    csv_path = os.path.join(data_dir, f"{name}.csv")
+    path = parquet_path(csv_path)
+    if os.path.exists(path):
+        df = pq.read_table(path, columns=columns, filters=filters).to_pandas()
+    else:
+        logging.info(f"No Parquet copy of {csv_path}, reading the CSV file")
+        df = coerce_videos(pd.read_csv(csv_path, usecols=columns), required=[])
+        if filters:
+            df = df[_filter_mask(df, filters)].reset_index(drop=True)
+    return coerce_videos(df, required=[] if columns else REQUIRED_COLUMNS)
+
+def dataset_version(name, data_dir=DATA_DIR):
+    """
+    Returns a fingerprint of the current contents of one of the DATASETS.
+    It changes whenever the file that read_videos() would load is rewritten, so it can be used as a cache key.
+    """
+    csv_path = os.path.join(data_dir, f"{name}.csv")
+    path = parquet_path(csv_path) if os.path.exists(parquet_path(csv_path)) else csv_path
+    stat = os.stat(path)
+    return f"{name}-{stat.st_size}-{stat.st_mtime_ns}"
+
+def _filter_mask(df, filters):
+    """
+    Evaluates simple pyarrow-style filters ([(column, op, value), ...], combined with AND) on a DataFrame.
+    """
+    operators = {
+        '==': lambda s, v: s == v,
+        '!=': lambda s, v: s != v,
+        '<': lambda s, v: s < v,
+        '<=': lambda s, v: s <= v,
+        '>': lambda s, v: s > v,
+        '>=': lambda s, v: s >= v,
+        'in': lambda s, v: s.isin(v),
+        'not in': lambda s, v: ~s.isin(v),
+    }
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in filters:
+        mask &= operators[op](df[column], value)
+    return mask
+
+def convert_csv_files(data_dir=DATA_DIR):
+    """
+    Writes a Parquet copy next to every CSV file of DATASETS that exists in data_dir.
+    """
+    for name in DATASETS:
+        csv_path = os.path.join(data_dir, f"{name}.csv")
+        if not os.path.exists(csv_path):
+            continue
+        atomic_write_parquet(pd.read_csv(csv_path), parquet_path(csv_path))
+        logging.info(f"Converted {csv_path} to {parquet_path(csv_path)}")
+
+class VideoSink:
+    """
+    Append-only sink for fetched video rows.
+    Every call to append() writes one new segment file, compact() merges all segments into the canonical file.
+    """
+
+    def __init__(self, data_dir=DATA_DIR):
+        """
+        Sets up the paths of the canonical data file and the segment directory.
+        Temporary files left behind by a crash are removed, complete segments are kept for the next compaction.
+        """
+        self.data_file = os.path.join(data_dir, MAIN_DATA_FILE)
+        self.segment_dir = os.path.join(data_dir, SEGMENT_DIR)
+        os.makedirs(self.segment_dir, exist_ok=True)
+        for tmp_path in glob.glob(os.path.join(self.segment_dir, '*.tmp')):
+            os.remove(tmp_path)
+
+    def segments(self):
+        """
+        Returns the paths of all complete segments in the order they were written.
+        """
+        return sorted(glob.glob(os.path.join(self.segment_dir, '*.csv')))
+
+    def append(self, rows):
+        """
+        Appends the rows of one keyword as a new segment.
+        Only the new rows are written, so the cost of an append does not grow with the size of the dataset.
+        The rows are validated against video_schema.py before anything is written.
+        """
+        segments = self.segments()
+        next_number = int(os.path.basename(segments[-1]).split('.')[0]) + 1 if segments else 0
+        segment_path = os.path.join(self.segment_dir, f"{next_number:06d}.csv")
+        atomic_write_csv(coerce_videos(pd.DataFrame(rows)), segment_path)
+        logging.info(f"Appended {len(rows)} rows as segment {os.path.basename(segment_path)}")
+        return segment_path
+
+    def compact(self):
+        """
+        Merges all segments into the canonical data file and removes them.
+        A keyword that was fetched again (a stale keyword, or after a crash before the progress was recorded)
+        replaces all earlier rows of that keyword, and within the segments the last row of a keyword and video wins.
+        Returns the merged data.
+        """
+        segments = self.segments()
+        frames = []
+        if os.path.exists(self.data_file):
+            frames.append(pd.read_csv(self.data_file))
+        new_rows = [pd.read_csv(path) for path in segments]
+        if frames and new_rows:
+            fetched_again = set().union(*(set(rows['keyword']) for rows in new_rows))
+            frames[0] = frames[0][~frames[0]['keyword'].isin(fetched_again)]
+        frames.extend(new_rows)
+        if not frames:
+            return pd.DataFrame()
+        all_data = pd.concat(frames, ignore_index=True)
+        if not segments:
+            return coerce_videos(all_data)
+
+        all_data = all_data.drop_duplicates(subset=['keyword', 'video_id'], keep='last')
+        all_data = all_data.reset_index(drop=True)
+        all_data = coerce_videos(all_data)
+        atomic_write_csv(all_data, self.data_file)
+        atomic_write_parquet(all_data, parquet_path(self.data_file))
+        for path in segments:
+            os.remove(path)
+        logging.info(f"Compacted {len(segments)} segments into {self.data_file} ({len(all_data)} rows)")
+        return all_data
+
+    def update_statistics(self, statistics):
+        """
+        Replaces the view, like and comment counts in the canonical data file with newer values.
+        statistics is indexed by video_id and has the columns view_count, like_count and comment_count;
+        every row of a video (one per keyword that found it) gets the new counts. Returns the number of updated rows.
+        Segments are compacted first so no new row is left with old counts.
+        """
+        all_data = self.compact()
+        if all_data.empty:
+            return 0
+        all_data = all_data.reset_index(drop=True)
+        columns = ['view_count', 'like_count', 'comment_count']
+        new_values = statistics[columns].reindex(all_data['video_id'].astype(str))
+        new_values = new_values.set_axis(all_data.index)
+        found = new_values['view_count'].notna()
+        for column in columns:
+            all_data[column] = new_values[column].fillna(all_data[column])
+        all_data = coerce_videos(all_data)
+        atomic_write_csv(all_data, self.data_file)
+        atomic_write_parquet(all_data, parquet_path(self.data_file))
+        logging.info(f"Updated the statistics of {int(found.sum())} rows in {self.data_file}")
+        return int(found.sum())
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if sys.argv[1:] == ['convert']:
+        convert_csv_files()
+    else:
+        print("Usage: python video_store.py convert")
@@ -0,0 +1,165 @@
+# Normalized storage of the video data: one row per video, one row per keyword and a link table between them
+# This code is used by pipeline.py (to write the tables), aggregates.py and dashboard.py (to count every video once)
+
+import os # required for the file and directory operations
+import json # required for the manifest of the tables
+import logging # required for logging messages
+import numpy as np # required for the surrogate keys
+import pandas as pd # required for the tables
+import pyarrow.parquet as pq # required for the Parquet files of the tables
+from video_store import DATA_DIR, ROW_GROUP_SIZE, arrow_table, dataset_version, read_videos # required for the source dataset
+from video_schema import coerce_videos # required for the column types of the tables
+
+"""
+Video Tables
+
+The video files have one row per keyword and video, so a video found by several keywords repeats its title,
+dates and statistics once per keyword, and a sum over the rows counts its views several times.
+The normalized tables store every fact once, with integer surrogate keys:
+- videos:   video_key, video_id, title, published_date, duration and statistics (one row per video)
+- keywords: keyword_key, keyword, category (one row per keyword)
+- links:    keyword_key, video_key and the columns that belong to the pair (relevance_score, relevance_category)
+They are written to youtube_data/normalized/ by pipeline.py after every run; readers like the dashboard never
+write them and build the tables in memory while the stored ones are older than the dataset. A video that was fetched by several
+keywords at different times keeps the statistics of its latest fetch (the highest view count).
+
+The dedup-aware helpers count every video once per group: video_totals() sums the metrics of the distinct
+videos of every category (or keyword, or of all videos), and group_videos() returns those distinct
+(group, video) pairs for other aggregations.
+"""
+
+NORMALIZED_DIR = os.path.join(DATA_DIR, 'normalized')  # Directory of the normalized tables
+MANIFEST_FILE = 'manifest.json'  # Version of the dataset the tables were built from
+VIDEO_COLUMNS = ['video_id', 'title', 'published_date', 'duration_seconds', 'view_count', 'like_count',
+                 'comment_count', 'duration_formatted', 'engagement_rate']  # Columns that belong to a video
+KEYWORD_COLUMNS = ['keyword', 'category']  # Columns that belong to a keyword
+LINK_COLUMNS = ['relevance_score', 'relevance_category']  # Columns that belong to a keyword-video pair
+TABLES = ['videos', 'keywords', 'links']  # Files of the normalized store
+METRICS = ['view_count', 'like_count', 'comment_count']  # Statistics summed by video_totals()
+
+class VideoTables:
+    """
+    The videos, keywords and links tables of one dataset.
+    """
+
+    def __init__(self, videos, keywords, links):
+        self.videos = videos
+        self.keywords = keywords
+        self.links = links
+
+    @classmethod
+    def build(cls, df):
+        """
+        Normalizes keyword-video rows (like videos_with_relevance.csv) into the three tables.
+        """
+        df = df.reset_index(drop=True)
+
+        # One row per video, the statistics of the row with the highest view count (the latest fetch)
+        video_columns = [column for column in VIDEO_COLUMNS if column in df.columns]
+        latest = df.sort_values('view_count', ascending=False, kind='stable') if 'view_count' in df.columns else df
+        videos = latest[video_columns].drop_duplicates(subset=['video_id']).sort_values('video_id', kind='stable')
+        videos = videos.reset_index(drop=True)
+        videos.insert(0, 'video_key', np.arange(len(videos), dtype=np.int32))
+
+        keywords = df[KEYWORD_COLUMNS].drop_duplicates(subset=['keyword']).sort_values('keyword', kind='stable')
+        keywords = keywords.reset_index(drop=True)
+        keywords.insert(0, 'keyword_key', np.arange(len(keywords), dtype=np.int32))
+
+        links = pd.DataFrame({
+            'keyword_key': pd.Index(keywords['keyword'].astype(str)).get_indexer(df['keyword'].astype(str)).astype(np.int32),
+            'video_key': pd.Index(videos['video_id'].astype(str)).get_indexer(df['video_id'].astype(str)).astype(np.int32)
+        })
+        for column in LINK_COLUMNS:
+            if column in df.columns:
+                links[column] = df[column].to_numpy()
+        links = links.drop_duplicates(subset=['keyword_key', 'video_key']).reset_index(drop=True)
+        return cls(coerce_videos(videos, required=[]), coerce_videos(keywords, required=[]), coerce_videos(links, required=[]))
+
+    @classmethod
+    def load(cls, directory=NORMALIZED_DIR):
+        return cls(*(coerce_videos(pq.read_table(os.path.join(directory, f"{name}.parquet")).to_pandas(), required=[])
+                     for name in TABLES))
+
+    def save(self, directory=NORMALIZED_DIR, source_version=None):
+        """
+        Writes the tables (temporary file and rename each) and then the manifest with the source version.
+        """
+        os.makedirs(directory, exist_ok=True)
+        for name in TABLES:
+            path = os.path.join(directory, f"{name}.parquet")
+            table = arrow_table(getattr(self, name))
+            pq.write_table(table, f"{path}.tmp", row_group_size=ROW_GROUP_SIZE, compression='zstd')
+            os.replace(f"{path}.tmp", path)
+        manifest_path = os.path.join(directory, MANIFEST_FILE)
+        with open(f"{manifest_path}.tmp", 'w') as f:
+            json.dump({'source_version': source_version, 'videos': len(self.videos), 'links': len(self.links)}, f)
+        os.replace(f"{manifest_path}.tmp", manifest_path)
+
+    def rows(self):
+        """
+        The keyword-video rows again (the denormalized view).
+        """
+        rows = self.links.join(self.keywords.set_index('keyword_key'), on='keyword_key')
+        rows = rows.join(self.videos.set_index('video_key'), on='video_key')
+        columns = KEYWORD_COLUMNS + [column for column in VIDEO_COLUMNS + LINK_COLUMNS if column in rows.columns]
+        return rows[columns]
+
+    def group_videos(self, by='category'):
+        """
+        The distinct (group, video_key) pairs: every video once per category ('category'), per keyword ('keyword')
+        or once in total (None).
+        """
+        if by is None:
+            return self.videos[['video_key']]
+        pairs = self.links[['keyword_key', 'video_key']].join(self.keywords.set_index('keyword_key')[[by]], on='keyword_key')
+        return pairs[[by, 'video_key']].drop_duplicates().reset_index(drop=True)
+
+    def video_totals(self, by='category', metrics=METRICS):
+        """
+        Number of distinct videos and the sums of their metrics per group (see group_videos), so a video found by
+        several keywords of a category counts once for that category. With by=None a single row for all videos.
+        """
+        pairs = self.group_videos(by).join(self.videos.set_index('video_key')[list(metrics)], on='video_key')
+        values = pairs[list(metrics)].astype('int64')
+        if by is None:
+            totals = values.sum().to_frame().T
+            totals.insert(0, 'video_count', len(pairs))
+            return totals
+        grouped = values.groupby(pairs[by], observed=True)
+        totals = grouped.sum()
+        totals.insert(0, 'video_count', grouped.size())
+        return totals.reset_index()
+
+    def nbytes(self):
+        return sum(int(getattr(self, name).memory_usage(deep=True).sum()) for name in TABLES)
+
+def write_video_tables(name='videos_with_relevance', data_dir=DATA_DIR, directory=NORMALIZED_DIR):
+    """
+    Rebuilds the normalized tables from a dataset if it changed since they were written.
+    Returns True if they were rewritten.
+    """
+    version = dataset_version(name, data_dir)
+    manifest_path = os.path.join(directory, MANIFEST_FILE)
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r') as f:
+            if json.load(f).get('source_version') == version:
+                return False
+    tables = VideoTables.build(read_videos(name, data_dir=data_dir))
+    tables.save(directory, source_version=version)
+    logging.info(f"Wrote the normalized tables: {len(tables.videos)} videos, {len(tables.keywords)} keywords, {len(tables.links)} links")
+    return True
+
+def load_video_tables(name='videos_with_relevance', data_dir=DATA_DIR, directory=NORMALIZED_DIR):
+    """
+    Loads the normalized tables of a dataset without writing anything: the stored tables if they were written from
+    the current version of the dataset, otherwise the tables built from the dataset in memory (the pipeline
+    rewrites the stored ones on its next run).
+    """
+    version = dataset_version(name, data_dir)
+    manifest_path = os.path.join(directory, MANIFEST_FILE)
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r') as f:
+            if json.load(f).get('source_version') == version:
+                return VideoTables.load(directory)
+    logging.info(f"The normalized tables are missing or older than {name}, building them in memory")
+    return VideoTables.build(read_videos(name, data_dir=data_dir))
@@ -2,14 +2,28 @@
 # This code is for Step 1 of the project as described in the README.md
 
 import os # required in this script for the file and directory operations
+import argparse # required for the command line options of main()
 from dotenv import load_dotenv # required for loading environment variables
 import pandas as pd # required for reading data from keywords.csv
+import numpy as np # required for the refresh priorities
 from googleapiclient.discovery import build # it provides a build function to create a service object for interacting with the YouTube Data API v3.
 import json # required for JSON data handling
-from datetime import datetime # required for storing the date and time of the data fetching
+from datetime import datetime, timedelta # required for storing the date and time of the data fetching
 import time # required for waiting between requests
+import random # required for the jitter of the retry delays
+import pytz # required for the Pacific Time reset of the daily quota
+import httplib2 # required for recognizing network errors
+from googleapiclient.errors import HttpError # required for recognizing the API errors that can be retried
 import isodate # required for parsing ISO 8601 formatted dates
+from video_store import VideoSink, read_videos # required for the append-only storage of the fetched videos
+from snapshot_store import append_snapshots, latest_snapshots, video_velocity, compact_partitions # required for the time series of the video statistics
+from title_search import tokenize # required for the words of keywords and titles
+from api_cache import ResponseCache, CachingHttp # required for the on-disk cache of the API responses
+from fetch_catalog import FetchCatalog, CATALOG_FILE # required for the transactional state of the fetcher
+from pipeline import run_pipeline # required for updating the cleaned and relevance data with the fetched rows
 import logging # required for logging messages
+import threading # required for sharing the quota budget and rate limiter between workers
+from concurrent.futures import ThreadPoolExecutor # required for fetching several keywords at once
 
 """
 YouTube Data Fetcher
@@ -29,38 +43,140 @@ logging.basicConfig(
 )
 
 # API configuration
-API_KEY = os.getenv('YOUTUBE_API_KEY') # get API key from environment variables
-if not API_KEY:
-    raise ValueError("YouTube API key not found in environment variables") # raise an error if API key is not found
+API_KEY = os.getenv('YOUTUBE_API_KEY') # get API key from environment variables (checked when the fetcher is created)
 
 # Define budget quota for YouTube API
 QUOTA = {
     'search': 100,    # 100 search requests per day
-    'videos': 1       # Get details for 1 video
+    'videos': 1,      # Get details for 1 video
+    'statistics': 1   # Refresh the statistics of up to 50 videos (one videos().list call with part=statistics)
 }
 DAILY_QUOTA_LIMIT = 10000  # Maximum daily budget
-VIDEOS_PER_KEYWORD = 50    # Number of videos to fetch per keyword
+VIDEOS_PER_KEYWORD = 50    # Number of videos to fetch per search page (maximum allowed by the API)
+DEFAULT_SEARCH_PAGES = 1   # Search pages fetched per keyword unless configured otherwise
+SEARCH_PAGES_PER_GROUP = {  # Search pages per keyword group, a 'pages' column in keywords.csv overrides it per keyword
+    'Old': 1,
+    'Current': 1,
+    'Modern': 1
+}
+RELEVANT_WORD_SHARE = 0.5  # A result is relevant if its title contains at least this share of the keyword's words
+MIN_PAGE_RELEVANCE = 0.3   # Pagination stops when less than this share of a page's results is relevant
 DATA_DIR = 'youtube_data'  # Directory to store results
-STATE_FILE = 'fetch_state.json'  # File to track progress as the script has to be run multiple times
+STATE_FILE = CATALOG_FILE  # SQLite catalog to track progress as the script has to be run multiple times (see fetch_catalog.py)
+MAX_WORKERS = 4            # Number of keywords fetched concurrently (1 = serial)
+REQUESTS_PER_SECOND = 2    # Token-bucket refill rate shared by all workers
+REQUEST_BURST = 4          # Maximum number of API calls allowed in a single burst
+MAX_RETRIES = 5            # Retries of an API call that failed with a transient error
+BACKOFF_BASE_SECONDS = 1.0  # Maximum delay before the first retry, doubled on every further retry
+BACKOFF_MAX_SECONDS = 32.0  # Upper bound of the retry delay
+RETRY_STATUSES = {429, 500, 502, 503, 504}  # HTTP statuses of transient API errors
+RATE_LIMIT_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}  # 403 reasons that are worth retrying
+QUOTA_REASONS = {'quotaExceeded', 'dailyLimitExceeded'}  # 403 reasons meaning the daily quota is used up
+QUOTA_TIMEZONE = pytz.timezone('America/Los_Angeles')  # The daily quota resets at midnight Pacific Time
+STALE_AFTER_DAYS = 30      # Processed keywords are fetched again when their data is older than this
+REFRESH_MIN_AGE_HOURS = 20  # Videos whose statistics are younger than this are not refreshed again
+REFRESH_BATCHES_PER_WRITE = 20  # Statistics requests collected before the snapshots are written
+KEYWORDS_PER_BATCH = 8     # Keywords whose search results are pooled before fetching video details
+IDS_PER_DETAILS_REQUEST = 50  # Maximum number of video IDs the videos().list endpoint accepts per call
+
+def keyword_quota(pages):
+    """
+    Worst-case quota for one keyword: one search per page plus details for every video the pages can return.
+    Reserving this up front is what keeps concurrent runs inside the daily budget.
+    """
+    return pages * (QUOTA['search'] + VIDEOS_PER_KEYWORD * QUOTA['videos'])
+
+def title_relevance(keyword, title):
+    """
+    Share of the words of the keyword that appear in a video title (0 to 1).
+    """
+    keyword_words = set(tokenize(keyword))
+    if not keyword_words:
+        return 1.0
+    return len(keyword_words & set(tokenize(title))) / len(keyword_words)
+
+def next_quota_reset(now):
+    """
+    Time of the next daily quota reset (midnight Pacific Time) after now (a timezone-aware datetime).
+    """
+    local_now = now.astimezone(QUOTA_TIMEZONE)
+    tomorrow = local_now.date() + timedelta(days=1)
+    return QUOTA_TIMEZONE.localize(datetime(tomorrow.year, tomorrow.month, tomorrow.day))
+
+def error_reason(error):
+    """
+    Returns the reason of an API error (e.g. 'quotaExceeded'), or None if it has none.
+    """
+    try:
+        return json.loads(error.content.decode('utf-8'))['error']['errors'][0]['reason']
+    except Exception:
+        return None
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter shared by all fetch workers.
+    Every API call takes one token, tokens refill at `rate` per second up to `capacity`,
+    so a burst of calls is allowed but the long-run rate never exceeds `rate`.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Block until a token is available and take it.
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
 
 class YouTubeDataFetcher:
     """
     Class to handle YouTube data fetching operations.
-    With a state file to track progress as the script has to be run multiple times
+    With a state catalog to track progress as the script has to be run multiple times
 
     """
 
-    def __init__(self):
+    def __init__(self, max_workers=MAX_WORKERS, use_cache=True, replay_only=False, transport=None):
         """
         Initializes the YouTube API client, sets up necessary directories, and 
-        loads the script’s state from a JSON file to track progress across multiple runs.
-
+        opens the script’s state catalog (fetch_catalog.py) to track progress across multiple runs.
+        max_workers controls how many keywords are fetched at once (1 keeps the old serial behaviour).
+        use_cache answers repeated API calls from the on-disk response cache (api_cache.py),
+        replay_only answers every call from the cache and never uses the network.
+        transport is a function returning an httplib2.Http compatible object that replaces the network,
+        e.g. mock_youtube.MockYouTubeApi for running without an API key; it is called once per thread.
         """
         try:
-            self.youtube = build('youtube', 'v3', developerKey=API_KEY)
-            self.quota_used = 0
+            if not API_KEY and transport is None and not replay_only:
+                raise ValueError("YouTube API key not found in environment variables") # raise an error if API key is not found
+            self.transport = transport
+            self.cache = ResponseCache(replay_only=replay_only) if use_cache or replay_only else None
+            self.max_workers = max(1, int(max_workers))
+            self.quota_used = 0       # quota actually spent in this run
+            self.quota_exhausted = False  # set when the API reports that the daily quota is used up
+            self.quota_reserved = 0   # quota promised to keywords that were scheduled
+            self.quota_lock = threading.Lock()
+            self.rate_limiter = TokenBucket(REQUESTS_PER_SECOND, REQUEST_BURST)
+            self.local = threading.local()
+            self.youtube, self.http = self.build_client()
+            self.video_details = {}   # video ID -> details fetched in this run, shared by all keywords
+            self.details_fetched_at = {}  # video ID -> time the API answered its details request
+            self.metrics = {'search_ids': 0, 'details_ids': 0, 'ids_saved_by_dedup': 0, 'details_requests': 0}
             self.ensure_directories()
-            self.state = self.load_state()
+            self.catalog = FetchCatalog(STATE_FILE)
+            self.quota_start = self.load_quota_ledger()  # quota spent today by earlier runs
             logging.info("YouTubeDataFetcher initialized successfully")
         except Exception as e:
             logging.error(f"Error initializing YouTubeDataFetcher: {str(e)}")
@@ -73,8 +189,105 @@ class YouTubeDataFetcher:
         current_balance = 100
         purchase_cost = 50
         can_buy = current_balance >= purchase_cost  # True
+        The balance is what is left of today's quota after the earlier runs of the day.
+        """
+        return not self.quota_exhausted and (self.quota_start + self.quota_used + cost) <= DAILY_QUOTA_LIMIT
+
+    def reserve_quota(self, cost):
+        """
+        Reserve quota for a keyword before it is scheduled.
+        Reservations are made in keywords.csv order and are never handed back during a run,
+        so a serial and a concurrent run always schedule exactly the same keywords.
+        """
+        with self.quota_lock:
+            if self.quota_start + self.quota_reserved + cost > DAILY_QUOTA_LIMIT:
+                return False
+            self.quota_reserved += cost
+            return True
+
+    def load_quota_ledger(self):
+        """
+        Returns the quota already spent today according to the ledger in the catalog.
+        A ledger from before the last reset (midnight Pacific Time) starts over at 0.
+        """
+        ledger = self.catalog.quota_ledger()
+        now = datetime.now(pytz.utc)
+        if not ledger or now >= datetime.fromisoformat(ledger[1]):
+            self.catalog.reset_quota(next_quota_reset(now).isoformat())
+            ledger = self.catalog.quota_ledger()
+        logging.info(f"Quota spent today by earlier runs: {ledger[0]} units (resets at {ledger[1]})")
+        return ledger[0]
+
+    def execute(self, request, description):
+        """
+        Executes an API request. Transient failures (5xx, 429, rate limit errors and network errors) are retried
+        up to MAX_RETRIES times after a random delay between 0 and BACKOFF_BASE_SECONDS * 2^attempt (full jitter),
+        so that workers which failed together do not retry together.
+        A quotaExceeded error is not retried: it marks the quota as used up for the rest of the day.
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                return request.execute()
+            except HttpError as e:
+                reason = error_reason(e)
+                if reason in QUOTA_REASONS:
+                    self.quota_exhausted = True
+                    self.catalog.set_quota_used(DAILY_QUOTA_LIMIT)
+                    raise
+                if (e.resp.status not in RETRY_STATUSES and reason not in RATE_LIMIT_REASONS) or attempt == MAX_RETRIES:
+                    raise
+                error = e
+            except (OSError, httplib2.HttpLib2Error) as e:
+                if attempt == MAX_RETRIES:
+                    raise
+                error = e
+            delay = random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+            logging.warning(f"{description} failed ({str(error)}), retry {attempt + 1} of {MAX_RETRIES} in {delay:.1f}s")
+            time.sleep(delay)
+
+    def record_quota(self, cost):
+        """
+        Add the cost of a finished API call to the quota used in this run (thread-safe)
+        and to the quota ledger in the catalog.
         """
-        return (self.quota_used + cost) <= DAILY_QUOTA_LIMIT
+        with self.quota_lock:
+            self.quota_used += cost
+        if cost:
+            self.catalog.add_quota(cost)
+
+    def build_client(self):
+        """
+        Builds an API client and its transport, which serves cached responses and
+        waits for the rate limiter only before requests that go to the network.
+        """
+        http = CachingHttp(self.cache, http=self.transport() if self.transport else None, rate_limiter=self.rate_limiter)
+        return build('youtube', 'v3', developerKey=API_KEY, http=http), http
+
+    def service(self):
+        """
+        Returns the API client for the current thread.
+        googleapiclient objects are not thread-safe, so every worker thread builds its own client.
+        """
+        if threading.current_thread() is threading.main_thread():
+            return self.youtube
+        if not hasattr(self.local, 'youtube'):
+            self.local.youtube, self.local.http = self.build_client()
+        return self.local.youtube
+
+    def call_cost(self, cost):
+        """
+        Quota cost of the API call the current thread just made: nothing if it was answered from the cache.
+        """
+        http = self.http if threading.current_thread() is threading.main_thread() else self.local.http
+        return 0 if http.from_cache else cost
+
+    def response_time(self):
+        """
+        Time (UTC, whole seconds) the API answered the call the current thread just made, for a cached response
+        the time it was originally fetched, so the counts in it are dated when they were measured.
+        """
+        http = self.http if threading.current_thread() is threading.main_thread() else self.local.http
+        return datetime.utcfromtimestamp(http.response_time).replace(microsecond=0)
 
     def ensure_directories(self):
         """
@@ -87,152 +300,405 @@ class YouTubeDataFetcher:
             logging.error(f"Error creating directory: {str(e)}")
             raise
 
-    def load_state(self):
+    def search_video_ids(self, keyword, max_pages=1):
         """
-        Loads the current state from fetch_state.json, allowing the script to resume progress in subsequent runs.
+        Searches videos for a keyword and returns their IDs in the order of relevance.
+        Follows nextPageToken for up to max_pages pages of VIDEOS_PER_KEYWORD results and stops early
+        when a page has too few results whose title matches the keyword (MIN_PAGE_RELEVANCE).
+        Returns None if the quota is exhausted or a request fails before any video was found.
+        """
+        video_ids = []
+        page_token = None
+        for page in range(max_pages):
+            if not self.can_make_request(QUOTA['search']):
+                logging.warning("Daily quota limit reached")
+                return video_ids or None
+            
+            try:
+                logging.info(f"Searching videos for keyword: {keyword} (page {page + 1})")
+                search_response = self.execute(self.service().search().list(
+                    q=keyword,
+                    part='snippet',
+                    type='video',
+                    maxResults=VIDEOS_PER_KEYWORD,
+                    order='relevance',
+                    pageToken=page_token
+                ), f"Search for '{keyword}'")
+                self.record_quota(self.call_cost(QUOTA['search']))
+            except Exception as e:
+                logging.error(f"Error searching videos for keyword '{keyword}': {str(e)}")
+                return video_ids or None
+            
+            # Extract video IDs (a video can appear again on a later page)
+            items = search_response.get('items', [])
+            for item in items:
+                if item['id']['videoId'] not in video_ids:
+                    video_ids.append(item['id']['videoId'])
+            
+            page_token = search_response.get('nextPageToken')
+            if not page_token:
+                break
+            relevant = sum(title_relevance(keyword, item['snippet']['title']) >= RELEVANT_WORD_SHARE for item in items)
+            if relevant < MIN_PAGE_RELEVANCE * len(items):
+                logging.info(f"Stopping search for '{keyword}' after page {page + 1}: {relevant} of {len(items)} results relevant")
+                break
+        
+        if not video_ids:
+            logging.warning(f"No videos found for keyword: {keyword}")
+        return video_ids
+
+    def fetch_video_details(self, video_ids):
+        """
+        Retrieves snippet, statistics and content details for at most IDS_PER_DETAILS_REQUEST videos
+        with a single videos().list call. Returns a dict from video ID to the API item (None if the request fails).
         """
         try:
-            if os.path.exists(STATE_FILE):
-                with open(STATE_FILE, 'r') as f:
-                    state = json.load(f)
-                logging.info("State file loaded successfully")
-                return state
-            logging.info("No existing state file found, creating new state")
-            return {
-                'last_update': None,
-                'processed_keywords': {}
-            }
+            videos_response = self.execute(self.service().videos().list(
+                id=','.join(video_ids),
+                part='snippet,statistics,contentDetails'
+            ), f"Details request for {len(video_ids)} videos")
+            
+            self.record_quota(self.call_cost(len(video_ids) * QUOTA['videos']))
+            fetched_at = self.response_time()
+            for video in videos_response.get('items', []):
+                self.details_fetched_at[video['id']] = fetched_at
+            return {video['id']: video for video in videos_response.get('items', [])}
+        
         except Exception as e:
-            logging.error(f"Error loading state: {str(e)}")
-            raise
+            logging.error(f"Error fetching details for {len(video_ids)} videos: {str(e)}")
+            return None
 
-    def save_state(self):
+    def fetch_statistics(self, video_ids):
         """
-        Saves the current state to fetch_state.json to track progress across multiple runs.
+        Retrieves only the statistics of at most IDS_PER_DETAILS_REQUEST videos with a single videos().list call,
+        which costs QUOTA['statistics'] for the whole batch. Returns a list of snapshot rows (None if the request fails).
         """
+        if not self.can_make_request(QUOTA['statistics']):
+            logging.warning("Daily quota limit reached")
+            return None
         try:
-            with open(STATE_FILE, 'w') as f:
-                json.dump(self.state, f, indent=2)
-            logging.info("State saved successfully")
+            statistics_response = self.execute(self.service().videos().list(
+                id=','.join(video_ids),
+                part='statistics'
+            ), f"Statistics request for {len(video_ids)} videos")
+            self.record_quota(self.call_cost(QUOTA['statistics']))
+            fetched_at = self.response_time()
+            return [self.snapshot_row(video, fetched_at) for video in statistics_response.get('items', [])]
+        
         except Exception as e:
-            logging.error(f"Error saving state: {str(e)}")
-            raise
+            logging.error(f"Error refreshing statistics of {len(video_ids)} videos: {str(e)}")
+            return None
 
-    def fetch_videos_for_keyword(self, keyword, category):
+    def snapshot_row(self, video, fetched_at):
+        """
+        Converts the statistics of an API item into a snapshot row (see snapshot_store.py).
+        """
+        return {
+            'video_id': video['id'],
+            'fetched_at': fetched_at,
+            'view_count': int(video['statistics'].get('viewCount', 0)),
+            'like_count': int(video['statistics'].get('likeCount', 0)),
+            'comment_count': int(video['statistics'].get('commentCount', 0))
+        }
+
+    def video_row(self, keyword, category, video):
+        """
+        Converts the API item of a video into a row of all_videos_data.csv.
+        Returns None if the item is incomplete.
+        """
+        try:
+            duration = int(isodate.parse_duration(video['contentDetails']['duration']).total_seconds())
+            
+            return {
+                'keyword': keyword,
+                'category': category,
+                'video_id': video['id'],
+                'title': video['snippet']['title'],
+                'published_date': video['snippet']['publishedAt'],
+                'duration_seconds': duration,
+                'view_count': int(video['statistics'].get('viewCount', 0)),
+                'like_count': int(video['statistics'].get('likeCount', 0)),
+                'comment_count': int(video['statistics'].get('commentCount', 0))
+            }
+        except Exception as e:
+            logging.error(f"Error processing video {video.get('id', 'unknown')}: {str(e)}")
+            return None
+
+    def fetch_videos_for_keyword(self, keyword, category, pages=1):
         """
         Fetches video data for a given keyword and category. 
-        It performs a search request to obtain video IDs and then retrieves detailed information for each video, 
+        It performs search requests to obtain video IDs and then retrieves detailed information for each video, 
         such as title, publication date, duration, view count, like count, and comment count.
+        process_keywords() uses the batched fetch_keyword_batch() instead.
         """
-        if not self.can_make_request(QUOTA['search']):
-            logging.warning("Daily quota limit reached")
+        video_ids = self.search_video_ids(keyword, pages)
+        if not video_ids:
             return None
         
+        details = {}
+        for start in range(0, len(video_ids), IDS_PER_DETAILS_REQUEST):
+            chunk_details = self.fetch_video_details(video_ids[start:start + IDS_PER_DETAILS_REQUEST])
+            if chunk_details is None:
+                return None  # incomplete, the keyword is fetched again
+            details.update(chunk_details)
+        rows = [self.video_row(keyword, category, details[video_id]) for video_id in video_ids if video_id in details]
+        return [row for row in rows if row is not None]
+
+    def keyword_priority(self, keyword, processed_keywords):
+        """
+        Scheduling priority of a keyword (lower is fetched first), None if its data is still fresh.
+        Unprocessed keywords come first, then stale keywords ordered by the date they were fetched.
+        processed_keywords is the progress of all keywords from the catalog.
+        """
+        processed = processed_keywords.get(keyword)
+        if processed is None:
+            return (0, '')
+        if datetime.now() - datetime.fromisoformat(processed['processed_date']) > timedelta(days=STALE_AFTER_DAYS):
+            return (1, processed['processed_date'])
+        return None
+
+    def search_pages(self, row):
+        """
+        Number of search pages for a row of keywords.csv: its 'pages' column if set,
+        otherwise the setting of its group in SEARCH_PAGES_PER_GROUP.
+        """
+        if 'pages' in row and pd.notna(row['pages']):
+            return max(1, int(row['pages']))
+        return SEARCH_PAGES_PER_GROUP.get(row['group'], DEFAULT_SEARCH_PAGES)
+
+    def fetch_keyword_batch(self, batch, executor):
+        """
+        Fetches the videos of a batch of (keyword, category, search pages) entries:
+        1. searches all keywords of the batch (concurrently on the executor, so the page requests
+           of different keywords are in flight at the same time)
+        2. collects the video IDs of all keywords and drops duplicates, including IDs whose details were
+           already fetched for an earlier batch of this run
+        3. fetches the details of the remaining IDs in packed requests of IDS_PER_DETAILS_REQUEST IDs
+        4. builds the rows of every keyword from the shared details, so a video found by several keywords
+           is requested once but stored for each of them
+        Returns a list with the rows of each keyword (None if its search or a details request for one of its
+        videos failed, so the keyword is not recorded as processed and the next run fetches it again).
+        """
+        search_results = list(executor.map(lambda job: self.search_video_ids(job[0], job[2]), batch))
+        
+        # Global deduplication of the IDs across the keywords of the batch and earlier batches
+        missing_ids = []
+        for video_ids in search_results:
+            for video_id in video_ids or []:
+                self.metrics['search_ids'] += 1
+                if video_id not in self.video_details and video_id not in missing_ids:
+                    missing_ids.append(video_id)
+        self.metrics['details_ids'] += len(missing_ids)
+        self.metrics['ids_saved_by_dedup'] = self.metrics['search_ids'] - self.metrics['details_ids']
+        
+        # Packed details requests
+        chunks = [missing_ids[i:i + IDS_PER_DETAILS_REQUEST] for i in range(0, len(missing_ids), IDS_PER_DETAILS_REQUEST)]
+        self.metrics['details_requests'] += len(chunks)
+        failed_ids = set()
+        for chunk, details in zip(chunks, executor.map(self.fetch_video_details, chunks)):
+            if details is None:
+                failed_ids.update(chunk)
+            else:
+                self.video_details.update(details)
+        
+        # Fan the details back out to every keyword that found the video
+        batch_rows = []
+        for (keyword, category, pages), video_ids in zip(batch, search_results):
+            if not video_ids:
+                batch_rows.append(None)
+                continue
+            if failed_ids.intersection(video_ids):
+                logging.warning(f"Details of {len(failed_ids.intersection(video_ids))} videos of '{keyword}' could not be fetched, it is fetched again in the next run")
+                batch_rows.append(None)
+                continue
+            rows = [self.video_row(keyword, category, self.video_details[video_id])
+                    for video_id in video_ids if video_id in self.video_details]
+            batch_rows.append([row for row in rows if row is not None])
+        return batch_rows
+
+    def process_keywords(self):
+        """
+        Reads keywords from keywords.csv, processes each keyword to fetch corresponding video data, and 
+        saves the data to a CSV file in the specified data directory. 
+        New rows are appended per keyword as segments and merged into all_videos_data.csv once at the end of the run.
+        It also updates the catalog to keep track of processed keywords and ensures the script operates within the API quota limits.
+        """
         try:
-            # Search for videos
-            logging.info(f"Searching videos for keyword: {keyword}")
-            search_response = self.youtube.search().list(
-                q=keyword,
-                part='id',
-                type='video',
-                maxResults=VIDEOS_PER_KEYWORD,
-                order='relevance'
-            ).execute()
+            keywords_df = pd.read_csv('keywords.csv')
+            run_id = self.catalog.start_run('keywords')
+            keywords_fetched = 0
             
-            self.quota_used += QUOTA['search']
+            # Set up the append-only sink; segments left over by a crashed run are merged first
+            sink = VideoSink(DATA_DIR)
+            sink.compact()
             
-            # Extract video IDs 
-            video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
+            # Schedule the keywords that need fetching: first the unprocessed ones in keywords.csv order,
+            # then the ones whose data is older than STALE_AFTER_DAYS, oldest first
+            processed_keywords = self.catalog.processed_keywords()
+            candidates = []
+            for _, row in keywords_df.iterrows():
+                priority = self.keyword_priority(row['keyword'], processed_keywords)
+                if priority is not None:
+                    candidates.append((priority, row))
+            candidates.sort(key=lambda candidate: candidate[0])
             
-            if not video_ids:
-                logging.warning(f"No videos found for keyword: {keyword}")
-                return None
+            scheduled = []
+            for _, row in candidates:
+                pages = self.search_pages(row)
+                # Check quota before proceeding; a cheaper keyword further down may still fit the budget
+                if not self.reserve_quota(keyword_quota(pages)):
+                    continue
+                scheduled.append((row['keyword'], row['group'], pages))
+            if len(scheduled) < len(candidates):
+                logging.warning(f"Daily quota budget fully reserved, {len(candidates) - len(scheduled)} keywords wait for the next run")
             
-            # Get detailed information about each video
-            videos_response = self.youtube.videos().list(
-                id=','.join(video_ids),
-                part='snippet,statistics,contentDetails'
-            ).execute()
+            # Fetch the scheduled keywords in batches with a bounded pool of workers.
+            # Results come back in submission order, so the data file and the catalog
+            # are written in exactly the same order as in a serial run.
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for start in range(0, len(scheduled), KEYWORDS_PER_BATCH):
+                    batch = scheduled[start:start + KEYWORDS_PER_BATCH]
+                    for (keyword, category, pages), videos_data in zip(batch, self.fetch_keyword_batch(batch, executor)):
+                        if not videos_data:
+                            continue
+                        
+                        # Only the new rows are written, the progress is recorded after the segment is complete
+                        sink.append(videos_data)
+                        
+                        # Update progress: the rows, the keyword and the history in one transaction
+                        self.catalog.record_keyword(keyword, category, videos_data, pages, run_id)
+                        keywords_fetched += 1
             
-            self.quota_used += len(video_ids) * QUOTA['videos']
+            self.catalog.finish_run(run_id, self.quota_used, keywords_fetched=keywords_fetched)
+            logging.info(f"Quota used in this run: {self.quota_used} units")
+            logging.info(
+                f"Video IDs found: {self.metrics['search_ids']}, details fetched: {self.metrics['details_ids']} "
+                f"in {self.metrics['details_requests']} requests, saved by deduplication: {self.metrics['ids_saved_by_dedup']}"
+            )
+            if self.cache is not None:
+                logging.info(
+                    f"API response cache: {self.cache.stats['hits']} hits, {self.cache.stats['misses']} misses, "
+                    f"{self.cache.stats['evictions']} evictions"
+                )
             
-            # Process each video's data
-            videos_data = []
-            for video in videos_response.get('items', []):
-                try:
-                    duration = isodate.parse_duration(video['contentDetails']['duration']).total_seconds()
-                    
-                    video_data = {
-                        'keyword': keyword,
-                        'category': category,
-                        'video_id': video['id'],
-                        'title': video['snippet']['title'],
-                        'published_date': video['snippet']['publishedAt'],
-                        'duration_seconds': duration,
-                        'view_count': int(video['statistics'].get('viewCount', 0)),
-                        'like_count': int(video['statistics'].get('likeCount', 0)),
-                        'comment_count': int(video['statistics'].get('commentCount', 0))
-                    }
-                    videos_data.append(video_data)
-                except Exception as e:
-                    logging.error(f"Error processing video {video.get('id', 'unknown')}: {str(e)}")
-                    continue
+            # Merge this run's segments into all_videos_data.csv
+            all_data = sink.compact()
             
-            return videos_data
+            # The statistics of the fetched videos are the first point of their time series,
+            # dated with the time of the response they came with (which can be an earlier one from the cache)
+            append_snapshots(pd.DataFrame(
+                [self.snapshot_row(video, self.details_fetched_at[video_id])
+                 for video_id, video in self.video_details.items() if 'statistics' in video],
+                columns=['video_id', 'fetched_at', 'view_count', 'like_count', 'comment_count']
+            ))
+            
+            # Transform the new and changed rows into cleaned_videos_data and videos_with_relevance
+            self.update_analysis_data()
+            return all_data
             
         except Exception as e:
-            logging.error(f"Error fetching videos for keyword '{keyword}': {str(e)}")
-            return None
+            logging.error(f"Error in process_keywords: {str(e)}")
+            raise
 
-    def process_keywords(self):
+    def update_analysis_data(self):
         """
-        Reads keywords from keywords.csv, processes each keyword to fetch corresponding video data, and 
-        saves the data to a CSV file in the specified data directory. 
-        It also updates the state to keep track of processed keywords and ensures the script operates within the API quota limits.
+        Runs the transform pipeline (pipeline.py) over the rows that changed in all_videos_data.csv,
+        which also adds the new titles to the title search and semantic indexes.
+        A failure is logged but does not fail the run: the fetched data is already stored and
+        the next run (or python pipeline.py) picks the rows up again.
         """
         try:
-            keywords_df = pd.read_csv('keywords.csv')
-            
-            # Set up or load existing data file
-            main_data_file = os.path.join(DATA_DIR, 'all_videos_data.csv')
-            all_data = pd.DataFrame()
-            if os.path.exists(main_data_file):
-                all_data = pd.read_csv(main_data_file)
+            results = run_pipeline()
+            logging.info(f"Pipeline rows transformed: {results}")
+        except Exception as e:
+            logging.error(f"Pipeline failed, run 'python pipeline.py' to retry: {str(e)}")
+
+    def seed_snapshots(self, videos):
+        """
+        Stores the counts in all_videos_data.csv as the first snapshots, dated with the time their keyword was
+        processed (the counts were fetched then). Used once, when the snapshot store is still empty.
+        """
+        processed = {
+            keyword: pd.Timestamp(entry['processed_date']).floor('s')
+            for keyword, entry in self.catalog.processed_keywords().items()
+        }
+        seed = videos.assign(fetched_at=videos['keyword'].astype(str).map(processed))
+        seed = seed.dropna(subset=['fetched_at']).sort_values('fetched_at')
+        seed = seed.drop_duplicates(subset=['video_id'], keep='first')
+        append_snapshots(seed.assign(video_id=seed['video_id'].astype(str)))
+        logging.info(f"Seeded the snapshot store with {len(seed)} videos")
+
+    def refresh_order(self, videos, latest, now):
+        """
+        Returns the IDs of the videos whose statistics should be refreshed, most urgent first.
+        Videos refreshed less than REFRESH_MIN_AGE_HOURS ago are left out. The urgency is the staleness of the
+        last snapshot (in days) weighted by the velocity of the video (log of its views per day between its
+        snapshots, or since publication if it has only one), so fast-growing videos that were not refreshed
+        for a while come first.
+        """
+        videos = videos.drop_duplicates(subset=['video_id']).assign(video_id=lambda df: df['video_id'].astype(str))
+        videos = videos.set_index('video_id')
+        last_fetched = latest['fetched_at'].reindex(videos.index).fillna(pd.Timestamp('1970-01-01'))
+        views = latest['view_count'].reindex(videos.index).fillna(videos['view_count'].astype('int64'))
+        staleness_days = (now - last_fetched).dt.total_seconds() / 86400
+        age_days = ((now - videos['published_date']).dt.total_seconds() / 86400).clip(lower=1)
+        velocity = (views / age_days).clip(lower=0)
+        measured = video_velocity()['views_per_day'].clip(lower=0)
+        velocity.update(measured.reindex(velocity.index).dropna())
+        urgency = staleness_days * (1 + np.log1p(velocity))
+        urgency = urgency[staleness_days * 24 >= REFRESH_MIN_AGE_HOURS]
+        return urgency.sort_values(ascending=False, kind='stable').index.tolist()
+
+    def refresh_statistics(self):
+        """
+        Statistics refresh mode: polls only the statistics of videos that were already fetched, in batches of
+        IDS_PER_DETAILS_REQUEST IDs at QUOTA['statistics'] per batch (instead of 100 units per search), in the order
+        of refresh_order() until the daily budget is used. The counts are stored as snapshots (a time series per video)
+        and the latest counts replace the old ones in all_videos_data.csv. Returns the number of refreshed videos.
+        """
+        try:
+            run_id = self.catalog.start_run('refresh')
+            videos = read_videos('all_videos_data', columns=['keyword', 'video_id', 'published_date', 'view_count'])
+            latest = latest_snapshots()
+            if latest.empty:
+                self.seed_snapshots(read_videos('all_videos_data', columns=['keyword', 'video_id', 'view_count', 'like_count', 'comment_count']))
+                latest = latest_snapshots()
             
-            # Process each keyword
-            for _, row in keywords_df.iterrows():
-                keyword = row['keyword']
-                category = row['group']
-                
-                # Skip if already processed 
-                if keyword in self.state['processed_keywords']:
-                    continue
-                
-                # Check quota before proceeding
-                if not self.can_make_request(QUOTA['search']):
+            now = pd.Timestamp(datetime.utcnow())
+            video_ids = self.refresh_order(videos, latest, now)
+            batches = [video_ids[i:i + IDS_PER_DETAILS_REQUEST] for i in range(0, len(video_ids), IDS_PER_DETAILS_REQUEST)]
+            scheduled = []
+            for batch in batches:
+                if not self.reserve_quota(QUOTA['statistics']):
+                    logging.warning(f"Daily quota budget fully reserved, {len(batches) - len(scheduled)} batches wait for the next run")
                     break
-                
-                # Fetch and save data
-                videos_data = self.fetch_videos_for_keyword(keyword, category)
-                if videos_data:
-                    new_data = pd.DataFrame(videos_data)
-                    all_data = pd.concat([all_data, new_data], ignore_index=True)
-                    all_data.to_csv(main_data_file, index=False)
-                    
-                    # Update progress
-                    self.state['processed_keywords'][keyword] = {
-                        'processed_date': datetime.now().isoformat(),
-                        'videos_count': len(videos_data)
-                    }
-                    self.save_state()
-                
-                # Wait between requests
-                time.sleep(1)
+                scheduled.append(batch)
+            logging.info(f"Refreshing the statistics of {sum(len(batch) for batch in scheduled)} of {len(video_ids)} stale videos")
             
-            return all_data
+            refreshed = []
+            pending = []
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for number, rows in enumerate(executor.map(self.fetch_statistics, scheduled), start=1):
+                    pending.extend(rows or [])
+                    if number % REFRESH_BATCHES_PER_WRITE == 0 or number == len(scheduled):
+                        append_snapshots(pd.DataFrame(pending, columns=['video_id', 'fetched_at', 'view_count', 'like_count', 'comment_count']))
+                        refreshed.extend(pending)
+                        pending = []
+            compact_partitions()
             
+            if refreshed:
+                statistics = pd.DataFrame(refreshed).drop_duplicates(subset=['video_id'], keep='last').set_index('video_id')
+                VideoSink(DATA_DIR).update_statistics(statistics)
+                self.catalog.update_statistics(statistics)
+            self.catalog.set_meta('last_refresh', datetime.now().isoformat())
+            self.catalog.finish_run(run_id, self.quota_used, videos_refreshed=len(refreshed))
+            logging.info(f"Refreshed the statistics of {len(refreshed)} videos, quota used in this run: {self.quota_used} units")
+            if refreshed:
+                self.update_analysis_data()
+            return len(refreshed)
+        
         except Exception as e:
-            logging.error(f"Error in process_keywords: {str(e)}")
+            logging.error(f"Error in refresh_statistics: {str(e)}")
             raise
 
 def main():
@@ -243,9 +709,23 @@ def main():
     - Calling process_keywords() to fetch and save video data.
     - Logging the completion of data collection and the total number of videos collected.
     """
+    parser = argparse.ArgumentParser(description="Fetch YouTube video data for the keywords in keywords.csv")
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS,
+                        help="number of keywords fetched concurrently (1 = serial)")
+    parser.add_argument('--refresh', action='store_true',
+                        help="only refresh the statistics of the videos that were already fetched")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="always call the API instead of using the on-disk response cache")
+    parser.add_argument('--replay', action='store_true',
+                        help="answer all API calls from the response cache without using the network")
+    args = parser.parse_args()
     try:
         logging.info("Starting YouTube data fetching process")
-        fetcher = YouTubeDataFetcher()
+        fetcher = YouTubeDataFetcher(max_workers=args.workers, use_cache=not args.no_cache, replay_only=args.replay)
+        if args.refresh:
+            refreshed = fetcher.refresh_statistics()
+            logging.info(f"Statistics refresh complete! Videos refreshed: {refreshed}")
+            return
         data = fetcher.process_keywords()
         logging.info("Data collection complete!")
         logging.info(f"Total videos collected: {len(data) if data is not None else 0}")